@@ -5,27 +5,69 @@ from .algebraic_root import (
     RationalInterval,
     algebraic_root,
 )
-from .integer import Z_MINUS_ONE, Z_ONE, Z_ZERO, Integer, integer, n2z
-from .natural_number import N_ONE, N_ZERO, NaturalNumber, natural_number, successor
+from .hereditarily_finite import HereditarilyFiniteSet
+from .integer import (
+    Z_MINUS_ONE,
+    Z_ONE,
+    Z_ZERO,
+    Integer,
+    NormalizationPolicy,
+    config_normalization,
+    extended_gcd,
+    gcd,
+    integer,
+    lcm,
+    n2z,
+    normalization,
+    normalization_policy,
+)
+from .natural_number import (
+    B_ONE,
+    B_ZERO,
+    N_ONE,
+    N_ZERO,
+    BinaryNatural,
+    Evaluation,
+    InterningStats,
+    NaturalNumber,
+    NaturalRange,
+    binary_natural,
+    config_interning,
+    evaluation,
+    interning_stats,
+    natural_number,
+    successor,
+)
 from .polynomial import (
     P_ONE,
     P_ZERO,
     Polynomial,
+    PolynomialCacheStats,
+    clear_polynomial_cache,
+    config_polynomial_cache,
     count_real_roots,
     n2p,
     polynomial,
+    polynomial_cache_stats,
     r2p,
     sign_variations,
     sturm_sequence,
+    subresultant_sturm_sequence,
     z2p,
 )
 from .rational import (
     Q_MINUS_ONE,
     Q_ONE,
     Q_ZERO,
+    AutoReductionStats,
+    CalkinWilf,
+    ExpansionDigit,
     Rational,
+    auto_reduction_stats,
+    config_auto_reduction,
     n2r,
     rational,
+    simplest_between,
     z2r,
 )
 from .utils import SUPPORTED_LOCALES, config_log
@@ -34,21 +76,45 @@ __all__ = [
     "NaturalNumber",
     "natural_number",
     "successor",
+    "NaturalRange",
     "N_ZERO",
     "N_ONE",
+    "Evaluation",
+    "evaluation",
+    "config_interning",
+    "interning_stats",
+    "InterningStats",
+    "BinaryNatural",
+    "binary_natural",
+    "B_ZERO",
+    "B_ONE",
+    "HereditarilyFiniteSet",
     "Integer",
     "integer",
     "n2z",
     "Z_ZERO",
     "Z_ONE",
     "Z_MINUS_ONE",
+    "gcd",
+    "lcm",
+    "extended_gcd",
+    "config_normalization",
+    "normalization",
+    "normalization_policy",
+    "NormalizationPolicy",
     "Rational",
     "rational",
     "n2r",
     "z2r",
+    "simplest_between",
     "Q_ZERO",
     "Q_ONE",
     "Q_MINUS_ONE",
+    "config_auto_reduction",
+    "auto_reduction_stats",
+    "AutoReductionStats",
+    "ExpansionDigit",
+    "CalkinWilf",
     "Polynomial",
     "polynomial",
     "n2p",
@@ -56,7 +122,12 @@ __all__ = [
     "r2p",
     "P_ZERO",
     "P_ONE",
+    "config_polynomial_cache",
+    "clear_polynomial_cache",
+    "polynomial_cache_stats",
+    "PolynomialCacheStats",
     "sturm_sequence",
+    "subresultant_sturm_sequence",
     "sign_variations",
     "count_real_roots",
     "RationalInterval",
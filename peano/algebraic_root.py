@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from fractions import Fraction
+from typing import Literal
 
 from .natural_number import NaturalNumber
 from .polynomial import Polynomial, count_real_roots
-from .rational import Rational, rational
+from .rational import Rational, rational, simplest_between
 from .utils import LogMessage, log, translate
 
+SplitMode = Literal["midpoint", "simplest"]
+
 
 @dataclass(frozen=True, slots=True)
 class RationalInterval:
@@ -39,6 +42,20 @@ class RationalInterval:
     def midpoint(self) -> Rational:
         return _from_fraction((_as_fraction(self.lower) + _as_fraction(self.upper)) / 2)
 
+    @property
+    def simplest(self) -> Rational:
+        """The simplest rational in the middle half of the interval.
+
+        Splitting there keeps endpoint denominators close to the reciprocal
+        of the width, while each step still removes at least a quarter.
+        """
+
+        lower, upper = _as_fraction(self.lower), _as_fraction(self.upper)
+        quarter = (upper - lower) / 4
+        return simplest_between(
+            _from_fraction(lower + quarter), _from_fraction(upper - quarter)
+        )
+
     @property
     def is_point(self) -> bool:
         return _as_fraction(self.lower) == _as_fraction(self.upper)
@@ -91,26 +108,38 @@ class AlgebraicRoot:
                 f"(found {number_of_roots})"
             )
 
-    def approximate(self, steps: int | NaturalNumber) -> RationalInterval:
-        """Bisect ``steps`` times and return a closed interval containing the root."""
+    def approximate(
+        self, steps: int | NaturalNumber, split: SplitMode = "midpoint"
+    ) -> RationalInterval:
+        """Bisect ``steps`` times and return a closed interval containing the root.
+
+        ``split="midpoint"`` halves the interval, which doubles endpoint
+        denominators on every step. ``split="simplest"`` cuts at
+        :attr:`RationalInterval.simplest` instead, keeping the endpoints
+        small for ``sign_at`` at the cost of a slower shrink.
+        """
 
         count = _step_count(steps)
+        _check_split(split)
         interval = self.interval
         for _ in range(count):
             if interval.is_point:
                 break
-            interval = _bisect(self.polynomial, interval)
+            interval = _bisect(self.polynomial, interval, split)
         return interval
 
-    def trace(self, steps: int | NaturalNumber) -> tuple[RationalInterval, ...]:
+    def trace(
+        self, steps: int | NaturalNumber, split: SplitMode = "midpoint"
+    ) -> tuple[RationalInterval, ...]:
         """Return every bisection interval, including the initial interval."""
 
         count = _step_count(steps)
+        _check_split(split)
         intervals = [self.interval]
         for _ in range(count):
             if intervals[-1].is_point:
                 break
-            intervals.append(_bisect(self.polynomial, intervals[-1]))
+            intervals.append(_bisect(self.polynomial, intervals[-1], split))
         return tuple(intervals)
 
     def __repr__(self) -> str:
@@ -124,8 +153,9 @@ class AlgebraicRoot:
 def _bisect(
     polynomial_value: Polynomial,
     interval: RationalInterval,
+    split: SplitMode = "midpoint",
 ) -> tuple[RationalInterval, LogMessage]:
-    midpoint = interval.midpoint
+    midpoint = interval.midpoint if split == "midpoint" else interval.simplest
     midpoint_sign = polynomial_value.sign_at(midpoint)
 
     if midpoint_sign == 0:
@@ -173,6 +203,11 @@ def _step_count(value: int | NaturalNumber) -> int:
     return value
 
 
+def _check_split(split: object) -> None:
+    if split not in ("midpoint", "simplest"):
+        raise ValueError("split must be 'midpoint' or 'simplest'")
+
+
 def _as_fraction(value: Rational) -> Fraction:
     return Fraction(int(value.p), int(value.q))
 
@@ -0,0 +1,160 @@
+"""Encode hereditarily finite sets as natural numbers (Ackermann coding)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, cast
+
+from .natural_number import NaturalNumber
+
+# The code of ordinal 6 would have 2**2059 + 2059 bits.
+_MAX_ORDINAL = 5
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class HereditarilyFiniteSet:
+    """A hereditarily finite set stored as its Ackermann code.
+
+    The code of a set is the sum of ``2 ** code(x)`` over its members ``x``,
+    so every non-negative integer codes exactly one set and ``0`` codes the
+    empty set. Membership tests one bit, and union, intersection, difference
+    and inclusion are bitwise operations on the codes. Operators follow
+    ``frozenset``: ``|``, ``&``, ``-``, ``^`` and ``<=`` for subsets.
+    """
+
+    code: int
+
+    def __post_init__(self) -> None:
+        if isinstance(self.code, bool) or not isinstance(self.code, int):
+            raise TypeError("code must be an int")
+        if self.code < 0:
+            raise ValueError("code must be non-negative")
+
+    @classmethod
+    def from_frozenset(cls, value: frozenset[object]) -> HereditarilyFiniteSet:
+        """Encode nested frozensets such as ``NaturalNumber.set_repr()``."""
+
+        return cls(_encode(value, {}))
+
+    @classmethod
+    def ordinal(cls, value: NaturalNumber | int) -> HereditarilyFiniteSet:
+        """Return the von Neumann ordinal :math:`n = n - 1 ∪ \\{n - 1\\}`.
+
+        Codes grow as a tower of powers of two, so only ordinals up to 5 can
+        be represented.
+        """
+
+        depth = int(value) if isinstance(value, NaturalNumber) else value
+        if isinstance(depth, bool) or not isinstance(depth, int):
+            raise TypeError("ordinal expects a NaturalNumber or int")
+        if depth < 0:
+            raise ValueError("ordinals are non-negative")
+        if depth > _MAX_ORDINAL:
+            raise OverflowError(f"the code of ordinal {depth} is too large to store")
+        code = 0
+        for _ in range(depth):
+            code |= 1 << code
+        return cls(code)
+
+    def to_frozenset(self) -> frozenset[object]:
+        """Decode into nested frozensets, sharing equal members."""
+
+        return _decode(self.code, {})
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, HereditarilyFiniteSet):
+            return False
+        return bool(self.code >> element.code & 1)
+
+    def __iter__(self) -> Iterator[HereditarilyFiniteSet]:
+        code = self.code
+        while code:
+            lowest = code & -code
+            yield HereditarilyFiniteSet(lowest.bit_length() - 1)
+            code ^= lowest
+
+    def __len__(self) -> int:
+        return bin(self.code).count("1")
+
+    def __bool__(self) -> bool:
+        return self.code != 0
+
+    def adjoin(self, element: HereditarilyFiniteSet) -> HereditarilyFiniteSet:
+        """Return ``self ∪ {element}``."""
+
+        if not isinstance(element, HereditarilyFiniteSet):
+            raise TypeError("adjoin expects a HereditarilyFiniteSet")
+        return HereditarilyFiniteSet(self.code | 1 << element.code)
+
+    def issubset(self, other: HereditarilyFiniteSet) -> bool:
+        if not isinstance(other, HereditarilyFiniteSet):
+            raise TypeError("issubset expects a HereditarilyFiniteSet")
+        return self.code & ~other.code == 0
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(bool, NotImplemented)
+        return self.code & ~other.code == 0
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(bool, NotImplemented)
+        return self.code != other.code and self.code & ~other.code == 0
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(bool, NotImplemented)
+        return other.code & ~self.code == 0
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(bool, NotImplemented)
+        return self.code != other.code and other.code & ~self.code == 0
+
+    def __or__(self, other: object) -> HereditarilyFiniteSet:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(HereditarilyFiniteSet, NotImplemented)
+        return HereditarilyFiniteSet(self.code | other.code)
+
+    def __and__(self, other: object) -> HereditarilyFiniteSet:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(HereditarilyFiniteSet, NotImplemented)
+        return HereditarilyFiniteSet(self.code & other.code)
+
+    def __sub__(self, other: object) -> HereditarilyFiniteSet:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(HereditarilyFiniteSet, NotImplemented)
+        return HereditarilyFiniteSet(self.code & ~other.code)
+
+    def __xor__(self, other: object) -> HereditarilyFiniteSet:
+        if not isinstance(other, HereditarilyFiniteSet):
+            return cast(HereditarilyFiniteSet, NotImplemented)
+        return HereditarilyFiniteSet(self.code ^ other.code)
+
+    def __repr__(self) -> str:
+        return f"<HF({self.code})>"
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(str(member) for member in self) + "}"
+
+
+def _encode(value: object, codes: dict[frozenset[object], int]) -> int:
+    if not isinstance(value, frozenset):
+        raise TypeError("hereditarily finite sets are built from frozensets")
+    code = codes.get(value)
+    if code is None:
+        code = 0
+        for member in value:
+            code |= 1 << _encode(member, codes)
+        codes[value] = code
+    return code
+
+
+def _decode(code: int, sets: dict[int, frozenset[object]]) -> frozenset[object]:
+    value = sets.get(code)
+    if value is None:
+        value = frozenset(
+            _decode(member.code, sets) for member in HereditarilyFiniteSet(code)
+        )
+        sets[code] = value
+    return value
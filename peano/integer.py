@@ -2,27 +2,41 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import total_ordering
-from typing import TYPE_CHECKING, cast
-
-from .natural_number import N_ONE, N_ZERO, NaturalNumber, natural_number
-from .utils import LogMessage, log
+from typing import TYPE_CHECKING, Iterator, Literal, cast
+
+from .natural_number import (
+    N_ONE,
+    N_TWO,
+    N_ZERO,
+    BinaryNatural,
+    NaturalNumber,
+    _coerce_natural,
+    natural_number,
+)
+from .utils import LogMessage, emit, log, translate
 
 if TYPE_CHECKING:
     from .rational import Rational
 
 
-@total_ordering
-@dataclass(frozen=True, slots=True, eq=False, repr=False)
+@dataclass(frozen=True, eq=False, repr=False)
 class Integer:
     """Represent the difference ``a - b`` by a pair of natural numbers.
 
     ``(a, b) ~ (c, d)`` is defined by ``a + d = b + c``. Representations are
     deliberately not normalized automatically, so equivalent representatives
-    remain observable.
+    remain observable. :func:`config_normalization` can opt arithmetic
+    results into the normal form.
+
+    The sign, the normal form and the hash are computed on first use and
+    cached on the immutable instance.
     """
 
+    # ``a`` and ``b`` are the dataclass fields; the caches stay private.
+    __slots__ = ("a", "b", "_sign", "_normal", "_hash")
+
     a: NaturalNumber
     b: NaturalNumber
 
@@ -31,6 +45,10 @@ class Integer:
             self.b, NaturalNumber
         ):
             raise TypeError("Integer.a and Integer.b must be NaturalNumber values")
+        _clear_caches(self)
+
+    def __reduce__(self) -> tuple[type[Integer], tuple[NaturalNumber, NaturalNumber]]:
+        return Integer, (self.a, self.b)
 
     def __repr__(self) -> str:
         return f"<Z({int(self.a)},{int(self.b)})>"
@@ -42,9 +60,17 @@ class Integer:
         return int(self.a) - int(self.b)
 
     def __abs__(self) -> NaturalNumber:
-        if self.a >= self.b:
-            return self.a - self.b
-        return self.b - self.a
+        normal = self.normalize()
+        return normal.a if normal.a else normal.b
+
+    def _signum(self) -> int:
+        """Return the cached sign ``-1``, ``0`` or ``1``."""
+
+        sign = self._sign
+        if sign is None:
+            sign = self.a.compare(self.b)
+            object.__setattr__(self, "_sign", sign)
+        return sign
 
     @log(log_level=11)
     def __eq__(self, other: object) -> tuple[bool, LogMessage]:
@@ -54,51 +80,43 @@ class Integer:
                 cast(bool, NotImplemented),
                 lambda: f"{self!r} == {other!r} = NotImplemented",
             )
-        result = self.a + converted.b == self.b + converted.a
-        return (
-            result,
-            lambda: (
-                f"{self!r} == {converted!r} ⇔ "
-                f"{self.a!r} + {converted.b!r} == "
-                f"{self.b!r} + {converted.a!r}"
-            ),
-        )
+        order, step = _compare_components(self, converted)
+        result = order == 0
+        return result, lambda: f"{self!r} == {converted!r} ⇔ {step()} == 0"
 
     @log(log_level=12)
-    def __lt__(self, other: object) -> tuple[bool, LogMessage]:
+    def compare(self, other: Integer | NaturalNumber) -> tuple[int, LogMessage]:
+        """Return ``-1``, ``0`` or ``1`` as ``self`` is below, at or above ``other``."""
+
         converted = _coerce_integer(other)
         if converted is None:
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} < {other!r} = NotImplemented",
-            )
-        result = self.a + converted.b < self.b + converted.a
-        return (
-            result,
-            lambda: (
-                f"{self!r} < {converted!r} ⇔ "
-                f"{self.a!r} + {converted.b!r} < "
-                f"{self.b!r} + {converted.a!r}"
-            ),
-        )
+            raise TypeError(f"{other!r} is not an Integer")
+        result, step = _compare_components(self, converted)
+        return result, lambda: f"compare({self!r}, {converted!r}) = {step()} = {result}"
 
-    @log(log_level=12)
-    def __le__(self, other: object) -> tuple[bool, LogMessage]:
+    def __lt__(self, other: object) -> bool:
         converted = _coerce_integer(other)
         if converted is None:
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} <= {other!r} = NotImplemented",
-            )
-        result = self.a + converted.b <= self.b + converted.a
-        return (
-            result,
-            lambda: (
-                f"{self!r} <= {converted!r} ⇔ "
-                f"{self.a!r} + {converted.b!r} <= "
-                f"{self.b!r} + {converted.a!r}"
-            ),
-        )
+            return cast(bool, NotImplemented)
+        return self.compare(converted) < 0
+
+    def __le__(self, other: object) -> bool:
+        converted = _coerce_integer(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) <= 0
+
+    def __gt__(self, other: object) -> bool:
+        converted = _coerce_integer(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) > 0
+
+    def __ge__(self, other: object) -> bool:
+        converted = _coerce_integer(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) >= 0
 
     @log(log_level=14)
     def __add__(self, other: object) -> tuple[Integer, LogMessage]:
@@ -108,7 +126,7 @@ class Integer:
                 cast(Integer, NotImplemented),
                 lambda: f"{self!r} + {other!r} = NotImplemented",
             )
-        result = Integer(self.a + converted.a, self.b + converted.b)
+        result = _normalized(_new_integer(self.a + converted.a, self.b + converted.b))
         return (
             result,
             lambda: (
@@ -124,7 +142,7 @@ class Integer:
     @log(log_level=14)
     def __neg__(self) -> tuple[Integer, LogMessage]:
         return (
-            Integer(self.b, self.a),
+            _new_integer(self.b, self.a),
             lambda: f"-{self!r} = ({self.b!r}, {self.a!r})",
         )
 
@@ -155,9 +173,11 @@ class Integer:
                 cast(Integer, NotImplemented),
                 lambda: f"{self!r} * {other!r} = NotImplemented",
             )
-        result = Integer(
-            self.a * converted.a + self.b * converted.b,
-            self.a * converted.b + self.b * converted.a,
+        result = _normalized(
+            _new_integer(
+                self.a * converted.a + self.b * converted.b,
+                self.a * converted.b + self.b * converted.a,
+            )
         )
         return (
             result,
@@ -197,19 +217,19 @@ class Integer:
             raise ZeroDivisionError("division by zero")
 
         quotient_magnitude, remainder_magnitude = divmod(abs(self), abs(divisor))
-        same_sign = (self < Z_ZERO) == (divisor < Z_ZERO)
+        same_sign = (self._signum() < 0) == (divisor._signum() < 0)
 
         if same_sign:
-            quotient = Integer(quotient_magnitude, N_ZERO)
-            remainder = Integer(remainder_magnitude, N_ZERO)
+            quotient = _new_integer(quotient_magnitude, N_ZERO)
+            remainder = _new_integer(remainder_magnitude, N_ZERO)
         elif not remainder_magnitude:
-            quotient = Integer(N_ZERO, quotient_magnitude)
+            quotient = _new_integer(N_ZERO, quotient_magnitude)
             remainder = Z_ZERO
         else:
-            quotient = Integer(N_ZERO, quotient_magnitude + N_ONE)
-            remainder = Integer(abs(divisor) - remainder_magnitude, N_ZERO)
+            quotient = _new_integer(N_ZERO, quotient_magnitude + N_ONE)
+            remainder = _new_integer(abs(divisor) - remainder_magnitude, N_ZERO)
 
-        if divisor < Z_ZERO:
+        if divisor._signum() < 0:
             remainder = -remainder
         return quotient, remainder
 
@@ -273,26 +293,49 @@ class Integer:
 
     @log(log_level=16)
     def __pow__(self, exponent: object) -> tuple[Integer, LogMessage]:
-        if not isinstance(exponent, NaturalNumber):
+        converted = _coerce_natural(exponent)
+        if converted is None:
             return (
                 cast(Integer, NotImplemented),
                 lambda: f"{self!r} ** {exponent!r} = NotImplemented",
             )
-        if exponent == N_ZERO:
-            return Z_ONE, lambda: f"{self!r} ** {exponent!r} = {Z_ONE!r}"
+        if not converted:
+            return (
+                Z_ONE,
+                lambda: (
+                    f"{translate('power.base')} {self!r} ** {converted!r} -> {Z_ONE!r}"
+                ),
+            )
+        # Square and multiply along the binary digits of the Peano exponent.
+        half, odd = divmod(converted, N_TWO)
+        root = self**half
+        square = root * root
+        if not odd:
+            return (
+                square,
+                lambda: (
+                    f"{translate('power.even')} "
+                    f"{self!r} ** {converted!r} -> ({self!r} ** {half!r})²"
+                ),
+            )
         return (
-            (self ** (exponent - N_ONE)) * self,
+            square * self,
             lambda: (
-                f"{self!r} ** {exponent!r} = "
-                f"({self!r} ** ({exponent!r} - {N_ONE!r})) * {self!r}"
+                f"{translate('power.odd')} "
+                f"{self!r} ** {converted!r} -> "
+                f"({self!r} ** {half!r})² * {self!r}"
             ),
         )
 
     def __bool__(self) -> bool:
-        return self.a != self.b
+        return self._signum() != 0
 
     def __hash__(self) -> int:
-        return hash(int(self))
+        value = self._hash
+        if value is None:
+            value = hash(int(self))
+            object.__setattr__(self, "_hash", value)
+        return value
 
     def __pos__(self) -> Integer:
         return self
@@ -300,9 +343,193 @@ class Integer:
     def normalize(self) -> Integer:
         """Return the representative ``(n, 0)`` or ``(0, n)``."""
 
-        if self.a >= self.b:
-            return Integer(self.a - self.b, N_ZERO)
-        return Integer(N_ZERO, self.b - self.a)
+        if not (self.a and self.b):
+            return self
+        normal = self._normal
+        if normal is None:
+            if self._signum() >= 0:
+                normal = _new_integer(self.a - self.b, N_ZERO)
+            else:
+                normal = _new_integer(N_ZERO, self.b - self.a)
+            object.__setattr__(normal, "_sign", self._sign)
+            object.__setattr__(self, "_normal", normal)
+        return normal
+
+
+NormalizationMode = Literal["never", "always", "threshold"]
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizationPolicy:
+    """When ``Integer`` arithmetic rewrites results as ``(n, 0)`` or ``(0, n)``.
+
+    ``"never"`` keeps the representatives that the formulas produce,
+    ``"always"`` normalizes every sum, difference and product, and
+    ``"threshold"`` normalizes once a component exceeds ``threshold``.
+    Rational and polynomial arithmetic inherit the policy through their
+    integer operations.
+    """
+
+    mode: NormalizationMode = "never"
+    threshold: int | None = None
+
+
+_normalization = NormalizationPolicy()
+
+
+def config_normalization(
+    mode: NormalizationMode = "never", threshold: int | None = None
+) -> None:
+    """Choose the normalization policy for integer arithmetic results."""
+
+    global _normalization
+    _normalization = _make_policy(mode, threshold)
+
+
+def normalization_policy() -> NormalizationPolicy:
+    """Return the active normalization policy."""
+
+    return _normalization
+
+
+@contextmanager
+def normalization(
+    mode: NormalizationMode, threshold: int | None = None
+) -> Iterator[NormalizationPolicy]:
+    """Apply a normalization policy inside a ``with`` block only."""
+
+    global _normalization
+    previous = _normalization
+    _normalization = _make_policy(mode, threshold)
+    try:
+        yield _normalization
+    finally:
+        _normalization = previous
+
+
+def _make_policy(mode: str, threshold: int | None) -> NormalizationPolicy:
+    if mode not in ("never", "always", "threshold"):
+        raise ValueError("mode must be 'never', 'always' or 'threshold'")
+    if mode == "threshold":
+        if isinstance(threshold, bool) or not isinstance(threshold, int):
+            raise TypeError("the threshold mode needs an int threshold")
+        if threshold < 0:
+            raise ValueError("threshold must be non-negative")
+    elif threshold is not None:
+        raise ValueError("threshold is only used by the threshold mode")
+    return NormalizationPolicy(cast(NormalizationMode, mode), threshold)
+
+
+def _normalized(value: Integer) -> Integer:
+    """Apply the active normalization policy to an arithmetic result."""
+
+    policy = _normalization
+    if policy.mode == "never" or not (value.a and value.b):
+        return value
+    if policy.mode == "threshold":
+        # Cached depths give the component sizes without walking the chains.
+        if max(int(value.a), int(value.b)) <= cast(int, policy.threshold):
+            return value
+    return value.normalize()
+
+
+def _compare_components(left: Integer, right: Integer) -> tuple[int, LogMessage]:
+    """Compare ``a - b`` with ``c - d`` on the cached component depths.
+
+    ``a - b`` versus ``c - d`` is ``a - c`` versus ``b - d``. Both gaps are
+    read from the depths, so no sum and no natural number is built, and
+    traced and untraced calls do the same work.
+    """
+
+    a, b, c, d = left.a, left.b, right.a, right.b
+    difference = (a._depth - c._depth) - (b._depth - d._depth)
+    return (
+        (difference > 0) - (difference < 0),
+        lambda: f"compare({a!r} - {c!r}, {b!r} - {d!r})",
+    )
+
+
+def gcd(left: Integer | NaturalNumber, right: Integer | NaturalNumber) -> Integer:
+    """Return the non-negative greatest common divisor; ``gcd(0, 0) = 0``."""
+
+    return _new_integer(_binary_gcd(abs(cast2z(left)), abs(cast2z(right))), N_ZERO)
+
+
+def lcm(left: Integer | NaturalNumber, right: Integer | NaturalNumber) -> Integer:
+    """Return the non-negative least common multiple; ``lcm(n, 0) = 0``."""
+
+    a, b = abs(cast2z(left)), abs(cast2z(right))
+    if not a or not b:
+        return Z_ZERO
+    return _new_integer(a // _binary_gcd(a, b) * b, N_ZERO)
+
+
+def extended_gcd(
+    left: Integer | NaturalNumber, right: Integer | NaturalNumber
+) -> tuple[Integer, Integer, Integer]:
+    """Return ``(g, x, y)`` with ``left * x + right * y = g = gcd(left, right)``.
+
+    The Bézout coefficients come from the Euclidean algorithm, whose
+    quotients the binary algorithm does not produce.
+    """
+
+    old_remainder, remainder = cast2z(left), cast2z(right)
+    old_x, x = Z_ONE, Z_ZERO
+    old_y, y = Z_ZERO, Z_ONE
+    while remainder:
+        quotient, next_remainder = divmod(old_remainder, remainder)
+        old_remainder, remainder = remainder, next_remainder
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    if old_remainder._signum() < 0:
+        old_remainder, old_x, old_y = -old_remainder, -old_x, -old_y
+    return old_remainder.normalize(), old_x.normalize(), old_y.normalize()
+
+
+def _binary_gcd(a: NaturalNumber, b: NaturalNumber) -> NaturalNumber:
+    """Stein's algorithm: halve even operands and subtract odd ones.
+
+    Common factors of two are set aside and doubled back at the end, so
+    no step divides by anything but two.
+    """
+
+    twos = 0
+    while a and b:
+        a_half, a_odd = _halve(a)
+        b_half, b_odd = _halve(b)
+        if not a_odd and not b_odd:
+            key, next_a, next_b = "gcd.both_even", a_half, b_half
+            twos += 1
+        elif not a_odd:
+            key, next_a, next_b = "gcd.one_even", a_half, b
+        elif not b_odd:
+            key, next_a, next_b = "gcd.one_even", a, b_half
+        elif a >= b:
+            key, next_a, next_b = "gcd.both_odd", a - b, b
+        else:
+            key, next_a, next_b = "gcd.both_odd", a, b - a
+        # Level 13 sits between compare (12) and + (14), apart from * (15).
+        emit(
+            13,
+            lambda: (
+                f"{translate(key)} gcd({a!r}, {b!r}) -> "
+                f"{'2·' if key == 'gcd.both_even' else ''}"
+                f"gcd({next_a!r}, {next_b!r})"
+            ),
+        )
+        a, b = next_a, next_b
+    result = a if a else b
+    emit(13, lambda: f"{translate('gcd.zero')} gcd({a!r}, {b!r}) -> {result!r}")
+    for _ in range(twos):
+        result = result + result
+    return result
+
+
+def _halve(value: NaturalNumber) -> tuple[NaturalNumber, bool]:
+    """Return ``value // 2`` and whether ``value`` is odd."""
+
+    half, remainder = divmod(value, N_TWO)
+    return half, bool(remainder)
 
 
 def integer(value: int) -> Integer:
@@ -311,8 +538,8 @@ def integer(value: int) -> Integer:
     if isinstance(value, bool) or not isinstance(value, int):
         raise TypeError("only int values can be converted to Integer")
     if value >= 0:
-        return Integer(natural_number(value), N_ZERO)
-    return Integer(N_ZERO, natural_number(-value))
+        return _new_integer(natural_number(value), N_ZERO)
+    return _new_integer(N_ZERO, natural_number(-value))
 
 
 def n2z(value: NaturalNumber) -> Integer:
@@ -320,12 +547,34 @@ def n2z(value: NaturalNumber) -> Integer:
 
     if not isinstance(value, NaturalNumber):
         raise TypeError("n2z expects a NaturalNumber")
-    return Integer(value, N_ZERO)
+    return _new_integer(value, N_ZERO)
+
+
+def _new_integer(a: NaturalNumber, b: NaturalNumber) -> Integer:
+    """Build a result whose components are known to be natural numbers.
+
+    Arithmetic creates values in its innermost loops, so it skips the
+    validation that the public constructor performs.
+    """
+
+    value = object.__new__(Integer)
+    object.__setattr__(value, "a", a)
+    object.__setattr__(value, "b", b)
+    _clear_caches(value)
+    return value
+
+
+def _clear_caches(value: Integer) -> None:
+    object.__setattr__(value, "_sign", None)
+    object.__setattr__(value, "_normal", None)
+    object.__setattr__(value, "_hash", None)
 
 
 def _coerce_integer(value: object) -> Integer | None:
     if isinstance(value, NaturalNumber):
         return n2z(value)
+    if isinstance(value, BinaryNatural):
+        return n2z(value.to_natural_number())
     if isinstance(value, Integer):
         return value
     return None
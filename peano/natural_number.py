@@ -2,32 +2,79 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import total_ordering
-from typing import TYPE_CHECKING, Iterator, cast
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    TypeVar,
+    cast,
+    overload,
+)
 
-from .utils import LogMessage, log, translate
+from .utils import LogMessage, emit, log, logger, translate
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from .integer import Integer
     from .rational import Rational
 
+T = TypeVar("T")
+N = TypeVar("N", bound="NaturalNumber")
 
-@total_ordering
-@dataclass(frozen=True, slots=True, eq=False, repr=False)
+
+@dataclass(frozen=True, init=False, eq=False, repr=False, match_args=False)
 class NaturalNumber:
     """A natural number based on the Peano axioms.
 
     ``None`` represents zero and ``NaturalNumber(n)`` represents the successor
     :math:`S(n)`. Values are immutable. Addition and multiplication follow
     their recursive definitions directly.
+
+    While interning is enabled, ``NaturalNumber(n)`` returns one canonical
+    node per predecessor object, so equal values built the same way share
+    their whole chain. See :func:`config_interning`.
+
+    Internally a node stores :math:`S^k(0)` as the zero it starts from and
+    the count ``k``. ``pre`` is expanded on first access, so a large
+    constant costs one node until its chain is actually walked.
     """
 
-    pre: NaturalNumber | None = None
+    # ``pre`` is the only dataclass field; the storage below stays private.
+    __slots__ = ("_pre", "_base", "_depth")
+    __match_args__ = ("pre",)
 
-    def __post_init__(self) -> None:
-        if self.pre is not None and not isinstance(self.pre, NaturalNumber):
+    pre: NaturalNumber | None
+
+    def __new__(cls, pre: NaturalNumber | None = None) -> Self:
+        if pre is not None and not isinstance(pre, NaturalNumber):
             raise TypeError("pre must be a NaturalNumber or None")
+        if cls is not NaturalNumber:
+            return _allocate(cls, pre)
+        return cast("Self", _intern(pre))
+
+    @property
+    def pre(self) -> NaturalNumber | None:
+        """Return the predecessor, or ``None`` for zero."""
+
+        predecessor = self._pre
+        if predecessor is None and self._depth > 1:
+            predecessor = _run(cast(NaturalNumber, self._base), self._depth - 1)
+            object.__setattr__(self, "_pre", predecessor)
+            table = _intern_table
+            if table.enabled and type(self) is NaturalNumber:
+                # This node is the successor of the predecessor it just built.
+                table.remember(id(predecessor), self)
+        return predecessor
+
+    def __reduce__(self) -> tuple[Callable[[int], NaturalNumber], tuple[int]]:
+        # Store the successor count; loading rebuilds one compact node.
+        return natural_number, (self._depth,)
 
     def __repr__(self) -> str:
         return f"<N({int(self)})>"
@@ -36,22 +83,15 @@ class NaturalNumber:
         return str(int(self))
 
     def __int__(self) -> int:
-        value = 0
-        current: NaturalNumber | None = self
-        while current is not None and current.pre is not None:
-            value += 1
-            current = current.pre
-        return value
+        return self._depth
+
+    def __index__(self) -> int:
+        return self._depth
 
     def structural_str(self) -> str:
         """Return the structure using only zero and successor notation."""
 
-        depth = 0
-        current = self
-        while current.pre is not None:
-            depth += 1
-            current = current.pre
-        return f"{'S(' * depth}0{')' * depth}"
+        return f"{'S(' * self._depth}0{')' * self._depth}"
 
     @log(log_level=1)
     def __eq__(self, other: object) -> tuple[bool, LogMessage]:
@@ -60,61 +100,35 @@ class NaturalNumber:
                 cast(bool, NotImplemented),
                 lambda: f"{self!r} == {other!r} = NotImplemented",
             )
-        left_predecessor = self.pre
-        right_predecessor = other.pre
-        if left_predecessor is None or right_predecessor is None:
-            result = left_predecessor is None and right_predecessor is None
-            return (
-                result,
-                lambda: (
-                    f"{translate('equality.zero')} "
-                    f"eq({self.structural_str()}, "
-                    f"{other.structural_str()}) -> {result}"
-                ),
-            )
-        return (
-            left_predecessor == right_predecessor,
-            lambda: (
-                f"{translate('equality.successor')} "
-                f"eq({self.structural_str()}, "
-                f"{other.structural_str()}) -> "
-                f"eq({left_predecessor.structural_str()}, "
-                f"{right_predecessor.structural_str()})"
-            ),
-        )
+        return _evaluate(1, _equal(self, other))
 
     @log(log_level=2)
-    def __lt__(self, other: object) -> tuple[bool, LogMessage]:
+    def compare(self, other: NaturalNumber) -> tuple[int, LogMessage]:
+        """Return ``-1``, ``0`` or ``1`` as ``self`` is below, at or above ``other``."""
+
         if not isinstance(other, NaturalNumber):
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} < {other!r} = NotImplemented",
-            )
-        if self.pre is None:
-            result = other.pre is not None
-            return result, lambda: f"{self!r} < {other!r} = {result}"
-        if other.pre is None:
-            return False, lambda: f"{self!r} < {other!r} = False"
-        return (
-            self.pre < other.pre,
-            lambda: f"{self!r} < {other!r} = {self.pre!r} < {other.pre!r}",
-        )
+            raise TypeError(f"{other!r} is not a NaturalNumber")
+        return _evaluate(2, _compare(self, other))
 
-    @log(log_level=2)
-    def __le__(self, other: object) -> tuple[bool, LogMessage]:
+    def __lt__(self, other: object) -> bool:
         if not isinstance(other, NaturalNumber):
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} <= {other!r} = NotImplemented",
-            )
-        if self.pre is None:
-            return True, lambda: f"{self!r} <= {other!r} = True"
-        if other.pre is None:
-            return False, lambda: f"{self!r} <= {other!r} = False"
-        return (
-            self.pre <= other.pre,
-            lambda: f"{self!r} <= {other!r} = {self.pre!r} <= {other.pre!r}",
-        )
+            return cast(bool, NotImplemented)
+        return self.compare(other) < 0
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, NaturalNumber):
+            return cast(bool, NotImplemented)
+        return self.compare(other) <= 0
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, NaturalNumber):
+            return cast(bool, NotImplemented)
+        return self.compare(other) > 0
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, NaturalNumber):
+            return cast(bool, NotImplemented)
+        return self.compare(other) >= 0
 
     @log(log_level=4)
     def __add__(self, other: object) -> tuple[NaturalNumber, LogMessage]:
@@ -123,25 +137,7 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} + {other!r} = NotImplemented",
             )
-        predecessor = other.pre
-        if predecessor is None:
-            return (
-                self,
-                lambda: (
-                    f"{translate('addition.base')} "
-                    f"add({self.structural_str()}, 0) "
-                    f"-> {self.structural_str()}"
-                ),
-            )
-        return (
-            successor(self + predecessor),
-            lambda: (
-                f"{translate('addition.recursive')} "
-                f"add({self.structural_str()}, "
-                f"{other.structural_str()}) -> "
-                f"S(add({self.structural_str()}, {predecessor.structural_str()}))"
-            ),
-        )
+        return _evaluate(4, _add(self, other))
 
     @log(log_level=4)
     def __sub__(self, other: object) -> tuple[NaturalNumber, LogMessage]:
@@ -150,16 +146,7 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} - {other!r} = NotImplemented",
             )
-        if other.pre is None:
-            return self, lambda: f"{self!r} - {other!r} = {self!r}"
-        if self.pre is None:
-            raise ValueError(
-                "natural-number subtraction cannot produce a negative value"
-            )
-        return (
-            self.pre - other.pre,
-            lambda: f"{self!r} - {other!r} = {self.pre!r} - {other.pre!r}",
-        )
+        return _evaluate(4, _subtract(self, other))
 
     @log(log_level=5)
     def __mul__(self, other: object) -> tuple[NaturalNumber, LogMessage]:
@@ -168,25 +155,7 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} * {other!r} = NotImplemented",
             )
-        predecessor = other.pre
-        if predecessor is None:
-            return (
-                N_ZERO,
-                lambda: (
-                    f"{translate('multiplication.base')} "
-                    f"mul({self.structural_str()}, 0) -> 0"
-                ),
-            )
-        return (
-            self + self * predecessor,
-            lambda: (
-                f"{translate('multiplication.recursive')} "
-                f"mul({self.structural_str()}, "
-                f"{other.structural_str()}) -> "
-                f"add({self.structural_str()}, "
-                f"mul({self.structural_str()}, {predecessor.structural_str()}))"
-            ),
-        )
+        return _evaluate(5, _multiply(self, other))
 
     @log(log_level=5)
     def __truediv__(self, other: object) -> tuple[Rational, LogMessage]:
@@ -197,10 +166,10 @@ class NaturalNumber:
             )
         if other.pre is None:
             raise ZeroDivisionError("division by zero")
-        from .integer import Integer
-        from .rational import Rational
+        from .integer import _new_integer
+        from .rational import _new_rational
 
-        result = Rational(Integer(self, N_ZERO), Integer(other, N_ZERO))
+        result = _new_rational(_new_integer(self, N_ZERO), _new_integer(other, N_ZERO))
         return result, lambda: f"{self!r} / {other!r} = {result!r}"
 
     @log(log_level=5)
@@ -210,17 +179,7 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} // {other!r} = NotImplemented",
             )
-        if not other:
-            raise ZeroDivisionError("division by zero")
-        if self < other:
-            return N_ZERO, lambda: f"{self!r} // {other!r} = {N_ZERO!r}"
-        return (
-            N_ONE + ((self - other) // other),
-            lambda: (
-                f"{self!r} // {other!r} = "
-                f"{N_ONE!r} + (({self!r} - {other!r}) // {other!r})"
-            ),
-        )
+        return _evaluate(5, _floor_divide(self, other))
 
     @log(log_level=5)
     def __mod__(self, other: object) -> tuple[NaturalNumber, LogMessage]:
@@ -229,19 +188,12 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} % {other!r} = NotImplemented",
             )
-        if not other:
-            raise ZeroDivisionError("division by zero")
-        if self < other:
-            return self, lambda: f"{self!r} % {other!r} = {self!r}"
-        return (
-            (self - other) % other,
-            lambda: f"{self!r} % {other!r} = ({self!r} - {other!r}) % {other!r}",
-        )
+        return _evaluate(5, _modulo(self, other))
 
     def __divmod__(self, other: object) -> tuple[NaturalNumber, NaturalNumber]:
         if not isinstance(other, NaturalNumber):
             return cast(tuple[NaturalNumber, NaturalNumber], NotImplemented)
-        return self // other, self % other
+        return Evaluation(5, _divide(self, other)).run()
 
     @log(log_level=6)
     def __pow__(self, exponent: object) -> tuple[NaturalNumber, LogMessage]:
@@ -250,38 +202,30 @@ class NaturalNumber:
                 cast(NaturalNumber, NotImplemented),
                 lambda: f"{self!r} ** {exponent!r} = NotImplemented",
             )
-        if exponent.pre is None:
-            return N_ONE, lambda: f"{self!r} ** {exponent!r} = {N_ONE!r}"
-        return (
-            (self**exponent.pre) * self,
-            lambda: (
-                f"{self!r} ** S({exponent.pre!r}) = "
-                f"({self!r} ** {exponent.pre!r}) * {self!r}"
-            ),
-        )
+        return _evaluate(6, _power(self, exponent))
 
     def __bool__(self) -> bool:
-        return self.pre is not None
+        return self._depth != 0
 
     def __hash__(self) -> int:
-        return hash(int(self))
+        return hash(self._depth)
 
     def __pos__(self) -> NaturalNumber:
         return self
 
     def __neg__(self) -> Integer:
-        from .integer import Integer
+        from .integer import _new_integer
 
-        return Integer(N_ZERO, self)
+        return _new_integer(N_ZERO, self)
 
     def __abs__(self) -> NaturalNumber:
         return self
 
     def __iter__(self) -> Iterator[NaturalNumber]:
         current = N_ZERO
-        while current != self:
+        for _ in range(self._depth):
             yield current
-            current = successor(current)
+            current = _intern(current)
 
     def __reversed__(self) -> Iterator[NaturalNumber]:
         current = self
@@ -290,12 +234,26 @@ class NaturalNumber:
             yield current
 
     def set_repr(self) -> frozenset[object]:
-        """Return the von Neumann ordinal representation."""
+        """Return the von Neumann ordinal representation.
+
+        Ordinals below ``_ORDINAL_CACHE_SIZE`` are memoized: :math:`n + 1 =
+        n ∪ \\{n\\}` is built once from the frozenset already stored for
+        ``n``, so equal ordinals are one object and compare by identity.
+        Larger ordinals extend the last stored one without being kept. See
+        :class:`~peano.hereditarily_finite.HereditarilyFiniteSet` for a
+        compact encoding with bitwise set operations.
+        """
 
-        if self.pre is None:
-            return frozenset()
-        predecessor = self.pre.set_repr()
-        return frozenset((predecessor,)) | predecessor
+        depth = self._depth
+        ordinals = _ordinals
+        if depth < len(ordinals):
+            return ordinals[depth]
+        ordinal = ordinals[-1]
+        for n in range(len(ordinals), depth + 1):
+            ordinal = frozenset((ordinal,)) | ordinal
+            if n < _ORDINAL_CACHE_SIZE:
+                ordinals.append(ordinal)
+        return ordinal
 
     def set_str(self) -> str:
         return (
@@ -307,12 +265,244 @@ class NaturalNumber:
         )
 
 
+# ``_ordinals[n]`` is the von Neumann ordinal ``n``; each extends the last.
+# Ordinal ``n`` holds ``n`` references, so the memo keeps about ``size² / 2``.
+_ORDINAL_CACHE_SIZE = 1 << 9
+_ordinals: list[frozenset[object]] = [frozenset()]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class NaturalRange:
+    """A lazy arithmetic progression ``start, start + step, ...`` below ``stop``.
+
+    Like ``range``, the view stores only its three bounds. Length,
+    membership, indexing and slicing read the cached depths, so they take
+    constant time. A slice is another ``NaturalRange``; its step must be
+    positive, because the view only counts upward. Two views are equal when
+    they yield the same elements, so all empty views are equal. Iteration
+    yields successive nodes that share structure: with the default step every
+    element is the successor node of the previous one.
+    """
+
+    start: NaturalNumber
+    stop: NaturalNumber
+    step: NaturalNumber = field(default_factory=lambda: N_ONE)
+
+    def __post_init__(self) -> None:
+        if not all(
+            isinstance(bound, NaturalNumber)
+            for bound in (self.start, self.stop, self.step)
+        ):
+            raise TypeError("NaturalRange bounds must be NaturalNumber values")
+        if not self.step:
+            raise ValueError("step must not be zero")
+
+    def __len__(self) -> int:
+        span = self.stop._depth - self.start._depth
+        return max(0, -(-span // self.step._depth))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NaturalRange):
+            return cast(bool, NotImplemented)
+        return self._elements() == other._elements()
+
+    def __hash__(self) -> int:
+        return hash(("NaturalRange", self._elements()))
+
+    def _elements(self) -> tuple[int, int, int]:
+        """Return the length, first depth and step that fix the elements."""
+
+        length = len(self)
+        # Like ``range``, the start only matters for a nonempty view and the
+        # step only once there is a second element.
+        start = self.start._depth if length else 0
+        return length, start, self.step._depth if length > 1 else 0
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, NaturalNumber):
+            return False
+        offset = value._depth - self.start._depth
+        return (
+            0 <= offset
+            and value._depth < self.stop._depth
+            and offset % self.step._depth == 0
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> NaturalNumber: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> NaturalRange: ...
+
+    def __getitem__(self, index: int | slice) -> NaturalNumber | NaturalRange:
+        if isinstance(index, slice):
+            first, last, stride = index.indices(len(self))
+            if stride < 0:
+                # A decreasing progression has no NaturalRange form.
+                raise ValueError("NaturalRange slices need a positive step")
+            step = self.step._depth
+            return NaturalRange(
+                _run(self.start, first * step),
+                _run(self.start, max(first, last) * step),
+                _run(N_ZERO, stride * step),
+            )
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise TypeError("NaturalRange indices must be integers or slices")
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("NaturalRange index out of range")
+        return _run(self.start, index * self.step._depth)
+
+    def __iter__(self) -> Iterator[NaturalNumber]:
+        current = self.start
+        step = self.step._depth
+        for _ in range(len(self)):
+            yield current
+            current = _intern(current) if step == 1 else _run(current, step)
+
+
+def _allocate(
+    cls: type[N],
+    pre: NaturalNumber | None,
+    base: NaturalNumber | None = None,
+    count: int = 0,
+) -> N:
+    if pre is not None:
+        # A successor extends the run its predecessor belongs to.
+        base, count = (pre._base, pre._depth + 1) if pre._depth else (pre, 1)
+    node = object.__new__(cls)
+    object.__setattr__(node, "_pre", pre)
+    object.__setattr__(node, "_base", base)
+    # The number of successors is fixed at construction, so it is cached here.
+    # It doubles as the run length, because ``base`` is always a zero node.
+    object.__setattr__(node, "_depth", count)
+    return node
+
+
+def _intern(pre: NaturalNumber | None) -> NaturalNumber:
+    """Return the node whose predecessor is ``pre``, without validating it."""
+
+    table = _intern_table
+    if not table.enabled:
+        return _allocate(NaturalNumber, pre)
+    key = None if pre is None else id(pre)
+    node = table.lookup(key)
+    if node is None:
+        node = _allocate(NaturalNumber, pre)
+        table.remember(key, node)
+    return node
+
+
+def _run(base: NaturalNumber, count: int) -> NaturalNumber:
+    """Return :math:`S^{count}(base)` as one node without building the chain."""
+
+    if count == 0:
+        return base
+    if count == 1:
+        return _intern(base)
+    if base._depth:
+        base, count = cast(NaturalNumber, base._base), base._depth + count
+    table = _intern_table
+    if not table.enabled:
+        return _allocate(NaturalNumber, None, base, count)
+    key = (id(base), count)
+    node = table.lookup(key)
+    if node is None:
+        node = _allocate(NaturalNumber, None, base, count)
+        table.remember(key, node)
+    return node
+
+
+def _drop(value: NaturalNumber, count: int) -> NaturalNumber:
+    """Return the value ``count`` predecessors below ``value``."""
+
+    if count > value._depth:
+        raise ValueError("natural-number subtraction cannot produce a negative value")
+    if count == 0:
+        return value
+    return _run(cast(NaturalNumber, value._base), value._depth - count)
+
+
+class _InternTable:
+    __slots__ = ("enabled", "max_size", "nodes", "hits", "misses")
+
+    def __init__(self, enabled: bool, max_size: int | None) -> None:
+        self.enabled = enabled
+        self.max_size = max_size
+        self.nodes: OrderedDict[object, NaturalNumber] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: object) -> NaturalNumber | None:
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return node
+
+    def remember(self, key: object, node: NaturalNumber) -> None:
+        if key in self.nodes:
+            return
+        if self.max_size is not None and len(self.nodes) >= self.max_size:
+            # Evict the oldest entry in constant time.
+            self.nodes.popitem(last=False)
+        # Every entry keeps the nodes named by its key alive, so ids stay unique.
+        self.nodes[key] = node
+
+
+_intern_table = _InternTable(enabled=True, max_size=1 << 16)
+
+
+@dataclass(frozen=True, slots=True)
+class InterningStats:
+    """A snapshot of the ``NaturalNumber`` interning table."""
+
+    enabled: bool
+    max_size: int | None
+    size: int
+    hits: int
+    misses: int
+
+
+def config_interning(enabled: bool = True, max_size: int | None = 1 << 16) -> None:
+    """Turn hash-consing of ``NaturalNumber`` nodes on or off.
+
+    At most ``max_size`` canonical nodes are kept; the oldest entries are
+    evicted first and ``None`` removes the bound. Reconfiguring empties the
+    table and resets its counters. Values built before remain valid, because
+    equality never depends on identity.
+    """
+
+    global _intern_table
+    if max_size is not None and (
+        isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 1
+    ):
+        raise ValueError("max_size must be a positive integer or None")
+    _intern_table = _InternTable(enabled, max_size)
+
+
+def interning_stats() -> InterningStats:
+    """Return the current interning switch, table size and hit counters."""
+
+    table = _intern_table
+    return InterningStats(
+        enabled=table.enabled,
+        max_size=table.max_size,
+        size=len(table.nodes),
+        hits=table.hits,
+        misses=table.misses,
+    )
+
+
 def successor(number: NaturalNumber) -> NaturalNumber:
     """Return the successor :math:`S(n)`."""
 
     if not isinstance(number, NaturalNumber):
         raise TypeError("successor expects a NaturalNumber")
-    return NaturalNumber(number)
+    return _intern(number)
 
 
 def natural_number(value: int) -> NaturalNumber:
@@ -322,10 +512,7 @@ def natural_number(value: int) -> NaturalNumber:
         raise TypeError("only int values can be converted to NaturalNumber")
     if value < 0:
         raise ValueError("negative values cannot be converted to NaturalNumber")
-    result = N_ZERO
-    for _ in range(value):
-        result = successor(result)
-    return result
+    return _run(N_ZERO, value)
 
 
 def cast2n(value: object) -> NaturalNumber:
@@ -336,5 +523,803 @@ def cast2n(value: object) -> NaturalNumber:
     return value
 
 
+# A recursive definition yields ``(log_level, sub_rule)`` where it would call
+# itself, receives the sub-result, and returns ``(result, formula)`` like ``@log``.
+Rule = Generator[tuple[int, Generator[Any, Any, Any]], Any, tuple[T, LogMessage]]
+
+
+class Evaluation(Generic[T]):
+    """Evaluate a recursive rule on an explicit stack.
+
+    Each step resumes the innermost pending rule once. The rule either
+    finishes, logging its formula where ``@log`` would have logged it, or
+    pushes the sub-rule it depends on. Python's call stack therefore stays
+    flat however deep the Peano recursion goes. Iterating yields the number
+    of pending rules after every step, so a long computation can be advanced
+    a few steps at a time and resumed later.
+    """
+
+    __slots__ = ("_frames", "_sent", "_outcome", "_log_outermost")
+
+    def __init__(
+        self,
+        log_level: int,
+        rule: Rule[T],
+        *,
+        log_outermost: bool = True,
+    ) -> None:
+        self._frames: list[tuple[int, Generator[Any, Any, Any]]] = [(log_level, rule)]
+        self._sent: object = None
+        self._outcome: tuple[T, LogMessage] | None = None
+        self._log_outermost = log_outermost
+
+    def __iter__(self) -> Evaluation[T]:
+        return self
+
+    def __next__(self) -> int:
+        if self._outcome is not None:
+            raise StopIteration
+        self._step()
+        return len(self._frames)
+
+    @property
+    def done(self) -> bool:
+        return self._outcome is not None
+
+    def step(self, count: int = 1) -> bool:
+        """Advance at most ``count`` steps and report whether evaluation ended."""
+
+        for _ in range(count):
+            if self._outcome is not None:
+                break
+            self._step()
+        return self._outcome is not None
+
+    def run(self) -> T:
+        """Finish the evaluation and return its result."""
+
+        result, _ = self._run()
+        return result
+
+    def _run(self) -> tuple[T, LogMessage]:
+        while self._outcome is None:
+            self._step()
+        return self._outcome
+
+    def _step(self) -> None:
+        frames = self._frames
+        if not frames:
+            raise RuntimeError("an evaluation that raised cannot be resumed")
+        log_level, rule = frames[-1]
+        try:
+            call = rule.send(self._sent)
+        except StopIteration as stop:
+            frames.pop()
+            result, message = stop.value
+            if frames or self._log_outermost:
+                emit(log_level, message)
+            if not frames:
+                self._outcome = stop.value
+            self._sent = result
+        except BaseException:
+            frames.clear()
+            raise
+        else:
+            frames.append(call)
+            self._sent = None
+
+
+def _evaluate(log_level: int, rule: Rule[T]) -> tuple[T, LogMessage]:
+    """Run a rule whose outermost formula is logged by the calling ``@log``."""
+
+    return Evaluation(log_level, rule, log_outermost=False)._run()
+
+
+def _equal(left: NaturalNumber, right: NaturalNumber) -> Rule[bool]:
+    if not logger.isEnabledFor(1):
+        # Cached depths decide the result; the full walk is kept for the trace.
+        result = left is right or left._depth == right._depth
+        return result, lambda: f"{left!r} == {right!r} = {result}"
+    left_predecessor = left.pre
+    right_predecessor = right.pre
+    if left_predecessor is None or right_predecessor is None:
+        result = left_predecessor is None and right_predecessor is None
+        return (
+            result,
+            lambda: (
+                f"{translate('equality.zero')} "
+                f"eq({left.structural_str()}, "
+                f"{right.structural_str()}) -> {result}"
+            ),
+        )
+    return (
+        (yield 1, _equal(left_predecessor, right_predecessor)),
+        lambda: (
+            f"{translate('equality.successor')} "
+            f"eq({left.structural_str()}, "
+            f"{right.structural_str()}) -> "
+            f"eq({left_predecessor.structural_str()}, "
+            f"{right_predecessor.structural_str()})"
+        ),
+    )
+
+
+def _compare(left: NaturalNumber, right: NaturalNumber) -> Rule[int]:
+    if not logger.isEnabledFor(2):
+        # Cached depths decide the order without walking either chain.
+        result = (left._depth > right._depth) - (left._depth < right._depth)
+        return result, lambda: f"compare({left!r}, {right!r}) = {result}"
+    left_predecessor, right_predecessor = left.pre, right.pre
+    if left_predecessor is None or right_predecessor is None:
+        result = (left_predecessor is not None) - (right_predecessor is not None)
+        return result, lambda: f"compare({left!r}, {right!r}) = {result}"
+    return (
+        (yield 2, _compare(left_predecessor, right_predecessor)),
+        lambda: (
+            f"compare({left!r}, {right!r}) = "
+            f"compare({left_predecessor!r}, {right_predecessor!r})"
+        ),
+    )
+
+
+def _less(left: NaturalNumber, right: NaturalNumber) -> Rule[bool]:
+    if not logger.isEnabledFor(2):
+        result = left._depth < right._depth
+        return result, lambda: f"{left!r} < {right!r} = {result}"
+    if left.pre is None:
+        result = right.pre is not None
+        return result, lambda: f"{left!r} < {right!r} = {result}"
+    if right.pre is None:
+        return False, lambda: f"{left!r} < {right!r} = False"
+    left_predecessor, right_predecessor = left.pre, right.pre
+    return (
+        (yield 2, _less(left_predecessor, right_predecessor)),
+        lambda: f"{left!r} < {right!r} = {left_predecessor!r} < {right_predecessor!r}",
+    )
+
+
+def _less_equal(left: NaturalNumber, right: NaturalNumber) -> Rule[bool]:
+    if not logger.isEnabledFor(2):
+        result = left._depth <= right._depth
+        return result, lambda: f"{left!r} <= {right!r} = {result}"
+    if left.pre is None:
+        return True, lambda: f"{left!r} <= {right!r} = True"
+    if right.pre is None:
+        return False, lambda: f"{left!r} <= {right!r} = False"
+    left_predecessor, right_predecessor = left.pre, right.pre
+    return (
+        (yield 2, _less_equal(left_predecessor, right_predecessor)),
+        lambda: (
+            f"{left!r} <= {right!r} = {left_predecessor!r} <= {right_predecessor!r}"
+        ),
+    )
+
+
+def _add(left: NaturalNumber, right: NaturalNumber) -> Rule[NaturalNumber]:
+    if not logger.isEnabledFor(4):
+        # Splice the successors of ``right`` onto ``left`` in one step.
+        result = _run(left, right._depth)
+        return result, lambda: f"{left!r} + {right!r} = {result!r}"
+    predecessor = right.pre
+    if predecessor is None:
+        return (
+            left,
+            lambda: (
+                f"{translate('addition.base')} "
+                f"add({left.structural_str()}, 0) "
+                f"-> {left.structural_str()}"
+            ),
+        )
+    return (
+        _intern((yield 4, _add(left, predecessor))),
+        lambda: (
+            f"{translate('addition.recursive')} "
+            f"add({left.structural_str()}, "
+            f"{right.structural_str()}) -> "
+            f"S(add({left.structural_str()}, {predecessor.structural_str()}))"
+        ),
+    )
+
+
+def _subtract(left: NaturalNumber, right: NaturalNumber) -> Rule[NaturalNumber]:
+    if not logger.isEnabledFor(4):
+        result = _drop(left, right._depth)
+        return result, lambda: f"{left!r} - {right!r} = {result!r}"
+    if right.pre is None:
+        return left, lambda: f"{left!r} - {right!r} = {left!r}"
+    if left.pre is None:
+        raise ValueError("natural-number subtraction cannot produce a negative value")
+    left_predecessor, right_predecessor = left.pre, right.pre
+    return (
+        (yield 4, _subtract(left_predecessor, right_predecessor)),
+        lambda: f"{left!r} - {right!r} = {left_predecessor!r} - {right_predecessor!r}",
+    )
+
+
+def _multiply(left: NaturalNumber, right: NaturalNumber) -> Rule[NaturalNumber]:
+    if not logger.isEnabledFor(5):
+        # Double instead of recursing once per successor of ``right``; the
+        # recursive rule below still drives traces.
+        (product, _), _ = yield from _multiply_from(left, right, N_ONE, left)
+        return product, lambda: f"{left!r} * {right!r} = {product!r}"
+    predecessor = right.pre
+    if predecessor is None:
+        return (
+            N_ZERO,
+            lambda: (
+                f"{translate('multiplication.base')} "
+                f"mul({left.structural_str()}, 0) -> 0"
+            ),
+        )
+    product = yield 5, _multiply(left, predecessor)
+    return (
+        (yield 4, _add(left, product)),
+        lambda: (
+            f"{translate('multiplication.recursive')} "
+            f"mul({left.structural_str()}, "
+            f"{right.structural_str()}) -> "
+            f"add({left.structural_str()}, "
+            f"mul({left.structural_str()}, {predecessor.structural_str()}))"
+        ),
+    )
+
+
+def _multiply_from(
+    left: NaturalNumber,
+    right: NaturalNumber,
+    unit: NaturalNumber,
+    multiple: NaturalNumber,
+) -> Rule[tuple[NaturalNumber, NaturalNumber]]:
+    """Multiply by doubling, the mirror of long division by doubling.
+
+    With ``multiple = left * unit``, return ``(left * (right - r), r)`` for
+    ``r = right % unit``. The pair for ``unit`` follows from the pair for
+    ``2 * unit``: the remainder either stays or gives up ``unit`` while
+    ``multiple`` joins the product. ``unit = 1`` gives ``(left * right, 0)``.
+    """
+
+    if (yield 2, _less(right, unit)):
+        return (N_ZERO, right), lambda: f"{left!r} * {right!r} mod {unit!r}"
+    doubled = yield 4, _add(unit, unit)
+    product, remainder = yield 5, _multiply_from(
+        left, right, doubled, (yield 4, _add(multiple, multiple))
+    )
+    if not (yield 2, _less(remainder, unit)):
+        product = yield 4, _add(product, multiple)
+        remainder = yield 4, _subtract(remainder, unit)
+    return (product, remainder), lambda: f"{left!r} * {right!r} mod {unit!r}"
+
+
+def _divide(
+    left: NaturalNumber, right: NaturalNumber
+) -> Rule[tuple[NaturalNumber, NaturalNumber]]:
+    """Long division by doubling: divmod(a, d) follows from divmod(a, 2d)."""
+
+    if not right:
+        raise ZeroDivisionError("division by zero")
+    if (yield 2, _less(left, right)):
+        return (
+            (N_ZERO, left),
+            lambda: (
+                f"{translate('division.base')} "
+                f"divmod({left!r}, {right!r}) -> ({N_ZERO!r}, {left!r})"
+            ),
+        )
+    doubled = yield 4, _add(right, right)
+    half_quotient, half_remainder = yield 5, _divide(left, doubled)
+    quotient = yield 4, _add(half_quotient, half_quotient)
+    if (yield 2, _less(half_remainder, right)):
+        remainder = half_remainder
+        rule = f"(2·{half_quotient!r}, {half_remainder!r})"
+    else:
+        quotient = yield 4, _add(quotient, N_ONE)
+        remainder = yield 4, _subtract(half_remainder, right)
+        rule = f"(2·{half_quotient!r} + {N_ONE!r}, {half_remainder!r} - {right!r})"
+    return (
+        (quotient, remainder),
+        lambda: (
+            f"{translate('division.doubling')} "
+            f"divmod({left!r}, {right!r}) -> {rule} "
+            f"from divmod({left!r}, {doubled!r})"
+        ),
+    )
+
+
+def _floor_divide(left: NaturalNumber, right: NaturalNumber) -> Rule[NaturalNumber]:
+    (quotient, _), message = yield from _divide(left, right)
+    return quotient, message
+
+
+def _modulo(left: NaturalNumber, right: NaturalNumber) -> Rule[NaturalNumber]:
+    (_, remainder), message = yield from _divide(left, right)
+    return remainder, message
+
+
+def _power(base: NaturalNumber, exponent: NaturalNumber) -> Rule[NaturalNumber]:
+    """Square and multiply: halve the exponent, square, and multiply if odd."""
+
+    if exponent.pre is None:
+        return (
+            N_ONE,
+            lambda: f"{translate('power.base')} {base!r} ** {exponent!r} -> {N_ONE!r}",
+        )
+    half, odd = yield 5, _divide(exponent, N_TWO)
+    root = yield 6, _power(base, half)
+    square = yield 5, _multiply(root, root)
+    if not odd:
+        return (
+            square,
+            lambda: (
+                f"{translate('power.even')} "
+                f"{base!r} ** {exponent!r} -> ({base!r} ** {half!r})²"
+            ),
+        )
+    return (
+        (yield 5, _multiply(square, base)),
+        lambda: (
+            f"{translate('power.odd')} "
+            f"{base!r} ** {exponent!r} -> ({base!r} ** {half!r})² * {base!r}"
+        ),
+    )
+
+
+_RULES: dict[str, tuple[int, Callable[[NaturalNumber, NaturalNumber], Rule[Any]]]] = {
+    "==": (1, _equal),
+    "<": (2, _less),
+    "<=": (2, _less_equal),
+    "+": (4, _add),
+    "-": (4, _subtract),
+    "*": (5, _multiply),
+    "//": (5, _floor_divide),
+    "%": (5, _modulo),
+    "divmod": (5, _divide),
+    "**": (6, _power),
+}
+
+
+def evaluation(
+    left: NaturalNumber, operator: str, right: NaturalNumber
+) -> Evaluation[Any]:
+    """Prepare ``left <operator> right`` as a resumable step-by-step evaluation.
+
+    ``operator`` is one of ``==``, ``<``, ``<=``, ``+``, ``-``, ``*``, ``//``,
+    ``%``, ``divmod`` or ``**``. Nothing is computed until the evaluation is stepped.
+    """
+
+    if not isinstance(left, NaturalNumber) or not isinstance(right, NaturalNumber):
+        raise TypeError("evaluation expects NaturalNumber operands")
+    if operator not in _RULES:
+        supported = ", ".join(_RULES)
+        raise ValueError(f"operator must be one of: {supported}")
+    log_level, rule = _RULES[operator]
+    return Evaluation(log_level, rule(left, right))
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class BinaryNatural:
+    """A natural number built from the constructors zero, ``2n`` and ``2n+1``.
+
+    ``BinaryNatural()`` represents zero and ``BinaryNatural(n, odd)``
+    represents :math:`2n` or :math:`2n + 1`. Doubling zero is rejected, so
+    every value has exactly one representation. Operations recurse once per
+    binary digit instead of once per successor, which keeps their cost
+    logarithmic in the value.
+    """
+
+    half: BinaryNatural | None = None
+    odd: bool = False
+
+    def __post_init__(self) -> None:
+        if self.half is not None and not isinstance(self.half, BinaryNatural):
+            raise TypeError("half must be a BinaryNatural or None")
+        if not isinstance(self.odd, bool):
+            raise TypeError("odd must be a bool")
+        if self.half is None and self.odd:
+            raise ValueError("one is written BinaryNatural(BinaryNatural(), True)")
+        if self.half is not None and self.half.half is None and not self.odd:
+            raise ValueError("doubling zero must be written BinaryNatural()")
+
+    def __repr__(self) -> str:
+        return f"<B({int(self)})>"
+
+    def __str__(self) -> str:
+        return str(int(self))
+
+    def __int__(self) -> int:
+        digits: list[bool] = []
+        current = self
+        while current.half is not None:
+            digits.append(current.odd)
+            current = current.half
+        value = 0
+        for digit in reversed(digits):
+            value = 2 * value + digit
+        return value
+
+    def __index__(self) -> int:
+        return int(self)
+
+    def structural_str(self) -> str:
+        """Return the structure with ``D(n) = 2n`` and ``O(n) = 2n + 1``."""
+
+        constructors: list[str] = []
+        current = self
+        while current.half is not None:
+            constructors.append("O(" if current.odd else "D(")
+            current = current.half
+        return f"{''.join(constructors)}0{')' * len(constructors)}"
+
+    def __reduce__(self) -> tuple[Callable[[int], BinaryNatural], tuple[int]]:
+        return binary_natural, (int(self),)
+
+    def to_natural_number(self) -> NaturalNumber:
+        """Return the same value as a unary successor chain."""
+
+        return natural_number(int(self))
+
+    @log(log_level=1)
+    def __eq__(self, other: object) -> tuple[bool, LogMessage]:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return (
+                cast(bool, NotImplemented),
+                lambda: f"{self!r} == {other!r} = NotImplemented",
+            )
+        return _evaluate(1, _binary_equal(self, converted))
+
+    @log(log_level=2)
+    def compare(self, other: BinaryNatural | NaturalNumber) -> tuple[int, LogMessage]:
+        """Return ``-1``, ``0`` or ``1`` as ``self`` is below, at or above ``other``."""
+
+        converted = _coerce_binary(other)
+        if converted is None:
+            raise TypeError(f"{other!r} is not a BinaryNatural")
+        result = _compare_digits(self, converted)
+        return result, lambda: f"compare({self!r}, {converted!r}) = {result}"
+
+    def __lt__(self, other: object) -> bool:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) < 0
+
+    def __le__(self, other: object) -> bool:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) <= 0
+
+    def __gt__(self, other: object) -> bool:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) > 0
+
+    def __ge__(self, other: object) -> bool:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) >= 0
+
+    def __add__(self, other: object) -> BinaryNatural:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return self._add(converted, False)
+
+    def __radd__(self, other: object) -> BinaryNatural:
+        return self + other
+
+    @log(log_level=4)
+    def _add(
+        self, other: BinaryNatural, carry: bool
+    ) -> tuple[BinaryNatural, LogMessage]:
+        return _evaluate(4, _binary_add(self, other, carry))
+
+    def __sub__(self, other: object) -> BinaryNatural:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return self._subtract(converted, False)
+
+    def __rsub__(self, other: object) -> BinaryNatural:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return converted - self
+
+    @log(log_level=4)
+    def _subtract(
+        self, other: BinaryNatural, borrow: bool
+    ) -> tuple[BinaryNatural, LogMessage]:
+        return _evaluate(4, _binary_subtract(self, other, borrow))
+
+    @log(log_level=5)
+    def __mul__(self, other: object) -> tuple[BinaryNatural, LogMessage]:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return (
+                cast(BinaryNatural, NotImplemented),
+                lambda: f"{self!r} * {other!r} = NotImplemented",
+            )
+        return _evaluate(5, _binary_multiply(self, converted))
+
+    def __rmul__(self, other: object) -> BinaryNatural:
+        return self * other
+
+    @log(log_level=5)
+    def _divmod(
+        self, divisor: BinaryNatural
+    ) -> tuple[tuple[BinaryNatural, BinaryNatural], LogMessage]:
+        return _evaluate(5, _binary_divide(self, divisor))
+
+    def __divmod__(self, other: object) -> tuple[BinaryNatural, BinaryNatural]:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(tuple[BinaryNatural, BinaryNatural], NotImplemented)
+        if converted.half is None:
+            raise ZeroDivisionError("division by zero")
+        return self._divmod(converted)
+
+    def __rdivmod__(self, other: object) -> tuple[BinaryNatural, BinaryNatural]:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(tuple[BinaryNatural, BinaryNatural], NotImplemented)
+        return divmod(converted, self)
+
+    def __floordiv__(self, other: object) -> BinaryNatural:
+        result = self.__divmod__(other)
+        if result is NotImplemented:
+            return cast(BinaryNatural, NotImplemented)
+        quotient, _ = result
+        return quotient
+
+    def __mod__(self, other: object) -> BinaryNatural:
+        result = self.__divmod__(other)
+        if result is NotImplemented:
+            return cast(BinaryNatural, NotImplemented)
+        _, remainder = result
+        return remainder
+
+    def __rfloordiv__(self, other: object) -> BinaryNatural:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return converted // self
+
+    def __rmod__(self, other: object) -> BinaryNatural:
+        converted = _coerce_binary(other)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return converted % self
+
+    def __truediv__(self, other: object) -> Rational:
+        from .rational import _coerce_rational
+
+        converted = _coerce_rational(other)
+        if converted is None:
+            return cast("Rational", NotImplemented)
+        return _coerce_rational(self) / converted
+
+    def __rtruediv__(self, other: object) -> Rational:
+        from .rational import _coerce_rational
+
+        converted = _coerce_rational(other)
+        if converted is None:
+            return cast("Rational", NotImplemented)
+        return converted / _coerce_rational(self)
+
+    @log(log_level=6)
+    def __pow__(self, exponent: object) -> tuple[BinaryNatural, LogMessage]:
+        converted = _coerce_binary(exponent)
+        if converted is None:
+            return (
+                cast(BinaryNatural, NotImplemented),
+                lambda: f"{self!r} ** {exponent!r} = NotImplemented",
+            )
+        return _evaluate(6, _binary_power(self, converted))
+
+    def __rpow__(self, base: object) -> BinaryNatural:
+        converted = _coerce_binary(base)
+        if converted is None:
+            return cast(BinaryNatural, NotImplemented)
+        return converted**self
+
+    def __bool__(self) -> bool:
+        return self.half is not None
+
+    def __hash__(self) -> int:
+        return hash(int(self))
+
+    def __pos__(self) -> BinaryNatural:
+        return self
+
+    def __neg__(self) -> Integer:
+        return -self.to_natural_number()
+
+    def __abs__(self) -> BinaryNatural:
+        return self
+
+
+def binary_natural(value: int | NaturalNumber) -> BinaryNatural:
+    """Construct a binary natural number from an ``int`` or a unary chain."""
+
+    if isinstance(value, NaturalNumber):
+        value = int(value)
+    elif isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError("only int and NaturalNumber values can be converted")
+    if value < 0:
+        raise ValueError("negative values cannot be converted to BinaryNatural")
+    result = B_ZERO
+    for digit in bin(value)[2:] if value else "":
+        result = _double(result, digit == "1")
+    return result
+
+
+def _double(value: BinaryNatural, odd: bool) -> BinaryNatural:
+    """Return ``2·value + odd`` while keeping zero canonical."""
+
+    if value.half is None and not odd:
+        return B_ZERO
+    return BinaryNatural(value, odd)
+
+
+def _halve(value: BinaryNatural) -> BinaryNatural:
+    return B_ZERO if value.half is None else value.half
+
+
+def _compare_digits(left: BinaryNatural, right: BinaryNatural) -> int:
+    """Compare digit by digit, letting the most significant difference win."""
+
+    result = 0
+    while left.half is not None and right.half is not None:
+        if left.odd != right.odd:
+            result = 1 if left.odd else -1
+        left, right = left.half, right.half
+    if left.half is not None:
+        return 1
+    if right.half is not None:
+        return -1
+    return result
+
+
+# Binary rules recurse once per digit. Like the unary rules they run on the
+# explicit stack of :class:`Evaluation`, so long operands cannot overflow it.
+
+
+def _binary_equal(left: BinaryNatural, right: BinaryNatural) -> Rule[bool]:
+    if left.half is None or right.half is None:
+        result = left.half is None and right.half is None
+        return result, lambda: f"{left!r} == {right!r} = {result}"
+    if left.odd != right.odd:
+        return False, lambda: f"{left!r} == {right!r} = False (last digit)"
+    left_half, right_half = left.half, right.half
+    return (
+        (yield 1, _binary_equal(left_half, right_half)),
+        lambda: f"{left!r} == {right!r} = {left_half!r} == {right_half!r}",
+    )
+
+
+def _binary_add(
+    left: BinaryNatural, right: BinaryNatural, carry: bool
+) -> Rule[BinaryNatural]:
+    carried = " + 1" if carry else ""
+    if not carry and right.half is None:
+        return left, lambda: f"{left!r} + {right!r} = {left!r}"
+    if not carry and left.half is None:
+        return right, lambda: f"{left!r} + {right!r} = {right!r}"
+    total = left.odd + right.odd + carry
+    left_half, right_half = _halve(left), _halve(right)
+    result = _double(
+        (yield 4, _binary_add(left_half, right_half, total >= 2)), total % 2 == 1
+    )
+    return (
+        result,
+        lambda: (
+            f"{left!r} + {right!r}{carried} = "
+            f"2·({left_half!r} + {right_half!r}{' + 1' if total >= 2 else ''})"
+            f" + {total % 2}"
+        ),
+    )
+
+
+def _binary_subtract(
+    left: BinaryNatural, right: BinaryNatural, borrow: bool
+) -> Rule[BinaryNatural]:
+    borrowed = " - 1" if borrow else ""
+    if not borrow and right.half is None:
+        return left, lambda: f"{left!r} - {right!r} = {left!r}"
+    if left.half is None:
+        raise ValueError("natural-number subtraction cannot produce a negative value")
+    difference = left.odd - right.odd - borrow
+    left_half, right_half = _halve(left), _halve(right)
+    result = _double(
+        (yield 4, _binary_subtract(left_half, right_half, difference < 0)),
+        difference % 2 == 1,
+    )
+    return (
+        result,
+        lambda: (
+            f"{left!r} - {right!r}{borrowed} = "
+            f"2·({left_half!r} - {right_half!r}{' - 1' if difference < 0 else ''})"
+            f" + {difference % 2}"
+        ),
+    )
+
+
+def _binary_multiply(left: BinaryNatural, right: BinaryNatural) -> Rule[BinaryNatural]:
+    half = right.half
+    if half is None:
+        return B_ZERO, lambda: f"{left!r} * {right!r} = {B_ZERO!r}"
+    doubled = _double((yield 5, _binary_multiply(left, half)), False)
+    if not right.odd:
+        return doubled, lambda: f"{left!r} * {right!r} = 2·({left!r} * {half!r})"
+    return (
+        (yield 4, _binary_add(doubled, left, False)),
+        lambda: f"{left!r} * {right!r} = 2·({left!r} * {half!r}) + {left!r}",
+    )
+
+
+def _binary_divide(
+    left: BinaryNatural, divisor: BinaryNatural
+) -> Rule[tuple[BinaryNatural, BinaryNatural]]:
+    half = left.half
+    if half is None:
+        return (B_ZERO, B_ZERO), lambda: f"divmod({left!r}, {divisor!r}) = (0, 0)"
+    quotient, remainder = yield 5, _binary_divide(half, divisor)
+    shifted = _double(remainder, left.odd)
+    if shifted >= divisor:
+        difference = yield 4, _binary_subtract(shifted, divisor, False)
+        result = _double(quotient, True), difference
+        rule = f"(2·{quotient!r} + 1, {shifted!r} - {divisor!r})"
+    else:
+        result = _double(quotient, False), shifted
+        rule = f"(2·{quotient!r}, {shifted!r})"
+    return (
+        result,
+        lambda: (
+            f"divmod({left!r}, {divisor!r}) = {rule} from divmod({half!r}, {divisor!r})"
+        ),
+    )
+
+
+def _binary_power(base: BinaryNatural, exponent: BinaryNatural) -> Rule[BinaryNatural]:
+    half = exponent.half
+    if half is None:
+        return B_ONE, lambda: f"{base!r} ** {exponent!r} = {B_ONE!r}"
+    root = yield 6, _binary_power(base, half)
+    square = yield 5, _binary_multiply(root, root)
+    if not exponent.odd:
+        return (
+            square,
+            lambda: f"{base!r} ** {exponent!r} = ({base!r} ** {half!r}) ** 2",
+        )
+    return (
+        (yield 5, _binary_multiply(square, base)),
+        lambda: f"{base!r} ** {exponent!r} = ({base!r} ** {half!r}) ** 2 * {base!r}",
+    )
+
+
+def _coerce_binary(value: object) -> BinaryNatural | None:
+    if isinstance(value, BinaryNatural):
+        return value
+    if isinstance(value, NaturalNumber):
+        return binary_natural(value)
+    return None
+
+
+def _coerce_natural(value: object) -> NaturalNumber | None:
+    """Accept either natural-number representation, e.g. as an exponent."""
+
+    if isinstance(value, NaturalNumber):
+        return value
+    if isinstance(value, BinaryNatural):
+        return value.to_natural_number()
+    return None
+
+
 N_ZERO = NaturalNumber()
 N_ONE = NaturalNumber(N_ZERO)
+N_TWO = NaturalNumber(N_ONE)
+B_ZERO = BinaryNatural()
+B_ONE = BinaryNatural(B_ZERO, True)
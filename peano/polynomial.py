@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from fractions import Fraction
-from functools import total_ordering
-from itertools import zip_longest
-from typing import Iterator, cast
-
-from .integer import Z_ONE, Integer
-from .natural_number import N_ONE, N_ZERO, NaturalNumber
+from itertools import chain, zip_longest
+from math import comb, gcd, lcm
+from typing import Callable, Iterator, Sequence, TypeVar, cast
+
+from .integer import Integer
+from .natural_number import (
+    N_TWO,
+    BinaryNatural,
+    NaturalNumber,
+    _coerce_natural,
+)
 from .rational import (
-    Q_ONE,
     Q_ZERO,
     Rational,
+    _from_ratio,
     cast2r,
     n2r,
     rational,
@@ -21,18 +26,28 @@ from .rational import (
 )
 from .utils import LogMessage, log
 
+T = TypeVar("T")
+
 
-@total_ordering
-@dataclass(frozen=True, slots=True, init=False, eq=False, repr=False)
+@dataclass(frozen=True, init=False, eq=False, repr=False)
 class Polynomial:
     """Treat a finite sequence ``(a0, ..., an)`` as a polynomial over Q.
 
     Coefficients are ordered from the constant term upward. Trailing zeroes
     are removed and every coefficient is reduced, giving each polynomial,
     including zero, one canonical representation.
+
+    Internally the polynomial is ``(n0 + n1 x + ... + nk x^k) / d`` with
+    Python integer numerators and a positive common denominator ``d`` that
+    shares no factor with all of them. Ring operations work on that array;
+    the ``Rational`` coefficients are built on first access and cached.
     """
 
-    _coefficients: tuple[Rational, ...]
+    # The integer array is the dataclass surface; the Rationals are a cache.
+    __slots__ = ("_numerators", "_denominator", "_coefficients")
+
+    _numerators: tuple[int, ...]
+    _denominator: int
 
     def __init__(self, *coefficients: Rational) -> None:
         if not coefficients:
@@ -40,26 +55,44 @@ class Polynomial:
         if any(not isinstance(value, Rational) for value in coefficients):
             raise TypeError("Polynomial coefficients must be Rational")
 
-        normalized = [value.reduction() for value in coefficients]
-        while len(normalized) > 1 and normalized[-1] == Q_ZERO:
-            normalized.pop()
-        object.__setattr__(self, "_coefficients", tuple(normalized))
+        # as_integer_ratio reduces with math.gcd, not the Peano reduction.
+        numerators, denominator = _common_denominator(
+            [value.as_integer_ratio() for value in coefficients]
+        )
+        object.__setattr__(self, "_numerators", numerators)
+        object.__setattr__(self, "_denominator", denominator)
+        object.__setattr__(self, "_coefficients", None)
+
+    def __reduce__(
+        self,
+    ) -> tuple[
+        Callable[[tuple[int, ...], int], Polynomial], tuple[tuple[int, ...], int]
+    ]:
+        # Store the integer array; loading skips the coefficient reduction.
+        return _new_polynomial, (self._numerators, self._denominator)
 
     @property
     def k(self) -> tuple[Rational, ...]:
         """Return the coefficient sequence exposed by the original API."""
 
-        return self._coefficients
+        return self.coefficients
 
     @property
     def coefficients(self) -> tuple[Rational, ...]:
-        return self._coefficients
+        coefficients = self._coefficients
+        if coefficients is None:
+            denominator = self._denominator
+            coefficients = tuple(
+                _coefficient(numerator, denominator) for numerator in self._numerators
+            )
+            object.__setattr__(self, "_coefficients", coefficients)
+        return coefficients
 
     @property
     def degree(self) -> int:
         """Return the degree, using -1 for the zero polynomial."""
 
-        return -1 if not self else len(self.coefficients) - 1
+        return -1 if not self else len(self._numerators) - 1
 
     @property
     def leading_coefficient(self) -> Rational:
@@ -67,46 +100,84 @@ class Polynomial:
             raise ValueError("the zero polynomial has no leading coefficient")
         return self.coefficients[-1]
 
+    def compare(self, other: Polynomial | Rational | Integer | NaturalNumber) -> int:
+        """Order by degree, then by coefficients from the leading term down.
+
+        Return ``-1``, ``0`` or ``1`` as ``self`` is below, at or above
+        ``other``.
+        """
+
+        converted = _coerce_polynomial(other)
+        if converted is None:
+            raise TypeError(f"{other!r} is not a Polynomial")
+        if self.degree != converted.degree:
+            return -1 if self.degree < converted.degree else 1
+        # Cross-multiply by the positive denominators.
+        left_scale, right_scale = converted._denominator, self._denominator
+        for left, right in zip(
+            reversed(self._numerators), reversed(converted._numerators)
+        ):
+            difference = left * left_scale - right * right_scale
+            if difference:
+                return 1 if difference > 0 else -1
+        return 0
+
     def __eq__(self, other: object) -> bool:
         converted = _coerce_polynomial(other)
         if converted is None:
             return cast(bool, NotImplemented)
-        return self.coefficients == converted.coefficients
-
-    def _order_key(self) -> tuple[int, tuple[Rational, ...]]:
-        return self.degree, tuple(reversed(self.coefficients))
+        # Both sides are canonical, so equal values have equal arrays.
+        return (
+            self._denominator == converted._denominator
+            and self._numerators == converted._numerators
+        )
 
     def __lt__(self, other: object) -> bool:
         converted = _coerce_polynomial(other)
         if converted is None:
             return cast(bool, NotImplemented)
-        return self._order_key() < converted._order_key()
+        return self.compare(converted) < 0
 
     def __le__(self, other: object) -> bool:
         converted = _coerce_polynomial(other)
         if converted is None:
             return cast(bool, NotImplemented)
-        return self._order_key() <= converted._order_key()
+        return self.compare(converted) <= 0
+
+    def __gt__(self, other: object) -> bool:
+        converted = _coerce_polynomial(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) > 0
+
+    def __ge__(self, other: object) -> bool:
+        converted = _coerce_polynomial(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) >= 0
 
     def __add__(self, other: object) -> Polynomial:
         converted = _coerce_polynomial(other)
         if converted is None:
             return cast(Polynomial, NotImplemented)
-        coefficients = [
-            a + b
+        common = gcd(self._denominator, converted._denominator)
+        left_scale = converted._denominator // common
+        right_scale = self._denominator // common
+        numerators = [
+            a * left_scale + b * right_scale
             for a, b in zip_longest(
-                self.coefficients,
-                converted.coefficients,
-                fillvalue=Q_ZERO,
+                self._numerators, converted._numerators, fillvalue=0
             )
         ]
-        return Polynomial(*coefficients)
+        return _canonical(numerators, self._denominator * left_scale)
 
     def __radd__(self, other: object) -> Polynomial:
         return self + other
 
     def __neg__(self) -> Polynomial:
-        return Polynomial(*(-coefficient for coefficient in self))
+        return _new_polynomial(
+            tuple(-numerator for numerator in self._numerators), self._denominator
+        )
 
     def __sub__(self, other: object) -> Polynomial:
         converted = _coerce_polynomial(other)
@@ -126,12 +197,10 @@ class Polynomial:
             return cast(Polynomial, NotImplemented)
         if not self or not converted:
             return P_ZERO
-        result = [Q_ZERO] * (len(self.coefficients) + len(converted.coefficients) - 1)
-        for i, left in enumerate(self.coefficients):
-            for j, right in enumerate(converted.coefficients):
-                product = (left * right).reduction()
-                result[i + j] = (result[i + j] + product).reduction()
-        return Polynomial(*result)
+        return _canonical(
+            _convolve(self._numerators, converted._numerators),
+            self._denominator * converted._denominator,
+        )
 
     def __rmul__(self, other: object) -> Polynomial:
         return self * other
@@ -140,22 +209,7 @@ class Polynomial:
         divisor = _coerce_polynomial(other)
         if divisor is None:
             return cast(tuple[Polynomial, Polynomial], NotImplemented)
-        if not divisor:
-            raise ZeroDivisionError("cannot divide by the zero polynomial")
-        if self.degree < divisor.degree:
-            return P_ZERO, self
-
-        quotient = [Q_ZERO] * (self.degree - divisor.degree + 1)
-        remainder = self
-        while remainder and remainder.degree >= divisor.degree:
-            degree_difference = remainder.degree - divisor.degree
-            leading = (
-                remainder.leading_coefficient / divisor.leading_coefficient
-            ).reduction()
-            quotient[degree_difference] = leading
-            term = Polynomial(*([Q_ZERO] * degree_difference + [leading]))
-            remainder = remainder - divisor * term
-        return Polynomial(*quotient), remainder
+        return self._divide(divisor, True, True)
 
     def __rdivmod__(self, other: object) -> tuple[Polynomial, Polynomial]:
         dividend = _coerce_polynomial(other)
@@ -167,8 +221,7 @@ class Polynomial:
         divisor = _coerce_polynomial(other)
         if divisor is None:
             return cast(Polynomial, NotImplemented)
-        result = self.__divmod__(divisor)
-        quotient, _ = result
+        quotient, _ = self._divide(divisor, True, False)
         return quotient
 
     def __rfloordiv__(self, other: object) -> Polynomial:
@@ -181,8 +234,7 @@ class Polynomial:
         divisor = _coerce_polynomial(other)
         if divisor is None:
             return cast(Polynomial, NotImplemented)
-        result = self.__divmod__(divisor)
-        _, remainder = result
+        _, remainder = self._divide(divisor, False, True)
         return remainder
 
     def __rmod__(self, other: object) -> Polynomial:
@@ -191,12 +243,62 @@ class Polynomial:
             return cast(Polynomial, NotImplemented)
         return dividend % self
 
+    def _divide(
+        self, divisor: Polynomial, with_quotient: bool, with_remainder: bool
+    ) -> tuple[Polynomial, Polynomial]:
+        """Divide on the numerator arrays, computing only the parts asked for.
+
+        Results that were not requested are returned as ``P_ZERO``.
+        """
+
+        if not divisor:
+            raise ZeroDivisionError("cannot divide by the zero polynomial")
+        if self.degree < divisor.degree:
+            return P_ZERO, self
+
+        # Dividing by the primitive part keeps the scaling factors small.
+        content = gcd(*divisor._numerators)
+        if divisor._numerators[-1] < 0:
+            content = -content
+        primitive = [value // content for value in divisor._numerators]
+        quotient, remainder, scale = _long_division(
+            self._numerators, primitive, with_quotient, with_remainder
+        )
+        denominator = scale * self._denominator
+        return (
+            _canonical(
+                [value * divisor._denominator for value in quotient],
+                denominator * content,
+            )
+            if with_quotient
+            else P_ZERO,
+            _canonical(remainder, denominator) if with_remainder else P_ZERO,
+        )
+
     def __pow__(self, exponent: object) -> Polynomial:
-        if not isinstance(exponent, NaturalNumber):
+        converted = _coerce_natural(exponent)
+        if converted is None:
             return cast(Polynomial, NotImplemented)
-        if exponent == N_ZERO:
+        terms = [(i, value) for i, value in enumerate(self._numerators) if value]
+        power = int(converted)
+        if (
+            power > 1
+            and terms
+            and comb(power + len(terms) - 1, len(terms) - 1) <= self.degree * power + 1
+        ):
+            # Few terms: the multinomial expansion has no more products than
+            # the result has coefficients. By Gauss's lemma the content of
+            # the numerators stays coprime to the denominator.
+            return _new_polynomial(
+                tuple(_multinomial_power(terms, power)), self._denominator**power
+            )
+        if not converted:
             return P_ONE
-        return (self ** (exponent - N_ONE)) * self
+        # Square and multiply along the binary digits of the Peano exponent.
+        half, odd = divmod(converted, N_TWO)
+        root = self**half
+        square = root * root
+        return square * self if odd else square
 
     @log(log_level=31)
     def evaluate(self, value: object) -> tuple[Rational, LogMessage]:
@@ -213,76 +315,72 @@ class Polynomial:
 
         Denominators grow exponentially while refining a root interval. When
         only the sign is needed, there is no educational value in constructing
-        enormous intermediate Peano values. The same ratios are therefore
-        mapped to Python's arbitrary-precision integers and evaluated exactly.
+        enormous intermediate Peano values. For ``x = a / b`` the sign of
+        ``b^k d p(x) = n0 b^k + n1 a b^(k-1) + ... + nk a^k`` is evaluated with
+        Python integers instead, so no division is needed.
         """
 
-        point = _as_fraction(cast2r(value))
-        result = Fraction(0)
-        for coefficient in reversed(self.coefficients):
-            result = result * point + _as_fraction(coefficient)
+        numerator, denominator = cast2r(value).as_integer_ratio()
+        numerators = self._numerators
+        result, scale = numerators[-1], 1
+        for coefficient in reversed(numerators[:-1]):
+            scale *= denominator
+            result = result * numerator + coefficient * scale
         return (result > 0) - (result < 0)
 
     def derivative(self) -> Polynomial:
         """Return the formal derivative."""
 
-        if self.degree <= 0:
-            return P_ZERO
-        return Polynomial(
-            *(
-                coefficient * rational(power, 1)
-                for power, coefficient in enumerate(self.coefficients[1:], start=1)
-            )
-        )
+        return _cached("derivative", self, _derivative)
 
     def monic(self) -> Polynomial:
         """Return a copy whose leading coefficient is one."""
 
-        if not self:
-            return P_ZERO
-        leading = self.leading_coefficient
-        return Polynomial(*(coefficient / leading for coefficient in self.coefficients))
+        return _cached("monic", self, _monic)
 
     def gcd(self, other: Polynomial) -> Polynomial:
-        """Return the monic greatest common divisor using Euclid's algorithm."""
+        """Return the monic greatest common divisor.
+
+        The remainders come from an integer subresultant sequence, so their
+        coefficients stay polynomial in size instead of doubling each step.
+        """
 
         if not isinstance(other, Polynomial):
             raise TypeError("gcd expects a Polynomial")
-        left, right = self, other
-        while right:
-            left, right = right, left % right
-        return left.monic()
+        left, right = (self, other) if self.degree >= other.degree else (other, self)
+        if not right:
+            return left.monic()
+        last = _subresultant_chain(left._numerators, right._numerators)[-1]
+        return _canonical(last, last[-1])
 
     def square_free(self) -> Polynomial:
         """Return the square-free part with repeated roots removed."""
 
         if self.degree <= 0:
             return self
-        common = self.gcd(self.derivative())
-        return (self // common).monic()
+        return _cached("square_free", self, _square_free)
 
     def reduction(self) -> Polynomial:
-        return Polynomial(*self.coefficients)
+        return self
 
     def __len__(self) -> int:
-        return len(self.coefficients)
+        return len(self._numerators)
 
     def __bool__(self) -> bool:
-        return not (len(self.coefficients) == 1 and self.coefficients[0] == Q_ZERO)
+        return len(self._numerators) > 1 or self._numerators[0] != 0
 
     def __int__(self) -> int:
         if self.degree > 0:
             raise TypeError("only constant polynomials can be converted to int")
-        coefficient = self.coefficients[0]
-        if coefficient.q != Z_ONE:
+        if self._denominator != 1:
             raise TypeError("a non-integral constant cannot be converted to int")
-        return int(coefficient.p)
+        return self._numerators[0]
 
     def __hash__(self) -> int:
         if self.degree <= 0:
             # Equal values across the numeric tower must have equal hashes.
             return hash(self.coefficients[0])
-        return hash(("Polynomial", self.coefficients))
+        return hash(("Polynomial", self._numerators, self._denominator))
 
     def __iter__(self) -> Iterator[Rational]:
         return iter(self.coefficients)
@@ -292,20 +390,19 @@ class Polynomial:
 
     def __str__(self) -> str:
         terms: list[tuple[bool, str]] = []
-        for power, coefficient in enumerate(self.coefficients):
-            if coefficient == Q_ZERO:
+        denominator = self._denominator
+        for power, numerator in enumerate(self._numerators):
+            if not numerator:
                 continue
-            negative = coefficient < Q_ZERO
-            magnitude = abs(coefficient).reduction()
-            coefficient_text = _format_rational(magnitude)
+            common = gcd(numerator, denominator)
+            p, q = abs(numerator) // common, denominator // common
+            coefficient_text = str(p) if q == 1 else f"{p}/{q}"
             if power == 0:
                 body = coefficient_text
             else:
                 variable = "x" if power == 1 else f"x^{power}"
-                body = (
-                    variable if magnitude == Q_ONE else f"{coefficient_text}{variable}"
-                )
-            terms.append((negative, body))
+                body = variable if p == q == 1 else f"{coefficient_text}{variable}"
+            terms.append((numerator < 0, body))
 
         if not terms:
             return "0"
@@ -338,6 +435,259 @@ def polynomial(*coefficients: tuple[int, int]) -> Polynomial:
     return Polynomial(*(rational(p, q) for p, q in coefficients))
 
 
+def _new_polynomial(numerators: tuple[int, ...], denominator: int) -> Polynomial:
+    """Build a result from a canonical integer array.
+
+    ``numerators`` has no trailing zeroes, apart from the single entry of the
+    zero polynomial, ``denominator`` is positive, and no prime divides all of
+    them.
+    """
+
+    value = object.__new__(Polynomial)
+    object.__setattr__(value, "_numerators", numerators)
+    object.__setattr__(value, "_denominator", denominator)
+    object.__setattr__(value, "_coefficients", None)
+    return value
+
+
+def _common_denominator(
+    ratios: list[tuple[int, int]],
+) -> tuple[tuple[int, ...], int]:
+    """Put reduced ratios with positive denominators over their lcm.
+
+    Trailing zero ratios are dropped first. The lcm of reduced denominators
+    leaves no factor common to all numerators and the denominator.
+    """
+
+    while len(ratios) > 1 and not ratios[-1][0]:
+        ratios.pop()
+    denominator = lcm(*(q for _, q in ratios))
+    return tuple(p * (denominator // q) for p, q in ratios), denominator
+
+
+def _canonical(numerators: list[int], denominator: int) -> Polynomial:
+    """Strip trailing zeroes and cancel the content against the denominator."""
+
+    while len(numerators) > 1 and not numerators[-1]:
+        numerators.pop()
+    if not numerators:
+        numerators.append(0)
+    common = gcd(denominator, *numerators)
+    if denominator < 0:
+        common = -common
+    if common != 1:
+        numerators = [value // common for value in numerators]
+        denominator //= common
+    return _new_polynomial(tuple(numerators), denominator)
+
+
+def _coefficient(numerator: int, denominator: int) -> Rational:
+    common = gcd(numerator, denominator)
+    return _from_ratio(numerator // common, denominator // common)
+
+
+def _convolve(left: Sequence[int], right: Sequence[int]) -> list[int]:
+    """Multiply two nonempty numerator arrays, choosing the algorithm by size.
+
+    The thresholds come from ``scripts/benchmark_multiplication.py``.
+    """
+
+    if min(len(left), len(right)) < _KRONECKER_LENGTH:
+        return _schoolbook(left, right)
+    bits = _coefficient_bits(left, right)
+    if bits <= _KRONECKER_SLOT_BITS:
+        return _kronecker(left, right, bits)
+    # Kronecker pads every coefficient to the widest product slot.
+    payload = sum(value.bit_length() + 1 for value in chain(left, right))
+    if bits * (len(left) + len(right)) <= _KRONECKER_PADDING * payload:
+        return _kronecker(left, right, bits)
+    return _karatsuba(left, right)
+
+
+def _schoolbook(left: Sequence[int], right: Sequence[int]) -> list[int]:
+    result = [0] * (len(left) + len(right) - 1)
+    for i, a in enumerate(left):
+        if a:
+            for j, b in enumerate(right):
+                result[i + j] += a * b
+    return result
+
+
+def _karatsuba(left: Sequence[int], right: Sequence[int]) -> list[int]:
+    """Split both arrays at ``m`` and recurse with three products, not four."""
+
+    if len(left) < len(right):
+        left, right = right, left
+    size = len(right)
+    if size < _KARATSUBA_LENGTH:
+        return _schoolbook(left, right)
+    result = [0] * (len(left) + size - 1)
+    if 2 * size <= len(left):
+        # Unbalanced: multiply the shorter array by pieces of its own length.
+        for start in range(0, len(left), size):
+            piece = _karatsuba(left[start : start + size], right)
+            for i, value in enumerate(piece):
+                result[start + i] += value
+        return result
+    m = len(left) // 2
+    low_left, high_left = left[:m], left[m:]
+    low_right, high_right = right[:m], right[m:]
+    low = _karatsuba(low_left, low_right)
+    high = _karatsuba(high_left, high_right)
+    middle = _karatsuba(
+        _add_arrays(low_left, high_left), _add_arrays(low_right, high_right)
+    )
+    for i, value in enumerate(low):
+        result[i] += value
+        middle[i] -= value
+    for i, value in enumerate(high):
+        result[i + 2 * m] += value
+        middle[i] -= value
+    for i, value in enumerate(middle):
+        if value:
+            result[i + m] += value
+    return result
+
+
+def _long_division(
+    dividend: Sequence[int],
+    divisor: Sequence[int],
+    with_quotient: bool,
+    with_remainder: bool,
+) -> tuple[list[int], list[int], int]:
+    """Run fraction-free long division in place on one remainder array.
+
+    Each step scales by ``leading / gcd(top, leading)`` and cancels the top
+    term, keeping ``scale * dividend = quotient * divisor + remainder``. The
+    quotient is only tracked when asked for, and without a remainder the
+    terms below the divisor's degree, which never reach the quotient, are
+    dropped up front.
+    """
+
+    degree = len(divisor) - 1
+    leading = divisor[-1]
+    offset = 0 if with_remainder else degree
+    remainder = list(dividend[offset:])
+    quotient = [0] * (len(dividend) - degree) if with_quotient else []
+    scale = 1
+    for shift in range(len(dividend) - degree - 1, -1, -1):
+        top = remainder.pop()
+        if not top:
+            continue
+        common = gcd(top, leading)
+        factor, multiple = leading // common, top // common
+        if factor != 1:
+            for i in range(len(remainder)):
+                remainder[i] *= factor
+            for i in range(shift + 1, len(quotient)):
+                quotient[i] *= factor
+            scale *= factor
+        for i in range(max(offset - shift, 0), degree):
+            remainder[shift + i - offset] -= multiple * divisor[i]
+        if with_quotient:
+            quotient[shift] = multiple
+    return quotient, remainder, scale
+
+
+def _subresultant_chain(first: Sequence[int], second: Sequence[int]) -> list[list[int]]:
+    """Return a remainder sequence of integer arrays with bounded growth.
+
+    ``deg first >= deg second`` and ``second`` is nonzero. Every array is a
+    positive multiple of the matching term of ``f0, f1, f2 = -(f0 mod f1),
+    ...``, so the signs of a Sturm sequence survive. Each pseudo-remainder
+    uses ``|lc|^(delta + 1)`` and is divided exactly by ``beta`` from the
+    subresultant recurrence, taken in absolute value; the terms are then
+    subresultants up to sign and the sequence ends at a multiple of the gcd.
+    """
+
+    chain = [list(first), list(second)]
+    beta, psi = 1, 1
+    while True:
+        previous, current = chain[-2], chain[-1]
+        delta = len(previous) - len(current)
+        leading = abs(current[-1])
+        _, remainder, scale = _long_division(previous, current, False, True)
+        # Turn ``scale`` into the fixed multiplier ``|lc|^(delta + 1)``.
+        multiplier = leading ** (delta + 1) // abs(scale)
+        if scale > 0:
+            multiplier = -multiplier
+        while remainder and not remainder[-1]:
+            remainder.pop()
+        if not remainder:
+            return chain
+        chain.append([multiplier * value // beta for value in remainder])
+        if delta:
+            psi = leading**delta // psi ** (delta - 1)
+        beta = leading * psi ** (len(current) - len(remainder))
+
+
+def _derivative(value: Polynomial) -> Polynomial:
+    if value.degree <= 0:
+        return P_ZERO
+    return _canonical(
+        [
+            power * numerator
+            for power, numerator in enumerate(value._numerators[1:], start=1)
+        ],
+        value._denominator,
+    )
+
+
+def _monic(value: Polynomial) -> Polynomial:
+    if not value:
+        return P_ZERO
+    # The common denominator cancels against the leading coefficient's.
+    return _canonical(list(value._numerators), value._numerators[-1])
+
+
+def _square_free(value: Polynomial) -> Polynomial:
+    common = value.gcd(value.derivative())
+    return (value // common).monic()
+
+
+def _add_arrays(left: Sequence[int], right: Sequence[int]) -> list[int]:
+    return [a + b for a, b in zip_longest(left, right, fillvalue=0)]
+
+
+def _coefficient_bits(left: Sequence[int], right: Sequence[int]) -> int:
+    """Return a slot width that holds every product coefficient with its sign."""
+
+    bound = min(len(left), len(right)) * max(map(abs, left)) * max(map(abs, right))
+    return bound.bit_length() + 1
+
+
+def _kronecker(left: Sequence[int], right: Sequence[int], bits: int) -> list[int]:
+    """Pack both arrays into one big int each and multiply once.
+
+    Coefficients become base-``2^bits`` digits, rounded up to whole bytes so
+    that packing and unpacking are single ``int.from_bytes``/``to_bytes``
+    calls. Product digits are signed; each one below ``-2^(bits - 1)`` is
+    recovered by borrowing from the next.
+    """
+
+    width = (bits + 7) // 8
+    product = _pack(left, width) * _pack(right, width)
+    length = len(left) + len(right) - 1
+    data = product.to_bytes(length * width, "little", signed=True)
+    base, half = 1 << 8 * width, 1 << (8 * width - 1)
+    result, carry = [], 0
+    for start in range(0, length * width, width):
+        digit = int.from_bytes(data[start : start + width], "little") + carry
+        carry = digit >= half
+        result.append(digit - base if carry else digit)
+    return result
+
+
+def _pack(values: Sequence[int], width: int) -> int:
+    positive = b"".join(
+        (value if value > 0 else 0).to_bytes(width, "little") for value in values
+    )
+    negative = b"".join(
+        (-value if value < 0 else 0).to_bytes(width, "little") for value in values
+    )
+    return int.from_bytes(positive, "little") - int.from_bytes(negative, "little")
+
+
 def n2p(value: NaturalNumber) -> Polynomial:
     return Polynomial(n2r(value))
 
@@ -355,6 +705,8 @@ def r2p(value: Rational) -> Polynomial:
 def _coerce_polynomial(value: object) -> Polynomial | None:
     if isinstance(value, NaturalNumber):
         return n2p(value)
+    if isinstance(value, BinaryNatural):
+        return n2p(value.to_natural_number())
     if isinstance(value, Integer):
         return z2p(value)
     if isinstance(value, Rational):
@@ -371,6 +723,92 @@ def cast2p(value: object) -> Polynomial:
     return converted
 
 
+class _DerivedCache:
+    __slots__ = ("enabled", "max_size", "entries", "hits", "misses")
+
+    def __init__(self, enabled: bool, max_size: int | None) -> None:
+        self.enabled = enabled
+        self.max_size = max_size
+        self.entries: OrderedDict[object, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+_derived_cache = _DerivedCache(enabled=True, max_size=1 << 10)
+
+
+def _cached(name: str, value: Polynomial, build: Callable[[Polynomial], T]) -> T:
+    """Return ``build(value)``, reusing the result for equal polynomials."""
+
+    cache = _derived_cache
+    if not cache.enabled:
+        return build(value)
+    # The canonical array fingerprints the value, so equal inputs share.
+    key = (name, value._numerators, value._denominator)
+    entries = cache.entries
+    if key in entries:
+        cache.hits += 1
+        entries.move_to_end(key)
+        return cast(T, entries[key])
+    cache.misses += 1
+    result = build(value)
+    if cache.max_size is not None and len(entries) >= cache.max_size:
+        # Evict the least recently used entry.
+        entries.popitem(last=False)
+    entries[key] = result
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class PolynomialCacheStats:
+    """A snapshot of the cache of derived polynomials and Sturm chains."""
+
+    enabled: bool
+    max_size: int | None
+    size: int
+    hits: int
+    misses: int
+
+
+def config_polynomial_cache(
+    enabled: bool = True, max_size: int | None = 1 << 10
+) -> None:
+    """Turn the cache of derived objects on or off.
+
+    ``derivative``, ``monic``, ``square_free``, ``sturm_sequence`` and
+    ``subresultant_sturm_sequence`` remember their results per polynomial
+    value. At most ``max_size`` results are kept, the least recently used
+    are evicted first and ``None`` removes the bound. Reconfiguring empties
+    the cache and resets its counters.
+    """
+
+    global _derived_cache
+    if max_size is not None and (
+        isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 1
+    ):
+        raise ValueError("max_size must be a positive integer or None")
+    _derived_cache = _DerivedCache(enabled, max_size)
+
+
+def clear_polynomial_cache() -> None:
+    """Empty the cache and reset its counters, keeping its configuration."""
+
+    config_polynomial_cache(_derived_cache.enabled, _derived_cache.max_size)
+
+
+def polynomial_cache_stats() -> PolynomialCacheStats:
+    """Return the current cache switch, size and hit counters."""
+
+    cache = _derived_cache
+    return PolynomialCacheStats(
+        enabled=cache.enabled,
+        max_size=cache.max_size,
+        size=len(cache.entries),
+        hits=cache.hits,
+        misses=cache.misses,
+    )
+
+
 def sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
     """Return the Sturm sequence used to count real roots."""
 
@@ -378,7 +816,10 @@ def sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
         raise TypeError("sturm_sequence expects a Polynomial")
     if value.degree <= 0:
         raise ValueError("a constant polynomial has no Sturm sequence")
+    return _cached("sturm_sequence", value, _sturm_sequence)
 
+
+def _sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
     square_free = value.square_free()
     sequence = [square_free, square_free.derivative()]
     while sequence[-1]:
@@ -389,6 +830,32 @@ def sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
     return tuple(sequence)
 
 
+def subresultant_sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
+    """Return a Sturm chain of ``value`` with integer coefficients.
+
+    The chain starts from ``value`` and its derivative without removing
+    repeated factors; between points that are not roots, its sign
+    variations still count distinct real roots. Each term is a positive
+    multiple of the matching term of the Euclidean chain, but coefficient
+    sizes stay polynomial in the degree.
+    """
+
+    if not isinstance(value, Polynomial):
+        raise TypeError("subresultant_sturm_sequence expects a Polynomial")
+    if value.degree <= 0:
+        raise ValueError("a constant polynomial has no Sturm sequence")
+    return _cached("subresultant_sturm_sequence", value, _subresultant_sturm_sequence)
+
+
+def _subresultant_sturm_sequence(value: Polynomial) -> tuple[Polynomial, ...]:
+    derivative = [
+        power * numerator
+        for power, numerator in enumerate(value._numerators[1:], start=1)
+    ]
+    chain = _subresultant_chain(value._numerators, derivative)
+    return tuple(_new_polynomial(tuple(numerators), 1) for numerators in chain)
+
+
 def sign_variations(sequence: tuple[Polynomial, ...], point: Rational) -> int:
     """Count nonzero sign changes after evaluating a Sturm sequence."""
 
@@ -412,20 +879,52 @@ def count_real_roots(value: Polynomial, lower: Rational, upper: Rational) -> int
         raise ValueError("lower must be less than upper")
     if value.sign_at(lower) == 0 or value.sign_at(upper) == 0:
         raise ValueError("interval endpoints must not be roots")
-    sequence = sturm_sequence(value)
+    sequence = subresultant_sturm_sequence(value)
     return sign_variations(sequence, lower) - sign_variations(sequence, upper)
 
 
-def _format_rational(value: Rational) -> str:
-    reduced = value.reduction()
-    if reduced.q == Z_ONE:
-        return str(reduced.p)
-    return str(reduced)
-
-
-def _as_fraction(value: Rational) -> Fraction:
-    return Fraction(int(value.p), int(value.q))
+def _multinomial_power(terms: list[tuple[int, int]], exponent: int) -> list[int]:
+    """Expand ``(c_1 x^d_1 + ... + c_t x^d_t) ** exponent`` term by term.
 
+    Each way of splitting ``exponent`` into counts ``k_1 + ... + k_t``
+    contributes ``exponent! / (k_1! ... k_t!) * c_1^k_1 ... c_t^k_t`` to the
+    coefficient of ``x^(d_1 k_1 + ... + d_t k_t)``.
+    """
 
-P_ZERO = Polynomial(Q_ZERO)
-P_ONE = Polynomial(Q_ONE)
+    powers: list[list[int]] = []
+    for _, value in terms:
+        table = [1]
+        for _ in range(exponent):
+            table.append(table[-1] * value)
+        powers.append(table)
+    result = [0] * (terms[-1][0] * exponent + 1)
+    for counts in _compositions(exponent, len(terms)):
+        degree, multiplicity, seen, product = 0, 1, 0, 1
+        for (term_degree, _), table, count in zip(terms, powers, counts):
+            degree += term_degree * count
+            seen += count
+            multiplicity *= comb(seen, count)
+            product *= table[count]
+        result[degree] += multiplicity * product
+    return result
+
+
+def _compositions(total: int, parts: int) -> Iterator[tuple[int, ...]]:
+    """Yield every tuple of ``parts`` natural numbers summing to ``total``."""
+
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in _compositions(total - first, parts - 1):
+            yield (first, *rest)
+
+
+# Crossovers measured by ``scripts/benchmark_multiplication.py``.
+_KRONECKER_LENGTH = 16
+_KRONECKER_SLOT_BITS = 64
+_KRONECKER_PADDING = 3
+_KARATSUBA_LENGTH = 32
+
+P_ZERO = _new_polynomial((0,), 1)
+P_ONE = _new_polynomial((1,), 1)
@@ -3,24 +3,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import total_ordering
-from typing import cast
-
-from .integer import Z_ONE, Z_ZERO, Integer, integer, n2z
-from .natural_number import N_ONE, N_ZERO, NaturalNumber
-from .utils import LogMessage, log
-
-
-@total_ordering
-@dataclass(frozen=True, slots=True, eq=False, repr=False)
+from math import gcd
+from typing import Iterator, Literal, cast
+
+from .integer import (
+    Z_ONE,
+    Z_ZERO,
+    Integer,
+    _binary_gcd,
+    _coerce_integer,
+    _new_integer,
+    integer,
+    n2z,
+)
+from .natural_number import N_ONE, N_TWO, N_ZERO, NaturalNumber, _coerce_natural
+from .utils import LogMessage, log, translate
+
+
+@dataclass(frozen=True, eq=False, repr=False)
 class Rational:
     """Represent a rational number as an integer ratio ``p / q``, ``q != 0``.
 
     ``p/q ~ r/s`` is defined by the cross products ``p*s = q*r``. Input
     representatives are preserved; ``reduction`` normalizes the denominator
     and reduces the ratio only when explicitly requested.
+
+    The reduced representative and the hash are cached on first use, and a
+    value known to be reduced returns itself from ``reduction``.
     """
 
+    # ``p`` and ``q`` are the dataclass fields; the caches stay private.
+    __slots__ = ("p", "q", "_is_reduced", "_reduction", "_hash")
+
     p: Integer
     q: Integer
 
@@ -29,6 +43,10 @@ class Rational:
             raise TypeError("Rational.p and Rational.q must be Integer values")
         if self.q == Z_ZERO:
             raise ZeroDivisionError("the denominator cannot be zero")
+        _clear_caches(self, reduced=False)
+
+    def __reduce__(self) -> tuple[type[Rational], tuple[Integer, Integer]]:
+        return Rational, (self.p, self.q)
 
     def __repr__(self) -> str:
         return f"<Q({self})>"
@@ -44,51 +62,45 @@ class Rational:
                 cast(bool, NotImplemented),
                 lambda: f"{self!r} == {other!r} = NotImplemented",
             )
-        result = self.p * converted.q == self.q * converted.p
-        return (
-            result,
-            lambda: (
-                f"{self!r} == {converted!r} ⇔ "
-                f"{self.p!r} * {converted.q!r} == "
-                f"{self.q!r} * {converted.p!r}"
-            ),
-        )
+        order, step = _compare_ratios(self, converted)
+        result = order == 0
+        return result, lambda: f"{self!r} == {converted!r} ⇔ {step()} == 0"
 
     @log(log_level=22)
-    def __lt__(self, other: object) -> tuple[bool, LogMessage]:
+    def compare(
+        self, other: Rational | Integer | NaturalNumber
+    ) -> tuple[int, LogMessage]:
+        """Return ``-1``, ``0`` or ``1`` as ``self`` is below, at or above ``other``."""
+
         converted = _coerce_rational(other)
         if converted is None:
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} < {other!r} = NotImplemented",
-            )
-        left = self.p * converted.q
-        right = self.q * converted.p
-        denominators_have_different_signs = (self.q < Z_ZERO) != (converted.q < Z_ZERO)
-        result = left > right if denominators_have_different_signs else left < right
-        operator = ">" if denominators_have_different_signs else "<"
-        return (
-            result,
-            lambda: f"{self!r} < {converted!r} ⇔ {left!r} {operator} {right!r}",
-        )
+            raise TypeError(f"{other!r} is not a Rational")
+        result, step = _compare_ratios(self, converted)
+        return result, lambda: f"compare({self!r}, {converted!r}) = {step()} = {result}"
 
-    @log(log_level=22)
-    def __le__(self, other: object) -> tuple[bool, LogMessage]:
+    def __lt__(self, other: object) -> bool:
         converted = _coerce_rational(other)
         if converted is None:
-            return (
-                cast(bool, NotImplemented),
-                lambda: f"{self!r} <= {other!r} = NotImplemented",
-            )
-        left = self.p * converted.q
-        right = self.q * converted.p
-        denominators_have_different_signs = (self.q < Z_ZERO) != (converted.q < Z_ZERO)
-        result = left >= right if denominators_have_different_signs else left <= right
-        operator = ">=" if denominators_have_different_signs else "<="
-        return (
-            result,
-            lambda: f"{self!r} <= {converted!r} ⇔ {left!r} {operator} {right!r}",
-        )
+            return cast(bool, NotImplemented)
+        return self.compare(converted) < 0
+
+    def __le__(self, other: object) -> bool:
+        converted = _coerce_rational(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) <= 0
+
+    def __gt__(self, other: object) -> bool:
+        converted = _coerce_rational(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) > 0
+
+    def __ge__(self, other: object) -> bool:
+        converted = _coerce_rational(other)
+        if converted is None:
+            return cast(bool, NotImplemented)
+        return self.compare(converted) >= 0
 
     @log(log_level=24)
     def __add__(self, other: object) -> tuple[Rational, LogMessage]:
@@ -98,9 +110,11 @@ class Rational:
                 cast(Rational, NotImplemented),
                 lambda: f"{self!r} + {other!r} = NotImplemented",
             )
-        result = Rational(
-            self.p * converted.q + self.q * converted.p,
-            self.q * converted.q,
+        result = _auto_reduced(
+            _new_rational(
+                self.p * converted.q + self.q * converted.p,
+                self.q * converted.q,
+            )
         )
         return (
             result,
@@ -117,7 +131,7 @@ class Rational:
 
     @log(log_level=24)
     def __neg__(self) -> tuple[Rational, LogMessage]:
-        result = Rational(-self.p, self.q)
+        result = _new_rational(-self.p, self.q)
         return result, lambda: f"-{self!r} = (-{self.p!r}) / {self.q!r}"
 
     @log(log_level=24)
@@ -147,7 +161,9 @@ class Rational:
                 cast(Rational, NotImplemented),
                 lambda: f"{self!r} * {other!r} = NotImplemented",
             )
-        result = Rational(self.p * converted.p, self.q * converted.q)
+        result = _auto_reduced(
+            _new_rational(self.p * converted.p, self.q * converted.q)
+        )
         return (
             result,
             lambda: (
@@ -170,7 +186,9 @@ class Rational:
             )
         if not converted:
             raise ZeroDivisionError("division by zero")
-        result = Rational(self.p * converted.q, self.q * converted.p)
+        result = _auto_reduced(
+            _new_rational(self.p * converted.q, self.q * converted.p)
+        )
         return (
             result,
             lambda: (
@@ -188,36 +206,62 @@ class Rational:
 
     @log(log_level=26)
     def __pow__(self, exponent: object) -> tuple[Rational, LogMessage]:
-        if not isinstance(exponent, NaturalNumber):
+        converted = _coerce_natural(exponent)
+        if converted is None:
             return (
                 cast(Rational, NotImplemented),
                 lambda: f"{self!r} ** {exponent!r} = NotImplemented",
             )
-        if exponent == N_ZERO:
-            return Q_ONE, lambda: f"{self!r} ** {exponent!r} = {Q_ONE!r}"
+        if not converted:
+            return (
+                Q_ONE,
+                lambda: (
+                    f"{translate('power.base')} {self!r} ** {converted!r} -> {Q_ONE!r}"
+                ),
+            )
+        # Square and multiply along the binary digits of the Peano exponent.
+        half, odd = divmod(converted, N_TWO)
+        root = self**half
+        square = root * root
+        if not odd:
+            return (
+                square,
+                lambda: (
+                    f"{translate('power.even')} "
+                    f"{self!r} ** {converted!r} -> ({self!r} ** {half!r})²"
+                ),
+            )
         return (
-            (self ** (exponent - N_ONE)) * self,
+            square * self,
             lambda: (
-                f"{self!r} ** {exponent!r} = "
-                f"({self!r} ** ({exponent!r} - {N_ONE!r})) * {self!r}"
+                f"{translate('power.odd')} "
+                f"{self!r} ** {converted!r} -> "
+                f"({self!r} ** {half!r})² * {self!r}"
             ),
         )
 
     def __bool__(self) -> bool:
-        return self.p != Z_ZERO
+        return bool(self.p)
 
     def __hash__(self) -> int:
-        reduced = self.reduction()
-        if reduced.q == Z_ONE:
-            # Equal NaturalNumber and Integer values must share the same hash.
-            return hash(reduced.p)
-        return hash(("Rational", int(reduced.p), int(reduced.q)))
+        value = self._hash
+        if value is None:
+            reduced = self.reduction()
+            if reduced.q == Z_ONE:
+                # Equal NaturalNumber and Integer values must share the same hash.
+                value = hash(reduced.p)
+            else:
+                value = hash(("Rational", int(reduced.p), int(reduced.q)))
+            object.__setattr__(self, "_hash", value)
+        return value
 
     def __pos__(self) -> Rational:
         return self
 
     def __abs__(self) -> Rational:
-        return Rational(Integer(abs(self.p), N_ZERO), Integer(abs(self.q), N_ZERO))
+        return _new_rational(
+            _new_integer(abs(self.p), N_ZERO), _new_integer(abs(self.q), N_ZERO)
+        )
 
     def as_integer_ratio(self) -> tuple[int, int]:
         """Return a reduced Python integer ratio with a positive denominator.
@@ -226,27 +270,384 @@ class Rational:
         intermediates when displaying or validating large rational values.
         """
 
-        from math import gcd
-
         numerator, denominator = int(self.p), int(self.q)
         if denominator < 0:
             numerator, denominator = -numerator, -denominator
         divisor = gcd(abs(numerator), denominator)
         return numerator // divisor, denominator // divisor
 
+    def digits(self, base: int = 10) -> Iterator[ExpansionDigit]:
+        """Yield the base-``base`` expansion by long division, lazily.
+
+        The first item is the integer part ``floor(self)`` at position ``0``.
+        Fractional digits follow until the remainder vanishes, or forever
+        when the expansion repeats. Only the current remainder and the one
+        that opens the cycle are kept, so memory stays constant.
+        """
+
+        if isinstance(base, bool) or not isinstance(base, int):
+            raise TypeError("base must be an int")
+        if base < 2:
+            raise ValueError("base must be at least 2")
+        numerator, denominator = self.as_integer_ratio()
+        whole, remainder = divmod(numerator, denominator)
+        yield ExpansionDigit(0, whole, False, None)
+
+        # Factors shared with the base delay the cycle by one digit each.
+        cycle_start, coprime = 0, denominator
+        while (common := gcd(coprime, base)) > 1:
+            coprime //= common
+            cycle_start += 1
+        position, start_remainder, period = 0, None, None
+        while remainder:
+            if position == cycle_start:
+                start_remainder = remainder
+            position += 1
+            digit, remainder = divmod(remainder * base, denominator)
+            if period is None and remainder == start_remainder:
+                period = position - cycle_start
+            yield ExpansionDigit(position, digit, position > cycle_start, period)
+
+    def limit_denominator(self, max_q: int) -> Rational:
+        """Return the closest rational whose denominator is at most ``max_q``.
+
+        Like :meth:`fractions.Fraction.limit_denominator`, this walks the
+        continued fraction of ``self`` and compares the last convergent with
+        the best semiconvergent before the bound.
+        """
+
+        if isinstance(max_q, bool) or not isinstance(max_q, int):
+            raise TypeError("max_q must be an int")
+        if max_q < 1:
+            raise ValueError("max_q must be at least 1")
+        numerator, denominator = self.as_integer_ratio()
+        if denominator <= max_q:
+            return _from_ratio(numerator, denominator)
+
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        n, d = numerator, denominator
+        while True:
+            a = n // d
+            q2 = q0 + a * q1
+            if q2 > max_q:
+                break
+            p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+            n, d = d, n - a * d
+        k = (max_q - q0) // q1
+        semi_p, semi_q = p0 + k * p1, q0 + k * q1
+        # Ties go to the convergent, whose denominator is smaller.
+        convergent_error = abs(p1 * denominator - numerator * q1) * semi_q
+        semi_error = abs(semi_p * denominator - numerator * semi_q) * q1
+        if convergent_error <= semi_error:
+            return _from_ratio(p1, q1)
+        return _from_ratio(semi_p, semi_q)
+
     def reduction(self) -> Rational:
         """Return a reduced representative with a positive denominator."""
 
+        if self._is_reduced:
+            return self
+        reduced = self._reduction
+        if reduced is not None:
+            return reduced
+
         numerator = self.p.normalize()
         denominator = self.q.normalize()
-        if denominator < Z_ZERO:
+        if denominator._signum() < 0:
             numerator, denominator = -numerator, -denominator
 
-        a, b = abs(numerator), abs(denominator)
-        while b:
-            a, b = b, a % b
-        divisor = Integer(a, N_ZERO)
-        return Rational(numerator // divisor, denominator // divisor)
+        a = _binary_gcd(abs(numerator), abs(denominator))
+        if a != N_ONE:
+            divisor = _new_integer(a, N_ZERO)
+            numerator, denominator = numerator // divisor, denominator // divisor
+        elif numerator is self.p and denominator is self.q:
+            object.__setattr__(self, "_is_reduced", True)
+            return self
+        reduced = _new_rational(numerator, denominator, reduced=True)
+        object.__setattr__(self, "_reduction", reduced)
+        return reduced
+
+
+@dataclass(frozen=True, slots=True)
+class ExpansionDigit:
+    """One digit of :meth:`Rational.digits`.
+
+    ``position`` is ``0`` for the integer part and ``k`` for the ``k``-th
+    fractional digit. ``repeating`` marks digits inside the repeating cycle,
+    and ``period`` gives its length from the digit that completes the first
+    cycle onward, ``None`` before that.
+    """
+
+    position: int
+    value: int
+    repeating: bool
+    period: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class CalkinWilf:
+    """Every positive rational exactly once, in Calkin–Wilf order.
+
+    The sequence runs ``1/1, 1/2, 2/1, 1/3, 3/2, 2/3, 3/1, ...``, and every
+    term is already reduced. Iteration starts at index ``start`` and moves on
+    with Newman's successor ``x -> 1 / (2 * floor(x) - x + 1)``, which costs a
+    constant number of big-int operations. Terms are plain integer pairs
+    until a Rational is requested; :meth:`ratios` never builds one at all.
+    """
+
+    start: int = 0
+
+    def __post_init__(self) -> None:
+        _check_index(self.start)
+
+    def __iter__(self) -> Iterator[Rational]:
+        for numerator, denominator in self.ratios():
+            yield _from_ratio(numerator, denominator)
+
+    def ratios(self) -> Iterator[tuple[int, int]]:
+        """Yield the terms as reduced ``(numerator, denominator)`` int pairs."""
+
+        numerator, denominator = _calkin_wilf_ratio(self.start)
+        while True:
+            yield numerator, denominator
+            numerator, denominator = (
+                denominator,
+                (2 * (numerator // denominator) + 1) * denominator - numerator,
+            )
+
+    def nth(self, index: int) -> Rational:
+        """Return the term at ``index``, counted from the start of the view."""
+
+        _check_index(index)
+        return _from_ratio(*_calkin_wilf_ratio(self.start + index))
+
+    def index_of(self, value: Rational) -> int:
+        """Return the position of a positive rational within the view."""
+
+        if not isinstance(value, Rational):
+            raise TypeError("index_of expects a Rational")
+        numerator, denominator = value.as_integer_ratio()
+        if numerator <= 0:
+            raise ValueError("only positive rationals are enumerated")
+        index = _calkin_wilf_index(numerator, denominator) - self.start
+        if index < 0:
+            raise ValueError(f"{value} comes before the start of the view")
+        return index
+
+
+def _check_index(index: object) -> None:
+    if isinstance(index, bool) or not isinstance(index, int):
+        raise TypeError("Calkin–Wilf indices must be integers")
+    if index < 0:
+        raise ValueError("Calkin–Wilf indices must be non-negative")
+
+
+def _calkin_wilf_ratio(index: int) -> tuple[int, int]:
+    # Below the leading 1, the bits of index + 1 spell the path from the root
+    # of the Calkin–Wilf tree: 0 takes a / (a + b), 1 takes (a + b) / b.
+    # Runs of equal bits are applied at once, one step per continued-fraction
+    # term of the result.
+    path = index + 1
+    numerator = denominator = 1
+    position = path.bit_length() - 1
+    while position:
+        bit = path >> (position - 1) & 1
+        # Length of the run of ``bit`` starting at ``position - 1``.
+        rest = path & ((1 << position) - 1)
+        run = position - (rest ^ (-bit & ((1 << position) - 1))).bit_length()
+        if bit:
+            numerator += run * denominator
+        else:
+            denominator += run * numerator
+        position -= run
+    return numerator, denominator
+
+
+def _calkin_wilf_index(numerator: int, denominator: int) -> int:
+    # Climb to the root: a left child a / b (a < b) has parent a / (b - a),
+    # and a right child has parent (a - b) / b. Each run is one division.
+    low_bits = shift = 0
+    while numerator != denominator:
+        if numerator < denominator:
+            run = (denominator - 1) // numerator
+            denominator -= run * numerator
+        else:
+            run = (numerator - 1) // denominator
+            numerator -= run * denominator
+            low_bits |= ((1 << run) - 1) << shift
+        shift += run
+    return (1 << shift | low_bits) - 1
+
+
+AutoReductionMode = Literal["never", "size", "every"]
+
+
+class _AutoReduction:
+    __slots__ = ("mode", "limit", "operations", "reductions")
+
+    def __init__(self, mode: AutoReductionMode, limit: int | None) -> None:
+        self.mode = mode
+        self.limit = limit
+        self.operations = 0
+        self.reductions = 0
+
+
+_auto_reduction = _AutoReduction("never", None)
+
+
+@dataclass(frozen=True, slots=True)
+class AutoReductionStats:
+    """A snapshot of the automatic reduction of rational arithmetic results."""
+
+    mode: AutoReductionMode
+    limit: int | None
+    operations: int
+    reductions: int
+
+
+def config_auto_reduction(
+    mode: AutoReductionMode = "never", limit: int | None = None
+) -> None:
+    """Reduce the results of ``+``, ``-``, ``*`` and ``/`` automatically.
+
+    ``"never"`` keeps today's unreduced results. ``"size"`` reduces a result
+    whose four natural-number components hold more than ``limit``
+    successors in total, and ``"every"`` reduces every ``limit``-th result.
+    Reconfiguring resets the counters of :func:`auto_reduction_stats`.
+    """
+
+    global _auto_reduction
+    if mode not in ("never", "size", "every"):
+        raise ValueError("mode must be 'never', 'size' or 'every'")
+    if mode == "never":
+        if limit is not None:
+            raise ValueError("limit is only used by the size and every modes")
+    elif isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    _auto_reduction = _AutoReduction(mode, limit)
+
+
+def auto_reduction_stats() -> AutoReductionStats:
+    """Return the active mode and how often arithmetic results were reduced."""
+
+    state = _auto_reduction
+    return AutoReductionStats(
+        mode=state.mode,
+        limit=state.limit,
+        operations=state.operations,
+        reductions=state.reductions,
+    )
+
+
+def _auto_reduced(value: Rational) -> Rational:
+    """Apply the active automatic reduction to an arithmetic result."""
+
+    state = _auto_reduction
+    state.operations += 1
+    if state.mode == "never":
+        return value
+    limit = cast(int, state.limit)
+    if state.mode == "size":
+        # Cached depths give the representation size without a walk.
+        p, q = value.p, value.q
+        if int(p.a) + int(p.b) + int(q.a) + int(q.b) <= limit:
+            return value
+    elif state.operations % limit:
+        return value
+    state.reductions += 1
+    return value.reduction()
+
+
+def _compare_ratios(left: Rational, right: Rational) -> tuple[int, LogMessage]:
+    """Compare ``p/q`` with ``r/s`` by sign, then by continued-fraction terms.
+
+    The cached integer signs settle different signs and zero. Otherwise both
+    magnitudes are expanded in lockstep on the cached depths, one partial
+    quotient at a time. The first differing term decides, and the order flips
+    at every level because the tails are reciprocals. No natural number and
+    no cross product is built. The message lists the terms that were read.
+    """
+
+    sign = left.p._signum() * left.q._signum()
+    other_sign = right.p._signum() * right.q._signum()
+    if sign != other_sign or not sign:
+        result = (sign > other_sign) - (sign < other_sign)
+        return (
+            result,
+            lambda: (
+                f"compare(sign({left!r}), sign({right!r})) = "
+                f"compare({sign}, {other_sign})"
+            ),
+        )
+    m, n = abs(int(left.p)), abs(int(left.q))
+    u, v = abs(int(right.p)), abs(int(right.q))
+    left_terms: list[int] = []
+    right_terms: list[int] = []
+    order = sign
+    while True:
+        (i, x), (j, y) = divmod(m, n), divmod(u, v)
+        left_terms.append(i)
+        right_terms.append(j)
+        if i != j:
+            order *= 1 if i > j else -1
+            break
+        if not x or not y:
+            # An expansion that ends here is the smaller value at this level.
+            order *= (x > 0) - (y > 0)
+            break
+        m, n, u, v = n, x, v, y
+        order = -order
+    return (
+        order,
+        lambda: (
+            f"{sign} · compare({_continued_fraction(left_terms)}, "
+            f"{_continued_fraction(right_terms)})"
+        ),
+    )
+
+
+def _continued_fraction(terms: list[int]) -> str:
+    head, *tail = terms
+    return f"[{head}; {', '.join(map(str, tail))}]" if tail else f"[{head}]"
+
+
+def simplest_between(lower: Rational, upper: Rational) -> Rational:
+    """Return the simplest rational in the closed interval ``[lower, upper]``.
+
+    The simplest rational has the smallest denominator, and among those the
+    smallest absolute numerator. It is found by descending the Stern–Brocot
+    tree: both endpoints share continued-fraction terms until they diverge,
+    and the smallest integer between the diverging terms ends the expansion.
+    """
+
+    if not isinstance(lower, Rational) or not isinstance(upper, Rational):
+        raise TypeError("simplest_between expects two Rational values")
+    ln, ld = lower.as_integer_ratio()
+    un, ud = upper.as_integer_ratio()
+    if ln * ud > un * ld:
+        raise ValueError("lower must be less than or equal to upper")
+    if ln <= 0 <= un:
+        return _from_ratio(0, 1)
+    if un < 0:
+        numerator, denominator = _simplest_positive(-un, ud, -ln, ld)
+        return _from_ratio(-numerator, denominator)
+    return _from_ratio(*_simplest_positive(ln, ld, un, ud))
+
+
+def _simplest_positive(ln: int, ld: int, un: int, ud: int) -> tuple[int, int]:
+    # Convergent recurrence for the shared terms of ln/ld and un/ud.
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        a = ln // ld
+        if a * ld == ln:
+            break
+        if (a + 1) * ud <= un:
+            a += 1
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q0 + a * q1
+        # Both ends lie in (a, a + 1); invert the fractional parts.
+        ln, ld, un, ud = ud, un - a * ud, ld, ln - a * ld
+    return p0 + a * p1, q0 + a * q1
 
 
 def rational(numerator: int, denominator: int) -> Rational:
@@ -260,7 +661,7 @@ def n2r(value: NaturalNumber) -> Rational:
 
     if not isinstance(value, NaturalNumber):
         raise TypeError("n2r expects a NaturalNumber")
-    return Rational(n2z(value), Z_ONE)
+    return _new_rational(n2z(value), Z_ONE, reduced=True)
 
 
 def z2r(value: Integer) -> Rational:
@@ -268,17 +669,43 @@ def z2r(value: Integer) -> Rational:
 
     if not isinstance(value, Integer):
         raise TypeError("z2r expects an Integer")
-    return Rational(value, Z_ONE)
+    return _new_rational(value, Z_ONE, reduced=not (value.a and value.b))
+
+
+def _from_ratio(numerator: int, denominator: int) -> Rational:
+    """Build a Rational from a reduced Python ratio with ``denominator > 0``."""
+
+    return _new_rational(integer(numerator), integer(denominator), reduced=True)
+
+
+def _new_rational(p: Integer, q: Integer, *, reduced: bool = False) -> Rational:
+    """Build a result whose denominator is known to be a nonzero ``Integer``.
+
+    This skips the Peano comparison ``q == 0`` of the public constructor.
+    Pass ``reduced=True`` only for normal components with ``q > 0`` and no
+    common factor.
+    """
+
+    value = object.__new__(Rational)
+    object.__setattr__(value, "p", p)
+    object.__setattr__(value, "q", q)
+    _clear_caches(value, reduced)
+    return value
+
+
+def _clear_caches(value: Rational, reduced: bool) -> None:
+    object.__setattr__(value, "_is_reduced", reduced)
+    object.__setattr__(value, "_reduction", None)
+    object.__setattr__(value, "_hash", None)
 
 
 def _coerce_rational(value: object) -> Rational | None:
-    if isinstance(value, NaturalNumber):
-        return n2r(value)
-    if isinstance(value, Integer):
-        return z2r(value)
     if isinstance(value, Rational):
         return value
-    return None
+    converted = _coerce_integer(value)
+    if converted is None:
+        return None
+    return z2r(converted)
 
 
 def cast2r(value: object) -> Rational:
@@ -0,0 +1,165 @@
+"""Serialize numeric-tower values to a compact, versioned binary format."""
+
+from __future__ import annotations
+
+from math import gcd
+
+from .integer import Integer
+from .natural_number import BinaryNatural, NaturalNumber, binary_natural, natural_number
+from .polynomial import Polynomial, _common_denominator, _new_polynomial
+from .rational import Rational
+
+MAGIC = b"PEANO"
+VERSION = 1
+
+Value = NaturalNumber | BinaryNatural | Integer | Rational | Polynomial
+
+# Natural numbers are written as successor counts, so a value of any size
+# costs a few bytes and loading never walks or recurses through its chain.
+# Integer and Rational keep their representatives: (a, b) and (p, q) are
+# stored as given rather than normalized.
+_NATURAL = ord("N")
+_BINARY = ord("B")
+_INTEGER = ord("Z")
+_RATIONAL = ord("Q")
+_POLYNOMIAL = ord("P")
+
+
+def dumps(value: Value) -> bytes:
+    """Encode a tower value as ``MAGIC``, ``VERSION`` and a tagged payload."""
+
+    buffer = bytearray(MAGIC)
+    buffer.append(VERSION)
+    _write_value(buffer, value)
+    return bytes(buffer)
+
+
+def loads(data: bytes) -> Value:
+    """Decode a value written by :func:`dumps`."""
+
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError("loads expects a bytes-like object")
+    view = memoryview(data)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("data does not start with the peano format marker")
+    if len(view) <= len(MAGIC):
+        raise ValueError("data ends before the format version")
+    version = view[len(MAGIC)]
+    if version != VERSION:
+        raise ValueError(f"unsupported format version {version}")
+    reader = _Reader(view, len(MAGIC) + 1)
+    value = reader.value()
+    if reader.position != len(view):
+        raise ValueError("unexpected data after the encoded value")
+    return value
+
+
+def _write_value(buffer: bytearray, value: Value) -> None:
+    if isinstance(value, NaturalNumber):
+        buffer.append(_NATURAL)
+        _write_count(buffer, int(value))
+    elif isinstance(value, BinaryNatural):
+        buffer.append(_BINARY)
+        _write_count(buffer, int(value))
+    elif isinstance(value, Integer):
+        buffer.append(_INTEGER)
+        _write_integer(buffer, value)
+    elif isinstance(value, Rational):
+        buffer.append(_RATIONAL)
+        _write_integer(buffer, value.p)
+        _write_integer(buffer, value.q)
+    elif isinstance(value, Polynomial):
+        buffer.append(_POLYNOMIAL)
+        # Write the reduced coefficients from the integer array, so the
+        # Rational coefficients are never built.
+        denominator = value._denominator
+        _write_count(buffer, len(value._numerators))
+        for numerator in value._numerators:
+            common = gcd(numerator, denominator)
+            _write_int(buffer, numerator // common)
+            _write_int(buffer, denominator // common)
+    else:
+        raise TypeError(f"{value!r} is not a numeric-tower value")
+
+
+def _write_integer(buffer: bytearray, value: Integer) -> None:
+    _write_count(buffer, int(value.a))
+    _write_count(buffer, int(value.b))
+
+
+def _write_int(buffer: bytearray, value: int) -> None:
+    """Append ``value`` as the canonical pair of :func:`peano.integer.integer`."""
+
+    _write_count(buffer, max(value, 0))
+    _write_count(buffer, max(-value, 0))
+
+
+def _write_count(buffer: bytearray, count: int) -> None:
+    """Append an unsigned LEB128 integer."""
+
+    while True:
+        byte = count & 0x7F
+        count >>= 7
+        if count:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+
+class _Reader:
+    __slots__ = ("view", "position")
+
+    def __init__(self, view: memoryview, position: int) -> None:
+        self.view = view
+        self.position = position
+
+    def value(self) -> Value:
+        tag = self.byte()
+        if tag == _NATURAL:
+            return natural_number(self.count())
+        if tag == _BINARY:
+            return binary_natural(self.count())
+        if tag == _INTEGER:
+            return self.integer()
+        if tag == _RATIONAL:
+            return self.rational()
+        if tag == _POLYNOMIAL:
+            ratios = [self.ratio() for _ in range(self.count())] or [(0, 1)]
+            return _new_polynomial(*_common_denominator(ratios))
+        raise ValueError(f"unknown value tag {tag!r}")
+
+    def rational(self) -> Rational:
+        return Rational(self.integer(), self.integer())
+
+    def ratio(self) -> tuple[int, int]:
+        """Read a rational as a reduced Python ratio with a positive denominator."""
+
+        numerator = self.count() - self.count()
+        denominator = self.count() - self.count()
+        if not denominator:
+            raise ZeroDivisionError("the denominator cannot be zero")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        common = gcd(numerator, denominator)
+        return numerator // common, denominator // common
+
+    def integer(self) -> Integer:
+        return Integer(natural_number(self.count()), natural_number(self.count()))
+
+    def count(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def byte(self) -> int:
+        if self.position >= len(self.view):
+            raise ValueError("data ends in the middle of a value")
+        byte = self.view[self.position]
+        self.position += 1
+        return byte
@@ -62,6 +62,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[addition: recursive]",
         "multiplication.base": "[multiplication: base]",
         "multiplication.recursive": "[multiplication: recursive]",
+        "division.base": "[division: base]",
+        "division.doubling": "[division: doubling]",
+        "power.base": "[power: base]",
+        "power.even": "[power: even exponent]",
+        "power.odd": "[power: odd exponent]",
+        "gcd.zero": "[gcd: zero case]",
+        "gcd.both_even": "[gcd: both even]",
+        "gcd.one_even": "[gcd: one even]",
+        "gcd.both_odd": "[gcd: both odd]",
         "truncated": (
             "…Log output was truncated after {max_lines} lines. "
             "Use smaller inputs and run the cell again."
@@ -75,6 +84,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[加法・再帰]",
         "multiplication.base": "[乗法・基底]",
         "multiplication.recursive": "[乗法・再帰]",
+        "division.base": "[除法・基底]",
+        "division.doubling": "[除法・倍加]",
+        "power.base": "[累乗・基底]",
+        "power.even": "[累乗・偶数の指数]",
+        "power.odd": "[累乗・奇数の指数]",
+        "gcd.zero": "[最大公約数・0の場合]",
+        "gcd.both_even": "[最大公約数・両方が偶数]",
+        "gcd.one_even": "[最大公約数・一方が偶数]",
+        "gcd.both_odd": "[最大公約数・両方が奇数]",
         "truncated": (
             "…ログは{max_lines}行で省略しました。入力を小さくして再実行してください。"
         ),
@@ -87,6 +105,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[加法：递归情形]",
         "multiplication.base": "[乘法：基础情形]",
         "multiplication.recursive": "[乘法：递归情形]",
+        "division.base": "[除法：基础情形]",
+        "division.doubling": "[除法：倍增情形]",
+        "power.base": "[幂：基础情形]",
+        "power.even": "[幂：偶数指数]",
+        "power.odd": "[幂：奇数指数]",
+        "gcd.zero": "[最大公约数：零情形]",
+        "gcd.both_even": "[最大公约数：两数皆偶]",
+        "gcd.one_even": "[最大公约数：一数为偶]",
+        "gcd.both_odd": "[最大公约数：两数皆奇]",
         "truncated": "…日志在{max_lines}行后截断。请减小输入后重新运行。",
         "midpoint_root": "{polynomial}：中点 {midpoint} 是根",
     },
@@ -97,6 +124,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[加法：遞迴情形]",
         "multiplication.base": "[乘法：基礎情形]",
         "multiplication.recursive": "[乘法：遞迴情形]",
+        "division.base": "[除法：基礎情形]",
+        "division.doubling": "[除法：倍增情形]",
+        "power.base": "[冪：基礎情形]",
+        "power.even": "[冪：偶數指數]",
+        "power.odd": "[冪：奇數指數]",
+        "gcd.zero": "[最大公因數：零情形]",
+        "gcd.both_even": "[最大公因數：兩數皆偶]",
+        "gcd.one_even": "[最大公因數：一數為偶]",
+        "gcd.both_odd": "[最大公因數：兩數皆奇]",
         "truncated": "…記錄在{max_lines}行後截斷。請縮小輸入後重新執行。",
         "midpoint_root": "{polynomial}：中點 {midpoint} 是根",
     },
@@ -107,6 +143,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[suma: caso recursivo]",
         "multiplication.base": "[multiplicación: caso base]",
         "multiplication.recursive": "[multiplicación: caso recursivo]",
+        "division.base": "[división: caso base]",
+        "division.doubling": "[división: caso de duplicación]",
+        "power.base": "[potencia: caso base]",
+        "power.even": "[potencia: exponente par]",
+        "power.odd": "[potencia: exponente impar]",
+        "gcd.zero": "[mcd: caso cero]",
+        "gcd.both_even": "[mcd: ambos pares]",
+        "gcd.one_even": "[mcd: uno par]",
+        "gcd.both_odd": "[mcd: ambos impares]",
         "truncated": (
             "…El registro se truncó tras {max_lines} líneas. "
             "Reduce la entrada y vuelve a ejecutar."
@@ -120,6 +165,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[adição: caso recursivo]",
         "multiplication.base": "[multiplicação: caso base]",
         "multiplication.recursive": "[multiplicação: caso recursivo]",
+        "division.base": "[divisão: caso base]",
+        "division.doubling": "[divisão: caso de duplicação]",
+        "power.base": "[potência: caso base]",
+        "power.even": "[potência: expoente par]",
+        "power.odd": "[potência: expoente ímpar]",
+        "gcd.zero": "[mdc: caso zero]",
+        "gcd.both_even": "[mdc: ambos pares]",
+        "gcd.one_even": "[mdc: um par]",
+        "gcd.both_odd": "[mdc: ambos ímpares]",
         "truncated": (
             "…O log foi truncado após {max_lines} linhas. "
             "Reduza a entrada e execute novamente."
@@ -133,6 +187,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[addition : cas récursif]",
         "multiplication.base": "[multiplication : cas de base]",
         "multiplication.recursive": "[multiplication : cas récursif]",
+        "division.base": "[division : cas de base]",
+        "division.doubling": "[division : cas de doublement]",
+        "power.base": "[puissance : cas de base]",
+        "power.even": "[puissance : exposant pair]",
+        "power.odd": "[puissance : exposant impair]",
+        "gcd.zero": "[pgcd : cas zéro]",
+        "gcd.both_even": "[pgcd : deux pairs]",
+        "gcd.one_even": "[pgcd : un pair]",
+        "gcd.both_odd": "[pgcd : deux impairs]",
         "truncated": (
             "…Le journal a été tronqué après {max_lines} lignes. "
             "Réduisez les entrées et relancez."
@@ -146,6 +209,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[Addition: Rekursionsfall]",
         "multiplication.base": "[Multiplikation: Basisfall]",
         "multiplication.recursive": "[Multiplikation: Rekursionsfall]",
+        "division.base": "[Division: Basisfall]",
+        "division.doubling": "[Division: Verdopplungsfall]",
+        "power.base": "[Potenz: Basisfall]",
+        "power.even": "[Potenz: gerader Exponent]",
+        "power.odd": "[Potenz: ungerader Exponent]",
+        "gcd.zero": "[ggT: Nullfall]",
+        "gcd.both_even": "[ggT: beide gerade]",
+        "gcd.one_even": "[ggT: eine gerade]",
+        "gcd.both_odd": "[ggT: beide ungerade]",
         "truncated": (
             "…Die Protokollausgabe wurde nach {max_lines} Zeilen gekürzt. "
             "Verkleinern Sie die Eingaben und führen Sie die Zelle erneut aus."
@@ -159,6 +231,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[덧셈: 재귀 경우]",
         "multiplication.base": "[곱셈: 기저 경우]",
         "multiplication.recursive": "[곱셈: 재귀 경우]",
+        "division.base": "[나눗셈: 기저 경우]",
+        "division.doubling": "[나눗셈: 배가 경우]",
+        "power.base": "[거듭제곱: 기저 경우]",
+        "power.even": "[거듭제곱: 짝수 지수]",
+        "power.odd": "[거듭제곱: 홀수 지수]",
+        "gcd.zero": "[최대공약수: 0인 경우]",
+        "gcd.both_even": "[최대공약수: 둘 다 짝수]",
+        "gcd.one_even": "[최대공약수: 하나만 짝수]",
+        "gcd.both_odd": "[최대공약수: 둘 다 홀수]",
         "truncated": (
             "…로그를 {max_lines}줄에서 줄였습니다. 입력을 작게 바꾸고 다시 실행하세요."
         ),
@@ -171,6 +252,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[сложение: рекурсивный случай]",
         "multiplication.base": "[умножение: базовый случай]",
         "multiplication.recursive": "[умножение: рекурсивный случай]",
+        "division.base": "[деление: базовый случай]",
+        "division.doubling": "[деление: случай удвоения]",
+        "power.base": "[степень: базовый случай]",
+        "power.even": "[степень: чётный показатель]",
+        "power.odd": "[степень: нечётный показатель]",
+        "gcd.zero": "[НОД: случай нуля]",
+        "gcd.both_even": "[НОД: оба чётные]",
+        "gcd.one_even": "[НОД: одно чётное]",
+        "gcd.both_odd": "[НОД: оба нечётные]",
         "truncated": (
             "…Журнал обрезан после {max_lines} строк. "
             "Уменьшите входные данные и запустите ячейку снова."
@@ -184,6 +274,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[الجمع: الحالة العودية]",
         "multiplication.base": "[الضرب: الحالة الأساسية]",
         "multiplication.recursive": "[الضرب: الحالة العودية]",
+        "division.base": "[القسمة: الحالة الأساسية]",
+        "division.doubling": "[القسمة: حالة المضاعفة]",
+        "power.base": "[القوة: الحالة الأساسية]",
+        "power.even": "[القوة: أس زوجي]",
+        "power.odd": "[القوة: أس فردي]",
+        "gcd.zero": "[القاسم المشترك الأكبر: حالة الصفر]",
+        "gcd.both_even": "[القاسم المشترك الأكبر: كلاهما زوجي]",
+        "gcd.one_even": "[القاسم المشترك الأكبر: أحدهما زوجي]",
+        "gcd.both_odd": "[القاسم المشترك الأكبر: كلاهما فردي]",
         "truncated": (
             "…اختُصر السجل بعد {max_lines} سطرًا. صغّر المدخلات ثم شغّل الخلية من جديد."
         ),
@@ -196,6 +295,15 @@ _MESSAGES: dict[Locale, dict[str, str]] = {
         "addition.recursive": "[जोड़: पुनरावर्ती स्थिति]",
         "multiplication.base": "[गुणा: आधार स्थिति]",
         "multiplication.recursive": "[गुणा: पुनरावर्ती स्थिति]",
+        "division.base": "[भाग: आधार स्थिति]",
+        "division.doubling": "[भाग: दोगुना करने की स्थिति]",
+        "power.base": "[घात: आधार स्थिति]",
+        "power.even": "[घात: सम घातांक]",
+        "power.odd": "[घात: विषम घातांक]",
+        "gcd.zero": "[महत्तम समापवर्तक: शून्य स्थिति]",
+        "gcd.both_even": "[महत्तम समापवर्तक: दोनों सम]",
+        "gcd.one_even": "[महत्तम समापवर्तक: एक सम]",
+        "gcd.both_odd": "[महत्तम समापवर्तक: दोनों विषम]",
         "truncated": (
             "…लॉग {max_lines} पंक्तियों के बाद छोटा कर दिया गया। इनपुट घटाकर सेल फिर चलाएँ।"
         ),
@@ -254,6 +362,13 @@ class _LineLimitFilter(Filter):
         return False
 
 
+def emit(log_level: int, message: LogMessage) -> None:
+    """Log one formula, rendering callable messages only when enabled."""
+
+    if logger.isEnabledFor(log_level):
+        logger.log(log_level, message if isinstance(message, str) else message())
+
+
 def log(
     log_level: int,
 ) -> Callable[[Callable[P, tuple[T, LogMessage]]], Callable[P, T]]:
@@ -268,10 +383,7 @@ def log(
         @wraps(func)
         def inner(*args: P.args, **kwargs: P.kwargs) -> T:
             result, message = func(*args, **kwargs)
-            if logger.isEnabledFor(log_level):
-                logger.log(
-                    log_level, message if isinstance(message, str) else message()
-                )
+            emit(log_level, message)
             return result
 
         public_return = _public_return_annotation(
@@ -0,0 +1,85 @@
+"""Measure what validating constructors cost per arithmetic result.
+
+Arithmetic builds its results with trusted internal constructors. The first
+table compares them with the public, validating constructors; the second
+shows how large that saving is relative to whole operations.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable
+
+from peano import integer, natural_number, polynomial, rational
+from peano.integer import Integer, _new_integer
+from peano.natural_number import NaturalNumber, _intern
+from peano.polynomial import Polynomial, _new_polynomial
+from peano.rational import Rational, _new_rational
+
+CALLS = 2_000
+REPEATS = 5
+
+
+def per_call(function: Callable[[], object]) -> float:
+    """Return the best time per call in nanoseconds."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = perf_counter()
+        for _ in range(CALLS):
+            function()
+        best = min(best, perf_counter() - start)
+    return best / CALLS * 1e9
+
+
+def main() -> None:
+    n = natural_number(7)
+    a, b = natural_number(12), natural_number(5)
+    p, q = integer(-12), integer(35)
+    value = polynomial((1, 2), (-3, 4), (5, 1))
+    coefficients = value.coefficients
+
+    constructors = {
+        "Natural": (lambda: NaturalNumber(n), lambda: _intern(n)),
+        "Integer": (lambda: Integer(a, b), lambda: _new_integer(a, b)),
+        "Rational": (lambda: Rational(p, q), lambda: _new_rational(p, q)),
+        "Polynomial": (
+            lambda: Polynomial(*coefficients),
+            lambda: _new_polynomial(value._numerators, value._denominator),
+        ),
+    }
+    saving: dict[str, float] = {}
+    print("Construction cost per value")
+    for name, (public, trusted) in constructors.items():
+        checked, unchecked = per_call(public), per_call(trusted)
+        saving[name] = checked - unchecked
+        print(
+            f"  {name:<11} public {checked:>9,.0f} ns   trusted {unchecked:>9,.0f} ns"
+            f"   x{checked / unchecked:,.1f}"
+        )
+
+    x, y = rational(-12, 35), rational(7, 9)
+    left, right = polynomial((1, 2), (3, 1)), polynomial((-1, 1), (1, 3))
+    operations: dict[str, tuple[str, int, Callable[[], object]]] = {
+        "Z + Z": ("Integer", 1, lambda: p + q),
+        "Z * Z": ("Integer", 1, lambda: p * q),
+        "-N": ("Integer", 1, lambda: -n),
+        "N / N": ("Rational", 1, lambda: a / n),
+        "Q + Q": ("Rational", 1, lambda: x + y),
+        "Q * Q": ("Rational", 1, lambda: x * y),
+        "-P": ("Polynomial", 1, lambda: -left),
+        "P * P": ("Polynomial", 1, lambda: left * right),
+    }
+    print("Validation avoided per operation")
+    for name, (kind, results, operation) in operations.items():
+        cost = per_call(operation)
+        avoided = saving[kind] * results
+        print(
+            f"  {name:<11} {cost:>11,.0f} ns   avoided {avoided:>9,.0f} ns"
+            f"   ({avoided / (cost + avoided):.0%} of the validating cost)"
+        )
+    print(f"({CALLS:,} calls, best of {REPEATS})")
+
+
+if __name__ == "__main__":
+    main()
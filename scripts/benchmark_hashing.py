@@ -0,0 +1,77 @@
+"""Compare dict and set throughput for chain-walking and cached-depth hashes."""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable, Hashable
+
+from peano import Integer, NaturalNumber, integer, natural_number
+
+SIZES = (10, 100, 1000)
+KEYS = 200
+REPEATS = 5
+
+
+def walking_int(value: NaturalNumber) -> int:
+    """Count successors one node at a time, as ``int()`` did before caching."""
+
+    depth = 0
+    current = value
+    while current.pre is not None:
+        depth += 1
+        current = current.pre
+    return depth
+
+
+class WalkingKey:
+    """Wrap a value so hashing walks its chains like the previous release."""
+
+    __slots__ = ("value", "components")
+
+    def __init__(self, value: NaturalNumber | Integer) -> None:
+        self.value = value
+        if isinstance(value, NaturalNumber):
+            self.components: tuple[NaturalNumber, ...] = (value,)
+        else:
+            self.components = (value.a, value.b)
+
+    def __hash__(self) -> int:
+        return hash(tuple(walking_int(component) for component in self.components))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, WalkingKey) and self.value is other.value
+
+
+def throughput(keys: list[Hashable]) -> float:
+    """Return dict/set operations per second for inserting and finding keys."""
+
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = perf_counter()
+        table = {key: index for index, key in enumerate(keys)}
+        members = set(keys)
+        for key in keys:
+            _ = table[key]
+            _ = key in members
+        best = min(best, perf_counter() - start)
+    return 4 * len(keys) / best
+
+
+def measure(name: str, build: Callable[[int, int], NaturalNumber | Integer]) -> None:
+    for size in SIZES:
+        values = [build(size, index) for index in range(KEYS)]
+        walking = throughput([WalkingKey(value) for value in values])
+        cached = throughput(values)
+        print(
+            f"{name:<14} n={size:<5} walking {walking:>12,.0f} ops/s   "
+            f"cached {cached:>12,.0f} ops/s   x{cached / walking:,.1f}"
+        )
+
+
+def main() -> None:
+    measure("NaturalNumber", lambda size, index: natural_number(size + index))
+    measure("Integer", lambda size, index: integer(size + index))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Find the crossovers between the polynomial multiplication algorithms.
+
+``Polynomial`` multiplies integer numerator arrays with a schoolbook double
+loop, with Karatsuba's three-product split, or by Kronecker substitution,
+which packs each array into one big int and multiplies once. Kronecker pads
+every coefficient to the widest product slot, so the tables compare uniform
+coefficient sizes, sizes that grow along the array, and one huge coefficient
+among small ones. The ``padding`` column is the packed size divided by the
+bits actually stored. Both tables feed the thresholds in
+``peano/polynomial.py``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+from time import perf_counter
+from typing import Callable
+
+from peano.polynomial import (
+    _coefficient_bits,
+    _convolve,
+    _karatsuba,
+    _kronecker,
+    _schoolbook,
+)
+
+# ``peano.polynomial`` is shadowed by the constructor of the same name.
+module = importlib.import_module("peano.polynomial")
+
+LENGTHS = (4, 8, 16, 32, 64, 128)
+BITS = (8, 512, 4096)
+CUTOFFS = (8, 16, 32, 64, 128)
+REPEATS = 5
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """Return the best time of one call in microseconds."""
+
+    calls, elapsed = 1, 0.0
+    while elapsed < 0.01:
+        start = perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = perf_counter() - start
+        calls *= 2
+    calls //= 2
+    best = elapsed
+    for _ in range(REPEATS - 1):
+        start = perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, perf_counter() - start)
+    return best / calls * 1e6
+
+
+def numerators(profile: str, length: int, bits: int, seed: int) -> tuple[int, ...]:
+    generator = random.Random(seed)
+    if profile == "uniform":
+        sizes = [bits] * length
+    elif profile == "ramp":
+        sizes = [max(1, bits * (i + 1) // length) for i in range(length)]
+    else:
+        sizes = [8] * length
+        sizes[generator.randrange(length)] = bits
+    return tuple(generator.randrange(-(1 << size), 1 << size) or 1 for size in sizes)
+
+
+def padding(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    packed = _coefficient_bits(left, right) * (len(left) + len(right))
+    return packed / sum(value.bit_length() + 1 for value in left + right)
+
+
+def main() -> None:
+    print("Microseconds per product (fastest marked with *)")
+    print(
+        f"  {'profile':<8} {'length':>6} {'bits':>5} {'padding':>8}"
+        f" {'schoolbook':>12} {'karatsuba':>12} {'kronecker':>12} {'dispatch':>12}"
+    )
+    for profile in ("uniform", "ramp", "skewed"):
+        for length in LENGTHS:
+            for bits in BITS:
+                left = numerators(profile, length, bits, 1)
+                right = numerators(profile, length, bits, 2)
+                width = _coefficient_bits(left, right)
+                times = {
+                    "schoolbook": best_time(lambda: _schoolbook(left, right)),
+                    "karatsuba": best_time(lambda: _karatsuba(left, right)),
+                    "kronecker": best_time(lambda: _kronecker(left, right, width)),
+                }
+                fastest = min(times, key=times.__getitem__)
+                cells = " ".join(
+                    f"{value:>11,.1f}{'*' if name == fastest else ' '}"
+                    for name, value in times.items()
+                )
+                dispatch = best_time(lambda: _convolve(left, right))
+                print(
+                    f"  {profile:<8} {length:>6} {bits:>5}"
+                    f" {padding(left, right):>8.1f} {cells} {dispatch:>12,.1f}"
+                )
+
+    print("Karatsuba cutoff at length 256 (microseconds per product)")
+    saved = module._KARATSUBA_LENGTH
+    try:
+        for profile in ("uniform", "skewed"):
+            for bits in BITS:
+                left = numerators(profile, 256, bits, 3)
+                right = numerators(profile, 256, bits, 4)
+                cells = []
+                for cutoff in CUTOFFS:
+                    module._KARATSUBA_LENGTH = cutoff
+                    cost = best_time(lambda: _karatsuba(left, right))
+                    cells.append(f"{cutoff}: {cost:>9,.0f}")
+                print(f"  {profile:<8} {bits:>5} bits  " + "  ".join(cells))
+    finally:
+        module._KARATSUBA_LENGTH = saved
+    print(f"(best of {REPEATS})")
+
+
+if __name__ == "__main__":
+    main()
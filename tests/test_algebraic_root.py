@@ -7,8 +7,11 @@ from peano import (
     Polynomial,
     RationalInterval,
     algebraic_root,
+    config_polynomial_cache,
     count_real_roots,
     natural_number,
+    polynomial,
+    polynomial_cache_stats,
     rational,
     sturm_sequence,
 )
@@ -92,6 +95,27 @@ class TestAlgebraicRoot(unittest.TestCase):
         self.assertEqual(approximation.upper.as_integer_ratio(), (363, 256))
         self.assertEqual(approximation.width.as_integer_ratio(), (1, 256))
 
+    def test_simplest_split_keeps_endpoints_small(self) -> None:
+        root = algebraic_root(self.sqrt_two_polynomial, (1, 1), (2, 1))
+
+        intervals = root.trace(6, split="simplest")
+        approximation = root.approximate(20, split="simplest")
+
+        self.assertEqual(
+            [interval.upper.as_integer_ratio() for interval in intervals[-3:]],
+            [(10, 7), (17, 12), (17, 12)],
+        )
+        self.assertEqual(intervals[-1].lower.as_integer_ratio(), (24, 17))
+        self.assertLess(self.sqrt_two_polynomial.sign_at(approximation.lower), 0)
+        self.assertGreater(self.sqrt_two_polynomial.sign_at(approximation.upper), 0)
+        self.assertLess(approximation.width, rational(1, 2**20))
+        self.assertLess(int(approximation.upper.q), 2**14)
+
+    def test_unknown_split_is_rejected(self) -> None:
+        root = algebraic_root(self.sqrt_two_polynomial, (1, 1), (2, 1))
+        with self.assertRaises(ValueError):
+            root.approximate(1, split="golden")  # ty: ignore[invalid-argument-type]
+
     def test_exact_midpoint_root_becomes_point_interval(self) -> None:
         identity = Polynomial(Q_ZERO, Q_ONE)
         root = algebraic_root(identity, (-1, 1), (1, 1))
@@ -129,6 +153,19 @@ class TestAlgebraicRoot(unittest.TestCase):
         with self.assertRaises(TypeError):
             root.approximate(1.5)  # ty: ignore[invalid-argument-type]
 
+    def test_roots_of_one_polynomial_share_a_sturm_chain(self) -> None:
+        self.addCleanup(config_polynomial_cache)
+        config_polynomial_cache()
+        value = polynomial((1, 1))
+        for i in range(10):
+            value = value * polynomial((-2 * i - 1, 2), (1, 1))
+        roots = [
+            algebraic_root(value, (i, 1), (i + 1, 1)).approximate(3) for i in range(10)
+        ]
+        self.assertEqual(len(roots), 10)
+        stats = polynomial_cache_stats()
+        self.assertEqual((stats.misses, stats.hits, stats.size), (1, 9, 1))
+
 
 if __name__ == "__main__":
     unittest.main()
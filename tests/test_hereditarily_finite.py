@@ -0,0 +1,69 @@
+import unittest
+
+from peano import HereditarilyFiniteSet, natural_number
+
+EMPTY = HereditarilyFiniteSet(0)
+
+
+class TestHereditarilyFiniteSet(unittest.TestCase):
+    def test_ordinals_match_the_frozenset_view(self) -> None:
+        for n in range(6):
+            ordinal = HereditarilyFiniteSet.ordinal(natural_number(n))
+            self.assertEqual(ordinal.to_frozenset(), natural_number(n).set_repr())
+            self.assertEqual(
+                HereditarilyFiniteSet.from_frozenset(natural_number(n).set_repr()),
+                ordinal,
+            )
+            self.assertEqual(len(ordinal), n)
+        self.assertEqual(
+            [HereditarilyFiniteSet.ordinal(n).code for n in range(5)],
+            [0, 1, 3, 11, 2059],
+        )
+        with self.assertRaises(OverflowError):
+            HereditarilyFiniteSet.ordinal(6)
+
+    def test_membership_and_inclusion_are_bit_tests(self) -> None:
+        two = HereditarilyFiniteSet.ordinal(2)
+        three = HereditarilyFiniteSet.ordinal(3)
+        self.assertIn(two, three)
+        self.assertNotIn(three, two)
+        self.assertNotIn(2, three)
+        self.assertTrue(two < three)
+        self.assertTrue(two <= two)
+        self.assertFalse(two < two)
+        self.assertTrue(three >= two)
+        self.assertTrue(two.issubset(three))
+        self.assertFalse(three.issubset(two))
+
+    def test_set_algebra_matches_frozenset(self) -> None:
+        values = [HereditarilyFiniteSet(code) for code in range(64)]
+        for left in values:
+            for right in values:
+                a, b = left.to_frozenset(), right.to_frozenset()
+                self.assertEqual((left | right).to_frozenset(), a | b)
+                self.assertEqual((left & right).to_frozenset(), a & b)
+                self.assertEqual((left - right).to_frozenset(), a - b)
+                self.assertEqual((left ^ right).to_frozenset(), a ^ b)
+                self.assertEqual(left <= right, a <= b)
+                self.assertEqual(left < right, a < b)
+
+    def test_adjoin_iteration_and_str(self) -> None:
+        one = EMPTY.adjoin(EMPTY)
+        pair = one.adjoin(one)
+        self.assertEqual(pair, HereditarilyFiniteSet.ordinal(2))
+        self.assertEqual(list(pair), [EMPTY, one])
+        self.assertEqual(str(pair), "{{}, {{}}}")
+        self.assertEqual(repr(pair), "<HF(3)>")
+        self.assertFalse(EMPTY)
+
+    def test_invalid_values(self) -> None:
+        with self.assertRaises(ValueError):
+            HereditarilyFiniteSet(-1)
+        with self.assertRaises(TypeError):
+            HereditarilyFiniteSet(True)
+        with self.assertRaises(TypeError):
+            HereditarilyFiniteSet.from_frozenset(frozenset((1,)))  # ty: ignore[invalid-argument-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
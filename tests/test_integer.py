@@ -1,7 +1,20 @@
+import dataclasses
+import math
+import pickle
 import unittest
 
-from peano.integer import Integer, integer
+from peano.integer import (
+    Integer,
+    config_normalization,
+    extended_gcd,
+    gcd,
+    integer,
+    lcm,
+    normalization,
+    normalization_policy,
+)
 from peano.natural_number import natural_number
+from peano.rational import rational
 
 
 class TestInteger(unittest.TestCase):
@@ -22,7 +35,6 @@ class TestInteger(unittest.TestCase):
             for j in range(-5, 5):
                 self.assertEqual(integer(i) * integer(j), integer(i * j))
 
-    @unittest.skip("too slow")
     def test_bigmul(self) -> None:
         self.assertEqual(integer(100) * integer(100), integer(100 * 100))
 
@@ -36,6 +48,96 @@ class TestInteger(unittest.TestCase):
             for j in range(-5, 5):
                 self.assertEqual(integer(i) < integer(j), i < j)
 
+    def test_compare(self) -> None:
+        for i in range(-3, 4):
+            for j in range(-3, 4):
+                # Shifted representatives must compare like their values.
+                left = Integer(natural_number(i + 3), natural_number(3))
+                right = Integer(natural_number(4), natural_number(4 - j))
+                self.assertEqual(left.compare(right), (i > j) - (i < j))
+                self.assertEqual(left > right, i > j)
+                self.assertEqual(left >= right, i >= j)
+        self.assertEqual(integer(-1).compare(natural_number(0)), -1)
+
+    def test_compare_walks_every_component_order(self) -> None:
+        pairs = [(a, b) for a in range(4) for b in range(4)]
+        for a, b in pairs:
+            for c, d in pairs:
+                left = Integer(natural_number(a), natural_number(b))
+                right = Integer(natural_number(c), natural_number(d))
+                expected = (a - b > c - d) - (a - b < c - d)
+                self.assertEqual(left.compare(right), expected)
+                self.assertEqual(left == right, expected == 0)
+
+    def test_normalization_policy(self) -> None:
+        self.addCleanup(config_normalization)
+        left = Integer(natural_number(5), natural_number(2))
+        right = Integer(natural_number(1), natural_number(3))
+        self.assertEqual(repr(left * right), "<Z(11,17)>")
+        self.assertEqual(repr(left + right), "<Z(6,5)>")
+        config_normalization("always")
+        self.assertEqual(repr(left * right), "<Z(0,6)>")
+        self.assertEqual(repr(left - right), "<Z(5,0)>")
+        config_normalization("threshold", 10)
+        self.assertEqual(repr(left * right), "<Z(0,6)>")
+        self.assertEqual(repr(left + right), "<Z(6,5)>")
+
+    def test_normalization_context_restores_the_policy(self) -> None:
+        with normalization("always") as policy:
+            self.assertIs(normalization_policy(), policy)
+            total = rational(1, 2) + rational(-1, 3)
+            self.assertEqual(repr(total.p), "<Z(1,0)>")
+        self.assertEqual(normalization_policy().mode, "never")
+        self.assertEqual(repr((rational(1, 2) + rational(-1, 3)).p), "<Z(3,2)>")
+
+    def test_normalization_policy_is_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            config_normalization("sometimes")  # ty: ignore[invalid-argument-type]
+        with self.assertRaises(TypeError):
+            config_normalization("threshold")
+        with self.assertRaises(ValueError):
+            config_normalization("always", 3)
+        self.assertEqual(normalization_policy().mode, "never")
+
+    def test_sign_normal_form_and_hash_are_cached(self) -> None:
+        value = Integer(natural_number(3), natural_number(7))
+        normal = value.normalize()
+        self.assertEqual(repr(normal), "<Z(0,4)>")
+        self.assertIs(value.normalize(), normal)
+        self.assertIs(normal.normalize(), normal)
+        self.assertIs(abs(value), normal.b)
+        self.assertEqual(hash(value), hash(value))
+        self.assertEqual(hash(value), hash(integer(-4)))
+        self.assertTrue(value)
+        self.assertEqual(divmod(integer(7), value), (integer(-2), integer(-1)))
+
+    def test_caches_stay_out_of_the_dataclass_surface(self) -> None:
+        value = Integer(natural_number(2), natural_number(5))
+        value.normalize()
+        self.assertEqual(
+            [field.name for field in dataclasses.fields(value)], ["a", "b"]
+        )
+        copied = pickle.loads(pickle.dumps(value))
+        self.assertEqual(repr(copied), "<Z(2,5)>")
+        self.assertEqual(repr(copied.normalize()), "<Z(0,3)>")
+        self.assertEqual(
+            repr(dataclasses.replace(value, b=natural_number(1))), "<Z(2,1)>"
+        )
+
+    def test_gcd_and_lcm(self) -> None:
+        for i in range(-12, 13, 5):
+            for j in (-18, -7, 0, 4, 30):
+                self.assertEqual(int(gcd(integer(i), integer(j))), math.gcd(i, j))
+                self.assertEqual(int(lcm(integer(i), integer(j))), math.lcm(i, j))
+        self.assertEqual(gcd(natural_number(12), integer(-18)), integer(6))
+
+    def test_extended_gcd(self) -> None:
+        for i in (-35, 0, 12, 240):
+            for j in (-46, 0, 7, 18):
+                g, x, y = extended_gcd(integer(i), integer(j))
+                self.assertEqual(int(g), math.gcd(i, j))
+                self.assertEqual(i * int(x) + j * int(y), int(g))
+
     def test_sub(self) -> None:
         for i in range(-5, 5):
             for j in range(-5, 5):
@@ -92,6 +194,12 @@ class TestInteger(unittest.TestCase):
             for j in range(4):
                 self.assertEqual(integer(i) ** natural_number(j), integer(i**j))
 
+    def test_pow_by_squaring(self) -> None:
+        for exponent in (15, 16, 21):
+            self.assertEqual(
+                integer(-3) ** natural_number(exponent), integer((-3) ** exponent)
+            )
+
     def test_pos(self) -> None:
         for i in range(-30, 30):
             self.assertEqual(+integer(i), integer(+i))
@@ -1,6 +1,28 @@
+import copy
+import dataclasses
+import pickle
 import unittest
-
-from peano.natural_number import N_ZERO, NaturalNumber, natural_number, successor
+from itertools import islice
+from time import perf_counter
+
+from peano.integer import integer
+from peano.natural_number import (
+    _ORDINAL_CACHE_SIZE,
+    B_ZERO,
+    N_ZERO,
+    BinaryNatural,
+    NaturalNumber,
+    NaturalRange,
+    _ordinals,
+    binary_natural,
+    config_interning,
+    evaluation,
+    interning_stats,
+    natural_number,
+    successor,
+)
+from peano.polynomial import polynomial
+from peano.rational import rational
 
 
 class TestNaturalNumber(unittest.TestCase):
@@ -62,7 +84,6 @@ class TestNaturalNumber(unittest.TestCase):
                 m = natural_number(j)
                 self.assertEqual(n * successor(m), n + (n * m))
 
-    @unittest.skip("too slow")
     def test_bigmul(self) -> None:
         self.assertEqual(
             natural_number(100) * natural_number(100), natural_number(100 * 100)
@@ -78,6 +99,16 @@ class TestNaturalNumber(unittest.TestCase):
             for j in range(10):
                 self.assertEqual(natural_number(i) < natural_number(j), i < j)
 
+    def test_compare(self) -> None:
+        for i in range(6):
+            for j in range(6):
+                left, right = natural_number(i), natural_number(j)
+                self.assertEqual(left.compare(right), (i > j) - (i < j))
+                self.assertEqual(left > right, i > j)
+                self.assertEqual(left >= right, i >= j)
+        with self.assertRaises(TypeError):
+            natural_number(1).compare(1)  # ty: ignore[invalid-argument-type]
+
     def test_sub(self) -> None:
         for i in range(10):
             for j in range(i):
@@ -103,10 +134,34 @@ class TestNaturalNumber(unittest.TestCase):
                     natural_number(i) // natural_number(j), natural_number(i // j)
                 )
 
+    def test_divmod_of_large_operands(self) -> None:
+        self.assertEqual(
+            divmod(natural_number(10**9), natural_number(7)),
+            (natural_number(142857142), natural_number(6)),
+        )
+
     def test_bool(self) -> None:
         for i in range(20):
             self.assertEqual(bool(natural_number(i)), bool(i))
 
+    def test_bool_does_not_expand_the_chain(self) -> None:
+        config_interning()
+        n = natural_number(10**6)
+        size = interning_stats().size
+        self.assertTrue(n)
+        self.assertEqual(interning_stats().size, size)
+
+    def test_dataclass_surface_is_the_predecessor(self) -> None:
+        n = natural_number(5)
+        match n:
+            case NaturalNumber(predecessor):
+                self.assertEqual(predecessor, natural_number(4))
+        self.assertEqual([f.name for f in dataclasses.fields(n)], ["pre"])
+        self.assertEqual(dataclasses.replace(n), n)
+        self.assertEqual(
+            dataclasses.replace(n, pre=natural_number(9)), natural_number(10)
+        )
+
     def test_int(self) -> None:
         for i in range(20):
             self.assertEqual(int(natural_number(i)), int(i))
@@ -115,6 +170,10 @@ class TestNaturalNumber(unittest.TestCase):
         for i in range(20):
             self.assertEqual(hash(natural_number(i)), hash(i))
 
+    def test_index(self) -> None:
+        self.assertEqual(list(range(natural_number(3))), [0, 1, 2])
+        self.assertEqual("abc"[natural_number(1)], "b")
+
     def test_str(self) -> None:
         for i in range(20):
             self.assertEqual(str(natural_number(i)), str(i))
@@ -127,6 +186,20 @@ class TestNaturalNumber(unittest.TestCase):
             frozenset((frozenset(), frozenset((frozenset(),)))),
         )
 
+    def test_set_repr_is_memoized(self) -> None:
+        # Failure messages would print exponentially long nested sets.
+        ordinal = natural_number(300).set_repr()
+        self.assertTrue(natural_number(300).set_repr() is ordinal)
+        self.assertTrue(ordinal in natural_number(301).set_repr())
+        self.assertTrue(natural_number(299).set_repr() in ordinal)
+        self.assertEqual(len(ordinal), 300)
+
+    def test_set_repr_memo_is_bounded(self) -> None:
+        ordinal = natural_number(_ORDINAL_CACHE_SIZE + 2).set_repr()
+        self.assertEqual(len(_ordinals), _ORDINAL_CACHE_SIZE)
+        self.assertEqual(len(ordinal), _ORDINAL_CACHE_SIZE + 2)
+        self.assertTrue(_ordinals[-1] in ordinal)
+
     def test_set_str(self) -> None:
         self.assertEqual(natural_number(0).set_str(), "{}")
         self.assertEqual(natural_number(1).set_str(), "{{}}")
@@ -156,6 +229,9 @@ class TestNaturalNumber(unittest.TestCase):
                     natural_number(i) ** natural_number(j), natural_number(i**j)
                 )
 
+    def test_pow_of_large_exponents(self) -> None:
+        self.assertEqual(int(natural_number(3) ** natural_number(40)), 3**40)
+
     def test_pos(self) -> None:
         for i in range(30):
             self.assertEqual(+natural_number(i), natural_number(+i))
@@ -168,6 +244,272 @@ class TestNaturalNumber(unittest.TestCase):
         with self.assertRaises(ValueError):
             natural_number(-1)
 
+    def test_deep_operands_do_not_exhaust_the_call_stack(self) -> None:
+        n = natural_number(5000)
+        self.assertEqual(int(n + n), 10000)
+        self.assertEqual(n - natural_number(4999), natural_number(1))
+        self.assertTrue(natural_number(4999) < n <= n)
+        self.assertEqual(
+            divmod(n, natural_number(2000)), (natural_number(2), natural_number(1000))
+        )
+        # Multiplication always recurses on its right operand.
+        self.assertEqual(int(natural_number(3) * n), 15000)
+
+    def test_large_constants_expand_lazily(self) -> None:
+        n = natural_number(10**6)
+        self.assertEqual(int(n.pre), 10**6 - 1)
+        self.assertIs(n.pre, n.pre)
+        self.assertIs(NaturalNumber(n).pre, n)
+        self.assertEqual(n + n - n, n)
+        self.assertEqual(int(n - natural_number(10**6 - 3)), 3)
+        self.assertEqual(list(map(int, reversed(natural_number(3)))), [2, 1, 0])
+        with self.assertRaises(ValueError):
+            n - successor(n)
+
+    def test_evaluation_can_be_resumed(self) -> None:
+        steps = evaluation(natural_number(3), "*", natural_number(4))
+        self.assertEqual(len(list(islice(steps, 5))), 5)
+        self.assertFalse(steps.done)
+        self.assertFalse(steps.step(2))
+        self.assertEqual(steps.run(), natural_number(12))
+        self.assertTrue(steps.done)
+        self.assertEqual(list(steps), [])
+
+    def test_power_evaluation_steps_through_the_rules(self) -> None:
+        steps = evaluation(natural_number(2), "**", natural_number(5))
+        self.assertGreater(len(list(islice(steps, 5))), 1)
+        self.assertEqual(steps.run(), natural_number(32))
+
+    def test_untraced_products_run_the_doubling_rule(self) -> None:
+        steps = evaluation(natural_number(10**6), "*", natural_number(10**6))
+        # A few steps per binary digit of b, not b additions.
+        self.assertLess(sum(1 for _ in steps), 300)
+        self.assertEqual(steps.run(), natural_number(10**12))
+
+    def test_evaluation_rejects_unknown_operators(self) -> None:
+        with self.assertRaises(ValueError):
+            evaluation(N_ZERO, "/", N_ZERO)
+        with self.assertRaises(ValueError):
+            evaluation(N_ZERO, "-", natural_number(1)).run()
+
+    def test_iteration_is_linear(self) -> None:
+        values = list(natural_number(10000))
+        self.assertEqual(len(values), 10000)
+        self.assertEqual(values[-1], natural_number(9999))
+        self.assertIs(values[-1].pre, values[-2])
+
+
+class TestNaturalRange(unittest.TestCase):
+    def test_matches_python_range(self) -> None:
+        for start in range(4):
+            for stop in range(8):
+                for step in range(1, 4):
+                    view = NaturalRange(
+                        natural_number(start),
+                        natural_number(stop),
+                        natural_number(step),
+                    )
+                    expected = range(start, stop, step)
+                    self.assertEqual(len(view), len(expected))
+                    self.assertEqual([int(n) for n in view], list(expected))
+                    for i in range(-len(expected), len(expected)):
+                        self.assertEqual(int(view[i]), expected[i])
+                    for value in range(10):
+                        self.assertEqual(
+                            natural_number(value) in view, value in expected
+                        )
+
+    def test_large_ranges_are_constant_time(self) -> None:
+        view = NaturalRange(natural_number(10), natural_number(10**12))
+        self.assertEqual(len(view), 10**12 - 10)
+        self.assertIn(natural_number(10**11), view)
+        self.assertEqual(view[-1], natural_number(10**12 - 1))
+
+    def test_slices_match_python_range(self) -> None:
+        view = NaturalRange(natural_number(3), natural_number(20), natural_number(3))
+        expected = range(3, 20, 3)
+        for key in (
+            slice(None),
+            slice(1, None),
+            slice(None, -1),
+            slice(1, 5, 2),
+            slice(-3, None, 3),
+            slice(4, 1),
+            slice(10, 20),
+        ):
+            with self.subTest(key=key):
+                part = view[key]
+                self.assertIsInstance(part, NaturalRange)
+                self.assertEqual(list(map(int, part)), list(expected[key]))
+        huge = NaturalRange(N_ZERO, natural_number(10**12))[10**11 :: 7]
+        self.assertEqual(len(huge), len(range(10**11, 10**12, 7)))
+        with self.assertRaises(ValueError):
+            view[::-1]
+
+    def test_equality_matches_python_range(self) -> None:
+        bounds = [
+            (start, stop, step)
+            for start in range(4)
+            for stop in range(6)
+            for step in range(1, 4)
+        ]
+        for left in bounds:
+            for right in bounds:
+                views = [
+                    NaturalRange(*map(natural_number, bound)) for bound in (left, right)
+                ]
+                expected = range(*left) == range(*right)
+                self.assertEqual(views[0] == views[1], expected)
+                if expected:
+                    self.assertEqual(hash(views[0]), hash(views[1]))
+        empty = NaturalRange(natural_number(5), natural_number(2))
+        self.assertEqual(empty, NaturalRange(N_ZERO, N_ZERO)[3:1])
+        self.assertNotEqual(empty, range(0))
+
+    def test_elements_share_structure(self) -> None:
+        first, second, third = NaturalRange(N_ZERO, natural_number(3))
+        self.assertIs(second.pre, first)
+        self.assertIs(third.pre, second)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            NaturalRange(N_ZERO, natural_number(3), N_ZERO)
+        with self.assertRaises(IndexError):
+            NaturalRange(N_ZERO, N_ZERO)[0]
+        self.assertNotIn(1, NaturalRange(N_ZERO, natural_number(3)))
+
+
+class TestInterning(unittest.TestCase):
+    def tearDown(self) -> None:
+        config_interning()
+
+    def test_equal_chains_share_nodes(self) -> None:
+        config_interning()
+        n = natural_number(50)
+        self.assertIs(natural_number(50), n)
+        self.assertIs(NaturalNumber(n.pre), n)
+        before = interning_stats()
+        two = successor(successor(N_ZERO))
+        self.assertIs(successor(successor(N_ZERO)), two)
+        after = interning_stats()
+        self.assertGreater(after.hits, before.hits)
+        self.assertGreaterEqual(after.misses, before.misses)
+        self.assertGreaterEqual(after.size, before.size)
+
+    def test_interning_can_be_disabled(self) -> None:
+        config_interning(enabled=False)
+        n = natural_number(5)
+        self.assertIsNot(natural_number(5), n)
+        self.assertEqual(natural_number(5), n)
+        self.assertEqual(interning_stats().size, 0)
+
+    def test_table_is_bounded(self) -> None:
+        config_interning(max_size=10)
+        n = N_ZERO
+        for _ in range(100):
+            n = successor(n)
+        self.assertEqual(int(n), 100)
+        self.assertEqual(interning_stats().size, 10)
+        with self.assertRaises(ValueError):
+            config_interning(max_size=0)
+
+    def test_eviction_at_the_default_bound_is_constant_time(self) -> None:
+        config_interning()
+        n = N_ZERO
+        start = perf_counter()
+        for _ in range(200_000):
+            n = successor(n)
+        elapsed = perf_counter() - start
+        self.assertEqual(int(n), 200_000)
+        self.assertEqual(interning_stats().size, 1 << 16)
+        # Scanning past evicted slots made this quadratic; it now takes well
+        # under a second.
+        self.assertLess(elapsed, 5.0)
+
+    def test_copies_do_not_alias_canonical_zero(self) -> None:
+        n = natural_number(5)
+        self.assertEqual(copy.copy(n), n)
+        self.assertEqual(copy.deepcopy(n), n)
+        self.assertEqual(pickle.loads(pickle.dumps(n)), n)
+        self.assertIsNone(N_ZERO.pre)
+
+
+class TestBinaryNatural(unittest.TestCase):
+    def test_arithmetic_matches_int(self) -> None:
+        for i in range(12):
+            for j in range(12):
+                left, right = binary_natural(i), binary_natural(j)
+                self.assertEqual(int(left + right), i + j)
+                self.assertEqual(int(left * right), i * j)
+                self.assertEqual(left < right, i < j)
+                self.assertEqual(left <= right, i <= j)
+                self.assertEqual(left == right, i == j)
+                if i >= j:
+                    self.assertEqual(int(left - right), i - j)
+                if j:
+                    self.assertEqual(tuple(map(int, divmod(left, right))), divmod(i, j))
+        for i in range(5):
+            for j in range(5):
+                self.assertEqual(int(binary_natural(i) ** binary_natural(j)), i**j)
+
+    def test_large_operands(self) -> None:
+        left, right = 12345678901234567890, 9876543210987654321
+        self.assertEqual(
+            int(binary_natural(left) * binary_natural(right)), left * right
+        )
+        self.assertEqual(
+            tuple(map(int, divmod(binary_natural(left), binary_natural(right)))),
+            divmod(left, right),
+        )
+        self.assertEqual(int(binary_natural(3) ** binary_natural(100)), 3**100)
+
+    def test_long_operands_do_not_exhaust_the_call_stack(self) -> None:
+        ones = binary_natural(2**2000 - 1)
+        power = binary_natural(2**2000)
+        self.assertEqual(int(ones + ones), 2 * (2**2000 - 1))
+        self.assertTrue(power == binary_natural(2**2000))
+        self.assertEqual(int(power - ones), 1)
+        left, right = 3**500, 5**300
+        self.assertEqual(
+            int(binary_natural(left) * binary_natural(right)), left * right
+        )
+        self.assertEqual(
+            tuple(map(int, divmod(binary_natural(left), binary_natural(right)))),
+            divmod(left, right),
+        )
+        self.assertEqual(int(binary_natural(3) ** binary_natural(500)), 3**500)
+
+    def test_representation_is_canonical(self) -> None:
+        self.assertEqual(binary_natural(5).structural_str(), "O(D(O(0)))")
+        self.assertEqual(binary_natural(0), B_ZERO)
+        with self.assertRaises(ValueError):
+            BinaryNatural(B_ZERO, False)
+        with self.assertRaises(ValueError):
+            BinaryNatural(None, True)
+        with self.assertRaises(ValueError):
+            binary_natural(1) - binary_natural(2)
+
+    def test_conversion_to_and_from_unary(self) -> None:
+        for i in range(20):
+            unary = natural_number(i)
+            binary = binary_natural(unary)
+            self.assertEqual(binary.to_natural_number(), unary)
+            self.assertEqual(binary, unary)
+            self.assertEqual(unary, binary)
+            self.assertEqual(hash(binary), hash(unary))
+
+    def test_mixed_arithmetic_uses_the_numeric_tower(self) -> None:
+        self.assertIsInstance(natural_number(2) + binary_natural(3), BinaryNatural)
+        self.assertEqual(integer(-3) + binary_natural(5), integer(2))
+        self.assertEqual(binary_natural(5) - integer(7), integer(-2))
+        self.assertEqual(binary_natural(6) / natural_number(4), integer(3) / integer(2))
+
+    def test_binary_exponents(self) -> None:
+        self.assertEqual(natural_number(2) ** binary_natural(3), binary_natural(8))
+        self.assertEqual(integer(-2) ** binary_natural(3), integer(-8))
+        self.assertEqual(rational(1, 2) ** binary_natural(3), rational(1, 8))
+        self.assertEqual(polynomial((2, 1)) ** binary_natural(2), polynomial((4, 1)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,26 @@
+import dataclasses
+import random
 import unittest
+from math import comb
 
-from peano.polynomial import Polynomial
-from peano.rational import rational
+from peano.natural_number import natural_number
+from peano.polynomial import (
+    Polynomial,
+    _coefficient_bits,
+    _convolve,
+    _karatsuba,
+    _kronecker,
+    _schoolbook,
+    clear_polynomial_cache,
+    config_polynomial_cache,
+    count_real_roots,
+    polynomial,
+    polynomial_cache_stats,
+    sign_variations,
+    sturm_sequence,
+    subresultant_sturm_sequence,
+)
+from peano.rational import auto_reduction_stats, config_auto_reduction, rational
 
 
 class TestPolynomial(unittest.TestCase):
@@ -24,6 +43,170 @@ class TestPolynomial(unittest.TestCase):
             Polynomial(rational(1, 1), rational(2, 1), rational(1, 1)),
         )
 
+    def test_arithmetic_results_are_canonical(self) -> None:
+        left = Polynomial(rational(2, 4), rational(-3, 1), rational(6, -4))
+        right = Polynomial(rational(-1, 3), rational(0, 5), rational(1, 1))
+        for result in (left * right, -left, left + right):
+            rebuilt = Polynomial(*result.coefficients)
+            self.assertEqual(
+                [repr(c.p) + repr(c.q) for c in result.coefficients],
+                [repr(c.p) + repr(c.q) for c in rebuilt.coefficients],
+            )
+
+    def test_ring_operations_bypass_rational_arithmetic(self) -> None:
+        self.addCleanup(config_auto_reduction)
+        left = polynomial((1, 2), (-2, 3), (3, 4))
+        right = polynomial((5, 6), (0, 1), (-7, 8))
+        expected = left * right
+        for mode, limit in (("size", 16), ("every", 2)):
+            config_auto_reduction(mode, limit)
+            results = (left * right, left + right, divmod(left * right, right)[0])
+            self.assertEqual(
+                [str(c) for c in results[0].coefficients],
+                [str(c) for c in expected.coefficients],
+            )
+            self.assertEqual(results[2], left)
+            self.assertEqual(auto_reduction_stats().operations, 0)
+
+    def test_coefficients_are_built_on_first_access(self) -> None:
+        value = polynomial((1, 2), (-2, 3), (0, 1), (3, 4)) * polynomial((1, 1), (1, 1))
+        self.assertIsNone(value._coefficients)
+        self.assertEqual((value._numerators[-1], value._denominator), (9, 12))
+        self.assertEqual(str(value), "1/2 - 1/6x - 2/3x^2 + 3/4x^3 + 3/4x^4")
+        self.assertIsNone(value._coefficients)
+        coefficients = value.coefficients
+        self.assertIs(value.k, coefficients)
+        self.assertEqual(coefficients[1], rational(-1, 6))
+        self.assertEqual(
+            [field.name for field in dataclasses.fields(value)],
+            ["_numerators", "_denominator"],
+        )
+
+    def test_multiplication_algorithms_agree(self) -> None:
+        generator = random.Random(22)
+        for left_length, right_length, bits in (
+            (40, 40, 8),
+            (70, 33, 300),
+            (100, 5, 40),
+            (64, 64, 2000),
+        ):
+            left = [
+                generator.randrange(-(1 << bits), 1 << bits) for _ in range(left_length)
+            ]
+            right = [
+                generator.randrange(-(1 << bits), 1 << bits)
+                for _ in range(right_length)
+            ]
+            # Extreme digits exercise the borrow between Kronecker slots.
+            left[0], right[-1] = -(1 << bits), (1 << bits) - 1
+            expected = _schoolbook(left, right)
+            with self.subTest(lengths=(left_length, right_length), bits=bits):
+                self.assertEqual(_karatsuba(left, right), expected)
+                self.assertEqual(
+                    _kronecker(left, right, _coefficient_bits(left, right)), expected
+                )
+                self.assertEqual(_convolve(left, right), expected)
+
+    def test_mul_of_long_polynomials(self) -> None:
+        left = Polynomial(
+            *(rational((-1) ** k * (k + 1), k % 5 + 1) for k in range(50))
+        )
+        right = Polynomial(*(rational(k * k - 40, 3) for k in range(45)))
+        product = left * right
+        self.assertEqual(product.degree, 93)
+        self.assertEqual(divmod(product, right), (left, Polynomial()))
+        self.assertEqual(divmod(product, left), (right, Polynomial()))
+
+    def test_divmod_with_fractional_coefficients(self) -> None:
+        dividend = polynomial((1, 3), (-2, 5), (0, 1), (7, 2), (-1, 4))
+        for divisor in (
+            polynomial((3, 7), (-5, 2)),
+            polynomial((1, 1), (0, 1), (-2, 3)),
+            Polynomial(rational(-4, 9)),
+        ):
+            with self.subTest(divisor=str(divisor)):
+                quotient, remainder = divmod(dividend, divisor)
+                self.assertLess(remainder.degree, divisor.degree)
+                self.assertEqual(quotient * divisor + remainder, dividend)
+
+    def test_floordiv_and_mod_match_divmod(self) -> None:
+        generator = random.Random(23)
+        for dividend_degree, divisor_degree in ((9, 4), (30, 12), (12, 0), (7, 7)):
+            dividend = polynomial(
+                *(
+                    (generator.randrange(-50, 50), generator.randrange(1, 9))
+                    for _ in range(dividend_degree + 1)
+                ),
+                (1, 1),
+            )
+            # A non-primitive divisor with a negative leading coefficient.
+            divisor = polynomial(
+                *((6 * generator.randrange(-50, 50), 5) for _ in range(divisor_degree)),
+                (-12, 5),
+            )
+            with self.subTest(degrees=(dividend_degree, divisor_degree)):
+                quotient, remainder = divmod(dividend, divisor)
+                self.assertEqual(quotient * divisor + remainder, dividend)
+                self.assertLess(remainder.degree, divisor.degree)
+                self.assertEqual(dividend // divisor, quotient)
+                self.assertEqual(dividend % divisor, remainder)
+
+    def test_sturm_sequences_of_high_degree_stay_practical(self) -> None:
+        value = polynomial((1, 1), (0, 1), (1, 1))
+        for i in range(1, 21):
+            value = value * polynomial((-i, 3), (1, 1))
+        self.assertEqual(count_real_roots(value, rational(0, 1), rational(8, 1)), 20)
+        self.assertEqual(count_real_roots(value, rational(1, 2), rational(5, 2)), 6)
+
+    def test_gcd_matches_euclid(self) -> None:
+        common = polynomial((-2, 3), (1, 1), (1, 1))
+        left = common * polynomial((3, 1), (0, 1), (-5, 2), (1, 1)) * common
+        right = common * polynomial((1, 2), (7, 1), (-3, 1))
+        for a, b in ((left, right), (right, left), (left, common), (left, left)):
+            expected, remainder = a, b
+            while remainder:
+                expected, remainder = remainder, expected % remainder
+            self.assertEqual(a.gcd(b), expected.monic())
+        self.assertEqual(left.gcd(Polynomial()), left.monic())
+        self.assertEqual(Polynomial().gcd(Polynomial()), Polynomial())
+        self.assertEqual(
+            left.square_free(),
+            (common * polynomial((3, 1), (0, 1), (-5, 2), (1, 1))).monic(),
+        )
+
+    def test_subresultant_sturm_sequence(self) -> None:
+        value = polynomial((1, 1), (0, 1), (1, 1))
+        for i in range(1, 16):
+            value = value * polynomial((-i, 4), (1, 1))
+        repeated = value * polynomial((-3, 2), (1, 1)) ** natural_number(2)
+        for sample in (value, repeated):
+            sequence = subresultant_sturm_sequence(sample)
+            classic = sturm_sequence(sample)
+            # Integer coefficients whose size grows at most linearly per step.
+            self.assertTrue(all(item._denominator == 1 for item in sequence))
+            self.assertLess(
+                max(abs(n).bit_length() for item in sequence for n in item._numerators),
+                1_000,
+            )
+            points = [rational(k, 7) for k in range(-5, 36) if k % 7]
+            for lower, upper in zip(points, points[1:]):
+                self.assertEqual(
+                    sign_variations(sequence, lower) - sign_variations(sequence, upper),
+                    sign_variations(classic, lower) - sign_variations(classic, upper),
+                )
+        self.assertEqual(count_real_roots(repeated, rational(0, 1), rational(5, 1)), 15)
+        with self.assertRaises(ValueError):
+            subresultant_sturm_sequence(Polynomial(rational(3, 1)))
+
+    def test_constructor_reduces_large_coefficients_with_python_ints(self) -> None:
+        big = 10**30 + 7
+        value = polynomial((2 * big, 4), (-6, 3 * big), (0, 1), (0, 5))
+        self.assertIsNone(value._coefficients)
+        self.assertEqual(value.degree, 1)
+        self.assertEqual(value._denominator, 2 * big)
+        self.assertEqual(value._numerators, (big * big, -4))
+        self.assertEqual(value.coefficients[0], rational(big, 2))
+
     def test_len_trailing_zero(self) -> None:
         self.assertEqual(len(Polynomial(rational(1, 1), rational(0, 1))), 1)
 
@@ -58,6 +241,40 @@ class TestPolynomial(unittest.TestCase):
             Polynomial(rational(1, 1), rational(3, 1), rational(1, 1)),
         )
 
+    def test_compare(self) -> None:
+        low = Polynomial(rational(5, 1), rational(-1, 2))
+        high = Polynomial(rational(-5, 1), rational(1, 2))
+        quadratic = Polynomial(rational(0, 1), rational(0, 1), rational(-1, 1))
+        self.assertEqual(low.compare(high), -1)
+        self.assertEqual(high.compare(low), 1)
+        self.assertEqual(low.compare(low), 0)
+        self.assertEqual(quadratic.compare(high), 1)
+        self.assertGreater(high, low)
+        self.assertGreaterEqual(quadratic, high)
+
+    def test_pow_matches_repeated_multiplication(self) -> None:
+        bases = (
+            polynomial((1, 1), (1, 1)),
+            polynomial((0, 1), (-2, 3), (0, 1), (1, 1)),
+            polynomial((1, 2), (-1, 1), (2, 1), (1, 1)),
+            Polynomial(rational(5, 7)),
+            Polynomial(),
+        )
+        for base in bases:
+            expected = Polynomial(rational(1, 1))
+            for exponent in range(7):
+                self.assertEqual(base ** natural_number(exponent), expected)
+                expected = expected * base
+
+    def test_pow_of_sparse_bases(self) -> None:
+        power = polynomial((1, 1), (1, 1)) ** natural_number(20)
+        self.assertEqual(
+            power.coefficients, tuple(rational(comb(20, k), 1) for k in range(21))
+        )
+        power = polynomial((1, 1), (0, 1), (0, 1), (-1, 1)) ** natural_number(20)
+        self.assertEqual(power.degree, 60)
+        self.assertEqual(power.coefficients[3], rational(-20, 1))
+
     def test_int_constant(self) -> None:
         self.assertEqual(int(Polynomial(rational(3, 1))), 3)
 
@@ -79,5 +296,56 @@ class TestPolynomial(unittest.TestCase):
         self.assertNotEqual(Polynomial(rational(1, 1)), "1")
 
 
+class TestPolynomialCache(unittest.TestCase):
+    def setUp(self) -> None:
+        config_polynomial_cache()
+        self.addCleanup(config_polynomial_cache)
+
+    def test_derived_objects_are_reused_for_equal_values(self) -> None:
+        value = polynomial((-1, 1), (-1, 1), (1, 1), (1, 1))
+        derived = (
+            sturm_sequence(value),
+            value.square_free(),
+            value.derivative(),
+            value.monic(),
+        )
+        before = polynomial_cache_stats()
+        rebuilt = polynomial((-2, 2), (-1, 1), (1, 1), (1, 1))
+        self.assertIs(sturm_sequence(rebuilt), derived[0])
+        self.assertIs(rebuilt.square_free(), derived[1])
+        self.assertIs(rebuilt.derivative(), derived[2])
+        self.assertIs(rebuilt.monic(), derived[3])
+        after = polynomial_cache_stats()
+        self.assertEqual(after.hits - before.hits, 4)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        config_polynomial_cache(max_size=2)
+        first, second, third = (polynomial((k, 1), (1, 1)) for k in range(3))
+        derivative = first.derivative()
+        second.derivative()
+        first.derivative()
+        third.derivative()
+        self.assertEqual(polynomial_cache_stats().size, 2)
+        self.assertIs(first.derivative(), derivative)
+        misses = polynomial_cache_stats().misses
+        second.derivative()
+        self.assertEqual(polynomial_cache_stats().misses, misses + 1)
+        with self.assertRaises(ValueError):
+            config_polynomial_cache(max_size=0)
+
+    def test_cache_can_be_cleared_and_disabled(self) -> None:
+        value = polynomial((1, 3), (2, 1), (1, 1))
+        value.monic()
+        clear_polynomial_cache()
+        stats = polynomial_cache_stats()
+        self.assertEqual((stats.size, stats.hits, stats.misses), (0, 0, 0))
+        self.assertEqual(stats.max_size, 1 << 10)
+        config_polynomial_cache(enabled=False)
+        self.assertEqual(value.monic(), value.monic())
+        self.assertIsNot(value.monic(), value.monic())
+        self.assertEqual(polynomial_cache_stats().size, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,19 @@
 import unittest
+from fractions import Fraction
+from itertools import islice
+from math import gcd
 
 from peano.integer import integer
 from peano.natural_number import natural_number
-from peano.rational import Rational, rational
+from peano.rational import (
+    CalkinWilf,
+    ExpansionDigit,
+    Rational,
+    auto_reduction_stats,
+    config_auto_reduction,
+    rational,
+    simplest_between,
+)
 
 
 def normalize_fraction(p: int, q: int) -> tuple[int, int]:
@@ -40,7 +51,6 @@ class TestRational(unittest.TestCase):
                             rational(i, j) * rational(k, m), rational(i * k, j * m)
                         )
 
-    @unittest.skip("too slow")
     def test_bigmul(self) -> None:
         self.assertEqual(rational(9, 2) * rational(9, 2), rational(9 * 9, 2 * 2))
 
@@ -70,6 +80,41 @@ class TestRational(unittest.TestCase):
                             rational(i, j) < rational(k, m), (pi * qk) < (pk * qi)
                         )
 
+    def test_compare(self) -> None:
+        for i in range(-2, 3):
+            for j in (-2, -1, 1, 3):
+                for k in range(-2, 3):
+                    for m in (-3, -1, 2):
+                        expected = Fraction(i, j) - Fraction(k, m)
+                        self.assertEqual(
+                            rational(i, j).compare(rational(k, m)),
+                            (expected > 0) - (expected < 0),
+                        )
+                        self.assertEqual(rational(i, j) > rational(k, m), expected > 0)
+
+    def test_compare_reads_continued_fractions_in_lockstep(self) -> None:
+        # Neighbouring convergents share long expansions before they differ.
+        fibonacci = [1, 1]
+        while len(fibonacci) < 30:
+            fibonacci.append(fibonacci[-1] + fibonacci[-2])
+        values = [(fibonacci[k + 1], fibonacci[k]) for k in range(28)]
+        values += [(p, -q) for p, q in values] + [(6, 4), (-9, -6), (0, 5)]
+        for p, q in values:
+            for r, s in values:
+                expected = Fraction(p, q) - Fraction(r, s)
+                self.assertEqual(
+                    rational(p, q).compare(rational(r, s)),
+                    (expected > 0) - (expected < 0),
+                )
+
+    def test_sorting_uses_the_value_order(self) -> None:
+        pairs = [(3, -4), (1, 2), (-5, -3), (0, 7), (2, -1), (4, 6)]
+        values = sorted(rational(p, q) for p, q in pairs)
+        self.assertEqual(
+            [Fraction(int(value.p), int(value.q)) for value in values],
+            sorted(Fraction(p, q) for p, q in pairs),
+        )
+
     def test_sub(self) -> None:
         for i in range(-2, 2):
             for j in range(-2, 2):
@@ -117,6 +162,132 @@ class TestRational(unittest.TestCase):
         self.assertEqual(product.reduction(), rational(16, 9))
         self.assertEqual(hash(product), hash(rational(16, 9)))
 
+    def test_reduction_and_hash_are_cached(self) -> None:
+        value = rational(6, -4)
+        reduced = value.reduction()
+        self.assertEqual(str(reduced), "-3/2")
+        self.assertIs(value.reduction(), reduced)
+        self.assertIs(reduced.reduction(), reduced)
+        self.assertEqual(hash(value), hash(reduced))
+        canonical = rational(-3, 2)
+        self.assertIs(canonical.reduction(), canonical)
+        self.assertEqual(len({value, reduced, canonical}), 1)
+
+    def test_auto_reduction_is_off_by_default(self) -> None:
+        self.addCleanup(config_auto_reduction)
+        config_auto_reduction()
+        self.assertEqual(str(rational(1, 2) + rational(1, 2)), "4/4")
+        stats = auto_reduction_stats()
+        self.assertEqual(
+            (stats.mode, stats.operations, stats.reductions), ("never", 1, 0)
+        )
+
+    def test_auto_reduction_by_size(self) -> None:
+        self.addCleanup(config_auto_reduction)
+        config_auto_reduction("size", 8)
+        self.assertEqual(str(rational(1, 2) * rational(2, 3)), "2/6")
+        self.assertEqual(str(rational(3, 4) * rational(2, 3)), "1/2")
+        stats = auto_reduction_stats()
+        self.assertEqual((stats.operations, stats.reductions), (2, 1))
+
+    def test_auto_reduction_every_k_operations(self) -> None:
+        self.addCleanup(config_auto_reduction)
+        config_auto_reduction("every", 3)
+        total = rational(0, 1)
+        for _ in range(6):
+            total = total + rational(1, 6)
+        self.assertEqual(str(total), "1/1")
+        self.assertEqual(auto_reduction_stats().reductions, 2)
+
+    def test_auto_reduction_is_validated(self) -> None:
+        self.addCleanup(config_auto_reduction)
+        with self.assertRaises(ValueError):
+            config_auto_reduction("size")
+        with self.assertRaises(ValueError):
+            config_auto_reduction("every", 0)
+        with self.assertRaises(ValueError):
+            config_auto_reduction("never", 3)
+        with self.assertRaises(ValueError):
+            config_auto_reduction("sometimes", 3)  # ty: ignore[invalid-argument-type]
+
+    def test_digits_of_terminating_expansions(self) -> None:
+        self.assertEqual(
+            list(rational(3, 8).digits()),
+            [
+                ExpansionDigit(0, 0, False, None),
+                ExpansionDigit(1, 3, False, None),
+                ExpansionDigit(2, 7, False, None),
+                ExpansionDigit(3, 5, False, None),
+            ],
+        )
+        self.assertEqual([d.value for d in rational(3, 8).digits(2)], [0, 0, 1, 1])
+        self.assertEqual([d.value for d in rational(12, 4).digits()], [3])
+
+    def test_digits_report_the_repeating_cycle(self) -> None:
+        digits = list(islice(rational(1, 7).digits(), 9))
+        self.assertEqual([d.value for d in digits], [0, 1, 4, 2, 8, 5, 7, 1, 4])
+        self.assertTrue(all(d.repeating for d in digits[1:]))
+        self.assertEqual([d.period for d in digits], [None] * 6 + [6] * 3)
+
+        digits = list(islice(rational(1, 12).digits(), 5))
+        self.assertEqual([d.value for d in digits], [0, 0, 8, 3, 3])
+        self.assertEqual([d.repeating for d in digits], [False] * 3 + [True] * 2)
+        self.assertEqual(digits[-1].period, 1)
+
+    def test_digits_of_negative_values_floor_the_integer_part(self) -> None:
+        digits = list(islice(rational(-7, 3).digits(), 3))
+        self.assertEqual([d.value for d in digits], [-3, 6, 6])
+
+    def test_digits_are_produced_lazily(self) -> None:
+        last = None
+        for last in islice(rational(1, 97).digits(), 100_001):
+            pass
+        assert last is not None
+        self.assertEqual((last.position, last.period), (100_000, 96))
+
+    def test_digits_base_is_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            next(rational(1, 3).digits(1))
+        with self.assertRaises(TypeError):
+            next(rational(1, 3).digits(2.0))  # ty: ignore[invalid-argument-type]
+
+    def test_limit_denominator_matches_fractions(self) -> None:
+        for p, q, bound in (
+            (355, 113, 100),
+            (-314159, 100000, 1000),
+            (3, 7, 7),
+            (1, 3, 2),
+        ):
+            with self.subTest(value=(p, q), bound=bound):
+                expected = Fraction(p, q).limit_denominator(bound)
+                self.assertEqual(
+                    rational(p, q).limit_denominator(bound).as_integer_ratio(),
+                    (expected.numerator, expected.denominator),
+                )
+        with self.assertRaises(ValueError):
+            rational(1, 3).limit_denominator(0)
+
+    def test_simplest_between(self) -> None:
+        cases = {
+            ((1, 3), (1, 2)): (1, 2),
+            ((3, 10), (2, 5)): (1, 3),
+            ((-7, 5), (-4, 3)): (-4, 3),
+            ((-1, 2), (1, 3)): (0, 1),
+            ((22, 7), (22, 7)): (22, 7),
+            ((31, 10), (33, 10)): (13, 4),
+            ((5, 2), (7, 2)): (3, 1),
+        }
+        for (lower, upper), expected in cases.items():
+            with self.subTest(lower=lower, upper=upper):
+                self.assertEqual(
+                    simplest_between(
+                        rational(*lower), rational(*upper)
+                    ).as_integer_ratio(),
+                    expected,
+                )
+        with self.assertRaises(ValueError):
+            simplest_between(rational(1, 2), rational(1, 3))
+
     def test_str(self) -> None:
         for i in range(-5, 5):
             for j in range(-5, 5):
@@ -134,6 +305,13 @@ class TestRational(unittest.TestCase):
                         rational(i, j) ** natural_number(k), rational(i**k, j**k)
                     )
 
+    def test_pow_by_squaring(self) -> None:
+        for exponent in (13, 16):
+            self.assertEqual(
+                rational(-2, 3) ** natural_number(exponent),
+                rational((-2) ** exponent, 3**exponent),
+            )
+
     def test_pos(self) -> None:
         for i in range(5):
             for j in range(5):
@@ -155,3 +333,55 @@ class TestRational(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestCalkinWilf(unittest.TestCase):
+    def test_sequence_starts_with_the_tree_levels(self) -> None:
+        self.assertEqual(
+            [str(value) for value in islice(CalkinWilf(), 7)],
+            ["1/1", "1/2", "2/1", "1/3", "3/2", "2/3", "3/1"],
+        )
+
+    def test_every_positive_rational_appears_once_reduced(self) -> None:
+        ratios = list(islice(CalkinWilf().ratios(), 2**12 - 1))
+        self.assertEqual(len(set(ratios)), len(ratios))
+        self.assertTrue(all(gcd(p, q) == 1 for p, q in ratios))
+        expected = {(p, q) for p in range(1, 13) for q in range(1, 13 - p + 1)}
+        self.assertLessEqual(
+            {(p, q) for p, q in expected if gcd(p, q) == 1}, set(ratios)
+        )
+
+    def test_nth_and_index_of_agree_with_iteration(self) -> None:
+        sequence = CalkinWilf()
+        for index, (p, q) in enumerate(islice(sequence.ratios(), 500)):
+            with self.subTest(index=index):
+                self.assertEqual(sequence.nth(index).as_integer_ratio(), (p, q))
+                self.assertEqual(sequence.index_of(rational(p, q)), index)
+
+    def test_jumps_to_distant_positions(self) -> None:
+        sequence = CalkinWilf()
+        index = 3**200
+        value = sequence.nth(index)
+        self.assertEqual(sequence.index_of(value), index)
+        self.assertEqual(sequence.index_of(rational(1, 100)), 2**99 - 1)
+        self.assertEqual(sequence.index_of(rational(100, 1)), 2**100 - 2)
+
+    def test_views_start_at_an_offset(self) -> None:
+        view = CalkinWilf(5)
+        self.assertEqual(
+            [str(value) for value in islice(view, 3)], ["2/3", "3/1", "1/4"]
+        )
+        self.assertEqual(view.nth(1), rational(3, 1))
+        self.assertEqual(view.index_of(rational(6, 2)), 1)
+        with self.assertRaises(ValueError):
+            view.index_of(rational(1, 2))
+
+    def test_invalid_arguments_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            CalkinWilf(-1)
+        with self.assertRaises(TypeError):
+            CalkinWilf().nth(True)
+        with self.assertRaises(ValueError):
+            CalkinWilf().index_of(rational(-1, 2))
+        with self.assertRaises(ValueError):
+            CalkinWilf().index_of(rational(0, 1))
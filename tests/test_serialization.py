@@ -0,0 +1,88 @@
+import copy
+import pickle
+import unittest
+
+from peano import (
+    Integer,
+    NaturalNumber,
+    binary_natural,
+    integer,
+    natural_number,
+    polynomial,
+    rational,
+)
+from peano.serialization import MAGIC, VERSION, dumps, loads
+
+DEEP = 10**6
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = (
+            natural_number(0),
+            natural_number(DEEP),
+            binary_natural(2**70 + 3),
+            integer(-DEEP),
+            Integer(natural_number(7), natural_number(5)),
+            rational(-1000, 3),
+            polynomial((1, 2), (-1000, 1), (0, 1), (3, 7)),
+        )
+
+    def test_round_trip_preserves_values_and_types(self) -> None:
+        for value in self.values:
+            with self.subTest(value=value):
+                loaded = loads(dumps(value))
+                self.assertIs(type(loaded), type(value))
+                self.assertEqual(loaded, value)
+
+    def test_representatives_are_preserved(self) -> None:
+        value = loads(dumps(Integer(natural_number(7), natural_number(5))))
+        assert isinstance(value, Integer)
+        self.assertEqual((int(value.a), int(value.b)), (7, 5))
+
+    def test_encoding_is_compact(self) -> None:
+        self.assertLess(len(dumps(natural_number(DEEP))), 16)
+
+    def test_invalid_data_is_rejected(self) -> None:
+        data = dumps(natural_number(3))
+        with self.assertRaises(ValueError):
+            loads(b"NOPE" + data)
+        with self.assertRaises(ValueError):
+            loads(MAGIC + bytes((VERSION + 1,)) + data[len(MAGIC) + 1 :])
+        with self.assertRaises(ValueError):
+            loads(data[:-1])
+        with self.assertRaises(ValueError):
+            loads(data + b"\x00")
+        with self.assertRaises(TypeError):
+            dumps(3)  # ty: ignore[invalid-argument-type]
+
+    def test_pickle_and_deepcopy_do_not_recurse_per_successor(self) -> None:
+        for value in self.values:
+            with self.subTest(value=value):
+                self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+                self.assertEqual(copy.deepcopy(value), value)
+        self.assertLess(len(pickle.dumps(natural_number(DEEP))), 100)
+
+    def test_polynomials_round_trip_without_building_coefficients(self) -> None:
+        value = polynomial((10**30 + 1, 3), (-2, 10**20), (5, 1))
+        for loaded in (loads(dumps(value)), pickle.loads(pickle.dumps(value))):
+            with self.subTest(loaded=loaded):
+                self.assertEqual(loaded, value)
+                self.assertIsNone(loaded._coefficients)
+        self.assertIsNone(value._coefficients)
+        # The bytes match the coefficient-by-coefficient encoding.
+        self.assertEqual(
+            dumps(value),
+            MAGIC
+            + bytes((VERSION, ord("P"), 3))
+            + b"".join(dumps(c)[len(MAGIC) + 2 :] for c in value.coefficients),
+        )
+
+    def test_loaded_chains_expand_lazily(self) -> None:
+        loaded = pickle.loads(pickle.dumps(natural_number(DEEP)))
+        assert isinstance(loaded, NaturalNumber)
+        self.assertEqual(int(loaded.pre), DEEP - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
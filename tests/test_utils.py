@@ -6,7 +6,15 @@ from inspect import signature
 from typing import get_type_hints
 
 import peano.utils as peano_utils
-from peano import N_ONE, NaturalNumber, natural_number
+from peano import (
+    N_ONE,
+    Integer,
+    NaturalNumber,
+    gcd,
+    integer,
+    natural_number,
+    rational,
+)
 from peano.utils import SUPPORTED_LOCALES, LogMessage, config_log, log, logger
 
 
@@ -56,6 +64,13 @@ class TestLogging(unittest.TestCase):
             ],
         )
 
+    def test_traced_deep_operands_do_not_exhaust_the_call_stack(self) -> None:
+        n = natural_number(2000)
+        with redirect_stderr(io.StringIO()):
+            config_log(log_level=1, max_lines=1)
+            self.assertTrue(n == natural_number(2000))
+            self.assertEqual(int(n + n), 4000)
+
     def test_equality_trace_names_axiom_cases(self) -> None:
         own_stream = io.StringIO()
         with redirect_stderr(own_stream):
@@ -70,6 +85,119 @@ class TestLogging(unittest.TestCase):
             ],
         )
 
+    def test_greater_than_walks_the_chains_once(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=2)
+            natural_number(2) > natural_number(1)
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "compare(<N(1)>, <N(0)>) = 1",
+                "compare(<N(2)>, <N(1)>) = compare(<N(1)>, <N(0)>)",
+            ],
+        )
+
+    def test_multiplication_trace_follows_the_recursive_rule(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=5)
+            natural_number(2) * natural_number(2)
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "[multiplication: base] mul(S(S(0)), 0) -> 0",
+                "[multiplication: recursive] mul(S(S(0)), S(0)) -> "
+                "add(S(S(0)), mul(S(S(0)), 0))",
+                "[multiplication: recursive] mul(S(S(0)), S(S(0))) -> "
+                "add(S(S(0)), mul(S(S(0)), S(0)))",
+            ],
+        )
+
+    def test_power_trace_squares_along_the_binary_digits(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=6)
+            natural_number(2) ** natural_number(5)
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "[power: base] <N(2)> ** <N(0)> -> <N(1)>",
+                "[power: odd exponent] <N(2)> ** <N(1)> -> "
+                "(<N(2)> ** <N(0)>)² * <N(2)>",
+                "[power: even exponent] <N(2)> ** <N(2)> -> (<N(2)> ** <N(1)>)²",
+                "[power: odd exponent] <N(2)> ** <N(5)> -> "
+                "(<N(2)> ** <N(2)>)² * <N(2)>",
+            ],
+        )
+
+    def test_comparison_traces_name_the_path_that_ran(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=22)
+            rational(7, 2).compare(rational(-1, 3))
+            rational(7, 2).compare(rational(5, 3))
+            rational(7, 2).compare(rational(-10, -3))
+            config_log(log_level=12)
+            Integer(natural_number(5), natural_number(2)).compare(integer(4))
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "compare(<Q(7/2)>, <Q(-1/3)>) = compare(sign(<Q(7/2)>), "
+                "sign(<Q(-1/3)>)) = compare(1, -1) = 1",
+                "compare(<Q(7/2)>, <Q(5/3)>) = 1 · compare([3], [1]) = 1",
+                "compare(<Q(7/2)>, <Q(-10/-3)>) = 1 · compare([3; 2], [3; 3]) = 1",
+                "compare(<Z(5,2)>, <Z(4,0)>) = "
+                "compare(<N(5)> - <N(4)>, <N(2)> - <N(0)>) = -1",
+            ],
+        )
+
+    def test_gcd_trace_names_the_binary_steps(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=13)
+            gcd(integer(6), integer(-4))
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "[gcd: both even] gcd(<N(6)>, <N(4)>) -> 2·gcd(<N(3)>, <N(2)>)",
+                "[gcd: one even] gcd(<N(3)>, <N(2)>) -> gcd(<N(3)>, <N(1)>)",
+                "[gcd: both odd] gcd(<N(3)>, <N(1)>) -> gcd(<N(2)>, <N(1)>)",
+                "[gcd: one even] gcd(<N(2)>, <N(1)>) -> gcd(<N(1)>, <N(1)>)",
+                "[gcd: both odd] gcd(<N(1)>, <N(1)>) -> gcd(<N(0)>, <N(1)>)",
+                "[gcd: zero case] gcd(<N(0)>, <N(1)>) -> <N(1)>",
+            ],
+        )
+
+        # Integer multiplication traces at level 15 leave the gcd steps out.
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=15)
+            gcd(integer(6), integer(-4))
+        self.assertEqual(own_stream.getvalue(), "")
+
+    def test_division_trace_shows_the_doubling_shortcut(self) -> None:
+        own_stream = io.StringIO()
+        with redirect_stderr(own_stream):
+            config_log(log_level=5)
+            natural_number(7) // natural_number(3)
+
+        self.assertEqual(
+            own_stream.getvalue().splitlines(),
+            [
+                "[division: base] divmod(<N(7)>, <N(12)>) -> (<N(0)>, <N(7)>)",
+                "[division: doubling] divmod(<N(7)>, <N(6)>) -> "
+                "(2·<N(0)> + <N(1)>, <N(7)> - <N(6)>) from divmod(<N(7)>, <N(12)>)",
+                "[division: doubling] divmod(<N(7)>, <N(3)>) -> "
+                "(2·<N(1)>, <N(1)>) from divmod(<N(7)>, <N(6)>)",
+            ],
+        )
+
     def test_log_level_can_be_shown_with_an_explicit_format(self) -> None:
         own_stream = io.StringIO()
         with redirect_stderr(own_stream):